@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import typing as t
+
+__all__ = ('CacheBackend', 'LRUCache', 'TTLCache', 'WeakValueCache', 'NullCache')
+
+KT = t.TypeVar('KT')
+VT = t.TypeVar('VT')
+
+
+class CacheBackend(t.MutableMapping[KT, VT]):
+    hits: int
+    misses: int
+    evictions: int
+    on_evict: t.Callable[[KT, VT], t.Any] | None
+
+    def __init__(self) -> None: ...
+
+    def __getitem__(self, key: KT) -> VT: ...
+
+    def __setitem__(self, key: KT, value: VT) -> None: ...
+
+    def __delitem__(self, key: KT) -> None: ...
+
+    def __iter__(self) -> t.Iterator[KT]: ...
+
+    def __len__(self) -> int: ...
+
+    def stats(self) -> dict[str, int]: ...
+
+
+class LRUCache(CacheBackend[KT, VT]):
+    maxsize: int
+
+    def __init__(self, maxsize: int = ...) -> None: ...
+
+
+class TTLCache(CacheBackend[KT, VT]):
+    ttl: float
+    maxsize: int | None
+
+    def __init__(self, ttl: float, maxsize: int | None = ...) -> None: ...
+
+    def expire(self) -> None: ...
+
+
+class WeakValueCache(CacheBackend[KT, VT]):
+    ...
+
+
+class NullCache(CacheBackend[KT, VT]):
+    ...
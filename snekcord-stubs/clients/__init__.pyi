@@ -1,3 +1,5 @@
+from .chunker import *
 from .client import *
 from .wsclient import *
 from .wsevents import *
+from .cluster import *
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import typing as t
+
+from .wsclient import WebSocketClient
+from ..objects.guildobject import Guild
+from ..ws.shardws import Shard
+
+__all__ = ('ChunkScheduler',)
+
+CHUNK_ORDERS: dict[str, t.Callable[[Guild], t.Any]]
+
+
+class ChunkScheduler:
+    client: WebSocketClient
+    order: t.Callable[[Guild], t.Any]
+    concurrency: int
+    timeout: float | None
+    retries: int
+    progress: dict[int, dict[str, int]]
+
+    def __init__(self, *, client: WebSocketClient,
+                 order: str | t.Callable[[Guild], t.Any] = ...,
+                 concurrency: int = ..., timeout: float | None = ...,
+                 retries: int = ...) -> None: ...
+
+    def get_guilds(self, shard: Shard) -> list[Guild]: ...
+
+    def schedule(self, shard: Shard) -> None: ...
+
+    def resume(self, shard: Shard) -> None: ...
+
+    def cancel(self, shard: Shard) -> None: ...
+
+    def close(self) -> None: ...
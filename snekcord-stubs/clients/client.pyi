@@ -11,14 +11,21 @@ from .. import rest
 from .. import states
 from ..flags import CacheFlags
 from ..objects.emojiobject import GuildEmoji
+from ..objects.guildobject import Guild
 from ..objects.memberobject import GuildMember
-from ..typedefs import AnyCallable, AnyCoroCallable
+from ..typedefs import AnyCallable, AnyCoroCallable, Json
+from ..utils import JsonCodec
 
 __all__ = ('ClientClasses', 'Client',)
 
 T = t.TypeVar('T')
 P = ParamSpec('P')
 
+ListenerOverflowPolicy = t.Literal['block', 'drop_oldest', 'drop_newest']
+ListenerErrorHook = t.Callable[['_EventListener', Exception], t.Any]
+
+LISTENER_OVERFLOW_POLICIES: tuple[str, ...]
+
 
 class _EventWaiter:
     name: str
@@ -36,6 +43,30 @@ class _EventWaiter:
     def __anext__(self) -> t.Any: ...
 
 
+class _EventListener:
+    name: str
+    client: Client
+    callback: AnyCallable
+    sync: bool
+    persistent: bool
+    concurrency: int
+    maxsize: int
+    overflow: ListenerOverflowPolicy
+    processed: int
+    dropped: int
+    failed: int
+
+    def __init__(self, name: str, client: Client, callback: AnyCallable, sync: bool,
+                 persistent: bool, *, concurrency: int | None = ...,
+                 maxsize: int | None = ...,
+                 overflow: ListenerOverflowPolicy | None = ...) -> None: ...
+
+    @property
+    def queue_depth(self) -> int: ...
+
+    def metrics(self) -> dict[str, int]: ...
+
+
 class _ClientClasses:
     GuildChannel: type[objects.GuildChannel]
     FollowedChannel: type[objects.FollowedChannel]
@@ -94,11 +125,33 @@ class Client:
     invites: states.InviteState
     stages: states.StageInstanceState
     users: states.UserState
+    json_codec: JsonCodec
+    message_cache_policy: states.MessageCachePolicy
+    cache_backends: dict[str, t.Callable[[], t.MutableMapping[t.Any, t.Any]]]
+    disabled_events: set[str]
+    listener_concurrency: int
+    listener_queue_size: int
+    listener_overflow: ListenerOverflowPolicy
+    error_hook: ListenerErrorHook | None
+    sync_concurrency: int
+    defer_sync: bool
     finalizing: bool
 
     def __init__(self, token: str,
                  loop: asyncio.AbstractEventLoop | None = ...,
-                 cache_flags: CacheFlags | None = ...) -> None: ...
+                 cache_flags: CacheFlags | None = ...,
+                 json_codec: JsonCodec | None = ...,
+                 message_cache_policy: states.MessageCachePolicy | None = ...,
+                 cache_backends: dict[str, t.Callable[[], t.MutableMapping[t.Any, t.Any]]]
+                 | None = ...,
+                 disabled_events: t.Iterable[str] | None = ...,
+                 listener_concurrency: int = ...,
+                 listener_queue_size: int = ...,
+                 listener_overflow: ListenerOverflowPolicy = ...,
+                 error_hook: ListenerErrorHook | None = ...,
+                 sync_concurrency: int = ...,
+                 defer_sync: bool = ...,
+                 rest_options: dict[str, t.Any] | None = ...) -> None: ...
 
     @classmethod
     def add_handled_signal(cls, signo: signal.Signals) -> None: ...
@@ -110,7 +163,9 @@ class Client:
     def emojis(self) -> t.Generator[GuildEmoji, None, None]: ...
 
     def register_listener(self, name: str, callback: AnyCallable, *,
-                          persistent: bool = ...) -> None: ...
+                          sync: bool = ..., persistent: bool = ...,
+                          concurrency: int | None = ..., maxsize: int | None = ...,
+                          overflow: ListenerOverflowPolicy | None = ...) -> _EventListener: ...
 
     def remove_listener(self, name: str, callback: AnyCallable) -> None: ...
 
@@ -122,14 +177,32 @@ class Client:
 
     def run_callbacks(self, name: str, *args: t.Any) -> None: ...
 
+    def has_callbacks(self, name: str) -> bool: ...
+
     async def dispatch(self, name: str, *args: t.Any) -> None: ...
 
-    def on(self, name: str | None = ...) -> t.Callable[[t.Callable[P, T]],
-                                                       t.Callable[P, T]]: ...
+    def listener_metrics(self) -> dict[str, list[dict[str, int]]]: ...
+
+    def handle_listener_error(self, listener: _EventListener, exc: Exception) -> None: ...
+
+    def on(self, name: str | None = ..., *, sync: bool = ...,
+           concurrency: int | None = ..., maxsize: int | None = ...,
+           overflow: ListenerOverflowPolicy | None = ...
+           ) -> t.Callable[[t.Callable[P, T]], t.Callable[P, T]]: ...
 
     def once(self, name: str | None = ...) -> t.Callable[[t.Callable[P, T]],
                                                          t.Callable[P, T]]: ...
 
+    async def sync_guild(self, guild: Guild, payload: Json) -> None: ...
+
+    async def wait_synced(self) -> None: ...
+
+    async def save_snapshot(self, path: str) -> None: ...
+
+    def save_snapshot_sync(self, path: str) -> None: ...
+
+    def load_snapshot(self, path: str) -> dict[str, t.Any]: ...
+
     async def close(self) -> None: ...
 
     async def finalize(self) -> None: ...
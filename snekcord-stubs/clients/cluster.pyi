@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import typing as t
+
+from .wsclient import WebSocketClient
+from ..typedefs import Json, SnowflakeConvertible
+from ..ws.shardws import IdentifyScheduler
+
+__all__ = ('ClusterConnection', 'RemoteIdentifyScheduler', 'ClusterWorker', 'ClusterCoordinator')
+
+ClusterHandler = t.Callable[['ClusterConnection', str, t.Any], t.Awaitable[t.Any]]
+
+
+class ClusterConnection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    handler: ClusterHandler
+    loop: asyncio.AbstractEventLoop
+    closed: asyncio.Future[None]
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 handler: ClusterHandler, *, loop: asyncio.AbstractEventLoop) -> None: ...
+
+    def start(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+    async def request(self, op: str, data: t.Any = ..., *,
+                      timeout: float | None = ...) -> t.Any: ...
+
+
+class RemoteIdentifyScheduler:
+    connection: ClusterConnection
+
+    def __init__(self, connection: ClusterConnection) -> None: ...
+
+    async def acquire(self, shard_id: int) -> None: ...
+
+
+class ClusterWorker:
+    loop: asyncio.AbstractEventLoop
+    token: str
+    cluster_id: int
+    shard_ids: list[int]
+    shard_count: int
+    host: str
+    port: int
+    secret: str
+    gateway_url: str | None
+    client_class: type[WebSocketClient]
+    client_kwargs: dict[str, t.Any]
+    client: WebSocketClient | None
+    connection: ClusterConnection | None
+    handlers: dict[str, t.Callable[[t.Any], t.Any]]
+
+    def __init__(self, token: str, *, cluster_id: int, shard_ids: list[int],
+                 shard_count: int, host: str, port: int, secret: str,
+                 loop: asyncio.AbstractEventLoop | None = ...,
+                 gateway_url: str | None = ...,
+                 client_class: type[WebSocketClient] = ...,
+                 client_kwargs: dict[str, t.Any] | None = ...) -> None: ...
+
+    def register_handler(self, op: str, handler: t.Callable[[t.Any], t.Any]) -> None: ...
+
+    async def request_cluster(self, cluster_id: int, op: str, data: t.Any = ..., *,
+                              timeout: float | None = ...) -> t.Any: ...
+
+    async def fetch_guild(self, guild: SnowflakeConvertible, *,
+                          timeout: float | None = ...) -> Json | None: ...
+
+    async def start(self) -> None: ...
+
+
+class ClusterCoordinator:
+    loop: asyncio.AbstractEventLoop
+    token: str
+    shard_count: int
+    cluster_count: int
+    host: str
+    port: int
+    gateway_url: str | None
+    session_start_limit: Json | None
+    client_class: type[WebSocketClient]
+    client_kwargs: dict[str, t.Any]
+    health_check_interval: float
+    health_check_timeout: float
+    startup_timeout: float
+    secret: str
+    identify_scheduler: IdentifyScheduler | None
+    processes: dict[int, multiprocessing.Process]
+    spawned_at: dict[int, float]
+    connections: dict[int, ClusterConnection]
+    health: dict[int, Json]
+
+    def __init__(self, token: str, *, shard_count: int, cluster_count: int,
+                 loop: asyncio.AbstractEventLoop | None = ...,
+                 host: str = ..., port: int = ...,
+                 gateway_url: str | None = ...,
+                 session_start_limit: Json | None = ...,
+                 client_class: type[WebSocketClient] = ...,
+                 client_kwargs: dict[str, t.Any] | None = ...,
+                 health_check_interval: float = ...,
+                 health_check_timeout: float = ...,
+                 startup_timeout: float = ...,
+                 secret: str | None = ...) -> None: ...
+
+    def get_shard_ids(self, cluster_id: int) -> list[int]: ...
+
+    def get_cluster_id(self, shard_id: int) -> int: ...
+
+    def get_guild_cluster_id(self, guild: SnowflakeConvertible) -> int: ...
+
+    async def request(self, cluster_id: int, op: str, data: t.Any = ..., *,
+                      timeout: float | None = ...) -> t.Any: ...
+
+    def spawn(self, cluster_id: int) -> multiprocessing.Process: ...
+
+    async def restart(self, cluster_id: int) -> multiprocessing.Process: ...
+
+    async def check_health(self, cluster_id: int) -> bool: ...
+
+    async def start(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+    def run_forever(self) -> None: ...
@@ -1,10 +1,17 @@
+from __future__ import annotations
+
 import typing as t
 
+from .chunker import ChunkScheduler
 from .client import Client
 from ..flags import WebSocketIntents
 from ..objects.userobject import User
-from ..typedefs import Json
-from ..ws.shardws import Shard
+from ..states.memberstate import MemberChunkRequest
+from ..typedefs import Json, SnowflakeConvertible
+from ..ws.shardws import IdentifyScheduler, Shard
+
+if t.TYPE_CHECKING:
+    from .cluster import ClusterWorker
 
 __all__ = ('WebSocketClient',)
 
@@ -13,8 +20,16 @@ class WebSocketClient(Client):
     shards: dict[int, Shard]
     shard_id: int
     shard_count: int
+    shard_ids: t.Iterable[int] | None
+    gateway_url: str | None
+    cluster: ClusterWorker | None
+    chunk_requests: dict[str, MemberChunkRequest]
+    chunk_scheduler: ChunkScheduler | None
     intents: WebSocketIntents | None
     timeouts: dict[str, float] | None
+    compress: bool
+    reconnect: bool
+    identify_scheduler: IdentifyScheduler | None
     shards: dict[int, Shard]
 
     def __init__(self, *args: t.Any, **kwargs: t.Any) -> None: ...
@@ -22,10 +37,19 @@ class WebSocketClient(Client):
     @property
     def user(self) -> User | None: ...
 
+    def create_chunk_nonce(self) -> str: ...
+
+    def request_members_chunked(self, guilds: t.Iterable[SnowflakeConvertible],
+                                **kwargs: t.Any) -> list[MemberChunkRequest]: ...
+
+    def get_shard_id(self, guild: SnowflakeConvertible) -> int: ...
+
     async def fetch_gateway(self) -> Json: ...
 
     async def fetch_gateway_bot(self) -> Json: ...
 
     async def connect(self, *args: t.Any, **kwrags: t.Any) -> None: ...
 
+    async def close(self, *, resumable: bool = ...) -> None: ...
+
     def run_forever(self) -> BaseException | None: ...
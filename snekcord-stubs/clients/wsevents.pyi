@@ -12,6 +12,7 @@ from ..objects.reactionsobject import Reactions
 from ..objects.roleobject import Role
 from ..objects.stageobject import StageInstance
 from ..objects.userobject import User
+from ..states.memberstate import MemberChunkRequest
 from ..typedefs import Json
 from ..ws.shardws import Shard
 
@@ -20,7 +21,7 @@ __all__ = ('ChannelCreateEvent', 'ChannelUpdateEvent', 'ChannelDeleteEvent',
            'GuildAvailableEvent', 'GuildJoinEvent', 'GuildUpdateEvent',
            'GuildUnavailableEvent', 'GuildDeleteEvent', 'GuildBanAddEvent',
            'GuildBanRemoveEvent', 'GuildEmojisUpdateEvent',
-           'GuildIntegrationsUpdateEvent', 'GuildMemberAddEvent',
+           'GuildIntegrationsUpdateEvent', 'GuildMemberAddEvent', 'GuildMembersChunkEvent',
            'GuildMemberUpdateEvent', 'GuildMemberRemoveEvent',
            'GuildRoleCreateEvent', 'GuildRoleUpdateEvent',
            'GuildRoleDeleteEvent', 'IntegrationCreateEvent',
@@ -50,6 +51,7 @@ class WebSocketEvents(t.TypedDict):
     GUILD_EMOJIS_UPDATE: type[GuildEmojisUpdateEvent]
     GUILD_INTEGRATIONS_UPDATE: type[GuildIntegrationsUpdateEvent]
     GUILD_MEMBER_ADD: type[GuildMemberAddEvent]
+    GUILD_MEMBERS_CHUNK: type[GuildMembersChunkEvent]
     GUILD_MEMBER_UPDATE: type[GuildMemberUpdateEvent]
     GUILD_MEMBER_REMOVE: type[GuildMemberRemoveEvent]
     GUILD_ROLE_CREATE: type[GuildRoleCreateEvent]
@@ -83,7 +85,8 @@ class BaseEvent():
     def __init__(self, **kwargs: t.Any) -> None: ...
 
     @classmethod
-    def execute(cls: type[T], client: WebSocketClient, shard: Shard, data: Json) -> T: ...
+    def execute(cls: type[T], client: WebSocketClient, shard: Shard, data: Json, *,
+                construct: bool = ...) -> T | None: ...
 
     @property
     def partial(self) -> bool: ...
@@ -95,6 +98,7 @@ class ChannelCreateEvent(BaseEvent):
 
 class ChannelUpdateEvent(BaseEvent):
     channel: DMChannel | GuildChannel
+    changes: dict[str, t.Any] | None
 
 
 class ChannelDeleteEvent(BaseEvent):
@@ -119,6 +123,7 @@ class GuildJoinEvent(BaseEvent):
 
 class GuildUpdateEvent(BaseEvent):
     guild: Guild
+    changes: dict[str, t.Any] | None
 
 
 class GuildUnavailableEvent(BaseEvent):
@@ -152,9 +157,18 @@ class GuildMemberAddEvent(BaseEvent):
     member: GuildMember | None
 
 
+class GuildMembersChunkEvent(BaseEvent):
+    guild: Guild | None
+    members: list[GuildMember]
+    chunk_index: int
+    chunk_count: int
+    request: MemberChunkRequest | None
+
+
 class GuildMemberUpdateEvent(BaseEvent):
     guild: Guild | None
     member: GuildMember | None
+    changes: dict[str, t.Any] | None
 
 
 class GuildMemberRemoveEvent(BaseEvent):
@@ -171,6 +185,7 @@ class GuildRoleCreateEvent(BaseEvent):
 class GuildRoleUpdateEvent(BaseEvent):
     guild: Guild | None
     role: Role | None
+    changes: dict[str, t.Any] | None
 
 
 class GuildRoleDeleteEvent(BaseEvent):
@@ -1,2 +1,6 @@
 class PartialObjectError(Exception):
     pass
+
+
+class ClusterError(Exception):
+    pass
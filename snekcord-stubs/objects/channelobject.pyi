@@ -7,6 +7,7 @@ from .baseobject import BaseObject
 from .guildobject import Guild
 from .messageobject import Message
 from ..enums import ChannelType
+from ..flags import Permissions
 from ..states.channelstate import ChannelState
 from ..states.messagestate import MessageState
 from ..states.overwritestate import PermissionOverwriteState
@@ -38,6 +39,8 @@ class GuildChannel(BaseObject[Snowflake]):
     @property
     def parent(self) -> CategoryChannel | None: ...
 
+    def permissions_for(self, member: SnowflakeConvertible) -> Permissions | None: ...
+
     async def modify(self: T, **kwargs: t.Any) -> T: ...
 
     async def delete(self) -> None: ...
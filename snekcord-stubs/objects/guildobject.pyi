@@ -78,6 +78,8 @@ class Guild(BaseObject[Snowflake]):
     vanity_url: GuildVanityURL
     welcome_screen: WelcomeScreen
 
+    PERMISSION_CACHE_SIZE: t.ClassVar[int]
+
     def __init__(self, *, state: GuildState) -> None: ...
 
     async def sync(self, payload: Json) -> None: ...
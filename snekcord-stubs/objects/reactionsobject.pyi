@@ -1,6 +1,45 @@
 from __future__ import annotations
 
+import typing as t
+
 from .baseobject import BaseObject
-from ..utils.json import JsonTemplate
+from .messageobject import Message
+from .userobject import User
+from ..states.basestate import BaseSubState, Paginator
+from ..typedefs import Json, SnowflakeConvertible
+from ..utils import JsonField, Snowflake
+
+__all__ = ('Reactions',)
+
+
+class Reactions(BaseSubState[Snowflake, User], BaseObject[Snowflake]):
+    id: t.ClassVar[JsonField[Snowflake]]
+    count: t.ClassVar[JsonField[int]]
+    me: t.ClassVar[JsonField[bool]]
+
+    emoji: t.Any
+
+    def __init__(self, *, state: t.Any) -> None: ...
+
+    def upsert(self, data: Json) -> User: ...
+
+    @property
+    def message(self) -> Message: ...
+
+    async def fetch_many(self, after: SnowflakeConvertible | None = ...,
+                         limit: int | None = ...) -> list[User]: ...
+
+    def iterate(self, *, after: SnowflakeConvertible | None = ...,
+                limit: int | None = ...,
+                page_size: int = ...,
+                cache: bool = ...) -> Paginator[User]: ...
+
+    async def add(self) -> None: ...
+
+    async def remove(self, user: SnowflakeConvertible) -> None: ...
+
+    async def remove_me(self) -> None: ...
+
+    async def remove_all(self) -> None: ...
 
-ReactionsTemplate: JsonTemplate = ...
+    def update(self, data: Json) -> None: ...
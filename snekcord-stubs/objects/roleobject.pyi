@@ -5,7 +5,8 @@ import typing as t
 from .baseobject import BaseObject
 from .guildobject import Guild
 from ..flags import Permissions
-from ..states.rolestate import RoleState
+from ..states.memberstate import GuildMemberState
+from ..states.rolestate import RoleMemberState, RoleState
 from ..utils import JsonField, JsonObject, Snowflake
 
 
@@ -38,4 +39,7 @@ class Role(BaseObject[Snowflake]):
     @property
     def mention(self) -> str: ...
 
+    @property
+    def members(self) -> RoleMemberState | GuildMemberState: ...
+
     async def modify(self, **kwargs: t.Any) -> Role: ...
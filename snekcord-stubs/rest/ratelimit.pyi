@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import asyncio
+import typing as t
+
+from httpx import Headers, Response
+
+from ..typedefs import Json
+
+__all__ = ('RateLimitBucket', 'RateLimiter')
+
+MAJOR_PARAMETERS: tuple[str, ...]
+
+
+class RateLimitBucket:
+    ratelimiter: RateLimiter
+    key: tuple[t.Any, tuple[t.Any, ...]]
+    limit: int | None
+    remaining: int
+    reset_at: float | None
+    unlimited: bool
+
+    def __init__(self, ratelimiter: RateLimiter,
+                 key: tuple[t.Any, tuple[t.Any, ...]]) -> None: ...
+
+    @property
+    def idle(self) -> bool: ...
+
+    async def acquire(self) -> None: ...
+
+    def release(self) -> None: ...
+
+    def update(self, headers: Headers, retry_after: float | None = ...) -> None: ...
+
+
+class RateLimiter:
+    loop: asyncio.AbstractEventLoop
+    global_limit: int | None
+    global_reset_at: float | None
+    routes: dict[tuple[str, str], str]
+    buckets: dict[tuple[t.Any, tuple[t.Any, ...]], RateLimitBucket]
+
+    def __init__(self, *, loop: asyncio.AbstractEventLoop,
+                 global_limit: int | None = ...) -> None: ...
+
+    def get_bucket(self, method: str, url: str,
+                   fmt: Json | None = ...) -> RateLimitBucket: ...
+
+    async def acquire_global(self) -> None: ...
+
+    def update(self, bucket: RateLimitBucket, method: str, url: str,
+               response: Response, data: Json | bytes | None = ...) -> None: ...
@@ -5,8 +5,11 @@ import typing as t
 
 from httpx import AsyncClient, Response
 
+from .ratelimit import RateLimiter
+from ..cache import TTLCache
 from ..clients.client import Client
 from ..typedefs import Json
+from ..utils import JsonCodec
 
 __all__ = ('HTTPError', 'RestSession')
 
@@ -21,7 +24,12 @@ class RestSession(AsyncClient):
     loop: asyncio.AbstractEventLoop
     client: Client
     authorization: str
+    json_codec: JsonCodec
     global_headers: Json
+    max_retries: int
+    ratelimiter: RateLimiter
+    coalesce_gets: bool
+    response_cache: TTLCache | None
 
     def __init__(self, client: Client, *args: t.Any, **kwargs: t.Any) -> None: ...
 
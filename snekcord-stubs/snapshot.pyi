@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import typing as t
+
+from .clients.client import Client
+
+__all__ = (
+    'SNAPSHOT_VERSION', 'open_compressed', 'save_snapshot', 'save_snapshot_sync', 'load_snapshot'
+)
+
+SNAPSHOT_VERSION: int
+
+COMPRESSION_SUFFIXES: dict[str, t.Callable[..., t.BinaryIO]]
+
+
+def open_compressed(path: str, mode: str = ...) -> t.BinaryIO: ...
+
+
+async def save_snapshot(client: Client, path: str) -> None: ...
+
+
+def save_snapshot_sync(client: Client, path: str) -> None: ...
+
+
+def load_snapshot(client: Client, path: str) -> dict[str, t.Any]: ...
@@ -3,12 +3,15 @@ from __future__ import annotations
 import typing as t
 
 from ..clients.client import Client
+from ..typedefs import Json, SnowflakeConvertible
+from ..utils import Snowflake
 
-__all__ = ('BaseState', 'BaseSubState')
+__all__ = ('BaseState', 'BaseSubState', 'Paginator')
 
 KT = t.TypeVar('KT')
 VT = t.TypeVar('VT')
 DT = t.TypeVar('DT')
+T = t.TypeVar('T')
 
 
 class _StateCommon(t.Generic[KT, VT]):
@@ -21,10 +24,12 @@ class BaseState(_StateCommon[KT, VT]):
     _mapping_: t.ClassVar[type[t.MutableMapping[KT, VT]]] = dict
 
     client: Client
-    mapping: _mapping_
+    mapping: t.MutableMapping[KT, VT]
 
     def __init__(self, *, client: Client) -> None: ...
 
+    def _evicted(self, key: KT, value: VT) -> None: ...
+
     def __iter__(self) -> t.Iterator[VT]: ...
 
     def __reversed__(self) -> t.Iterator[VT]: ...
@@ -74,3 +79,28 @@ class BaseSubState(_StateCommon[KT, VT]):
     def values(self) -> t.Iterable[VT]: ...
 
     def items(self) -> t.Iterable[tuple[KT, VT]]: ...
+
+
+class Paginator(t.Generic[T]):
+    fetch: t.Callable[[dict[str, t.Any]], t.Awaitable[list[Json]]]
+    convert: t.Callable[[Json], T]
+    key: t.Callable[[Json], Snowflake]
+    direction: t.Literal['before', 'after']
+    cursor: Snowflake | None
+    until: Snowflake | None
+    limit: int | None
+    page_size: int
+    pages: int
+
+    def __init__(self, fetch: t.Callable[[dict[str, t.Any]], t.Awaitable[list[Json]]],
+                 convert: t.Callable[[Json], T], *,
+                 key: t.Callable[[Json], Snowflake] | None = ...,
+                 direction: t.Literal['before', 'after'] = ...,
+                 cursor: SnowflakeConvertible | None = ...,
+                 until: SnowflakeConvertible | None = ...,
+                 limit: int | None = ...,
+                 page_size: int = ...) -> None: ...
+
+    def __aiter__(self) -> t.AsyncIterator[T]: ...
+
+    async def flatten(self) -> list[T]: ...
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import typing as t
+
+from .basestate import BaseState, BaseSubState
+from ..objects.channelobject import (CategoryChannel, DMChannel, GuildChannel,
+                                     TextChannel, VoiceChannel)
+from ..objects.guildobject import Guild
+from ..typedefs import Json, SnowflakeConvertible
+from ..utils import Snowflake
+
+__all__ = ('ChannelState', 'GuildChannelState')
+
+Channel = t.Union[GuildChannel, TextChannel, CategoryChannel, VoiceChannel, DMChannel]
+
+
+class GuildChannelPosition(t.TypedDict, total=False):
+    position: int | None
+    lock_permissions: bool | None
+    parent: SnowflakeConvertible | None
+
+
+class ChannelState(BaseState[Snowflake, Channel]):
+    def get_class(self, type: int) -> type[Channel]: ...
+
+    def upsert(self, data: Json) -> Channel: ...
+
+    async def fetch(self, channel: SnowflakeConvertible) -> Channel: ...
+
+    async def delete(self, channel: SnowflakeConvertible) -> None: ...
+
+    async def export_history(self, channels: t.Iterable[SnowflakeConvertible],
+                             directory: str, *, suffix: str = ...,
+                             concurrency: int = ...,
+                             before: SnowflakeConvertible | None = ...,
+                             after: SnowflakeConvertible | None = ...,
+                             oldest_first: bool = ...,
+                             limit: int | None = ...,
+                             page_size: int = ...) -> dict[Snowflake, int]: ...
+
+    async def close(self, channel: SnowflakeConvertible) -> None: ...
+
+
+class GuildChannelState(BaseSubState[Snowflake, Channel]):
+    superstate: ChannelState
+    guild: Guild
+
+    def __init__(self, *, superstate: ChannelState, guild: Guild) -> None: ...
+
+    @property
+    def afk(self) -> VoiceChannel | None: ...
+
+    @property
+    def widget(self) -> Channel | None: ...
+
+    @property
+    def application(self) -> Channel | None: ...
+
+    @property
+    def system(self) -> TextChannel | None: ...
+
+    @property
+    def rules(self) -> TextChannel | None: ...
+
+    @property
+    def public_updates(self) -> TextChannel | None: ...
+
+    async def fetch_all(self) -> list[Channel]: ...
+
+    async def modify_many(self,
+                          channels: dict[SnowflakeConvertible,
+                                         GuildChannelPosition]) -> None: ...
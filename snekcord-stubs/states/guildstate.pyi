@@ -1,6 +1,6 @@
 import typing as t
 
-from .basestate import BaseState
+from .basestate import BaseState, Paginator
 from ..clients.client import Client
 from ..objects.guildobject import Guild, GuildBan
 from ..objects.templateobject import GuildTemplate
@@ -22,6 +22,12 @@ class GuildState(BaseState[Snowflake, Guild]):
                          limit: SnowflakeConvertible | None = ...
                          ) -> list[Guild]: ...
 
+    def iterate(self, *, before: SnowflakeConvertible | None = ...,
+                after: SnowflakeConvertible | None = ...,
+                limit: int | None = ...,
+                page_size: int = ...,
+                cache: bool = ...) -> Paginator[Guild]: ...
+
     async def fetch_preview(self, guild: SnowflakeConvertible) -> None: ...
 
     async def fetch_template(self, code: str) -> GuildTemplate: ...
@@ -1,15 +1,42 @@
 from __future__ import annotations
 
+import asyncio
 import typing as t
 
-from .basestate import BaseState
+from .basestate import BaseState, Paginator
 from ..clients.client import Client
 from ..objects.guildobject import Guild
 from ..objects.memberobject import GuildMember
 from ..typedefs import SnowflakeConvertible
 from ..utils import Snowflake
+from ..ws.shardws import Shard
 
-__all__ = ('GuildMemberState',)
+__all__ = ('MemberChunkRequest', 'GuildMemberState')
+
+
+class MemberChunkRequest:
+    guild: Guild
+    nonce: str
+    timeout: float | None
+    members: list[GuildMember]
+    not_found: list[Snowflake]
+    chunk_count: int | None
+    chunks_received: int
+    shard: Shard | None
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future[list[GuildMember]]
+
+    def __init__(self, *, guild: Guild, nonce: str, timeout: float | None = ...,
+                 shard: Shard | None = ...) -> None: ...
+
+    @property
+    def done(self) -> bool: ...
+
+    async def wait(self) -> list[GuildMember]: ...
+
+    def __await__(self) -> t.Generator[t.Any, None, list[GuildMember]]: ...
+
+    def __aiter__(self) -> t.AsyncIterator[GuildMember]: ...
 
 
 class GuildMemberState(BaseState[Snowflake, GuildMember]):
@@ -17,6 +44,12 @@ class GuildMemberState(BaseState[Snowflake, GuildMember]):
 
     def __init__(self, *, client: Client, guild: Guild) -> None: ...
 
+    def request_chunked(self, *, query: str | None = ...,
+                        limit: int | None = ...,
+                        users: t.Iterable[SnowflakeConvertible] | None = ...,
+                        presences: bool | None = ...,
+                        timeout: float | None = ...) -> MemberChunkRequest: ...
+
     async def fetch(self, user: SnowflakeConvertible) -> GuildMember: ...
 
     async def fetch_many(self, around: Snowflake | None = ...,
@@ -24,6 +57,11 @@ class GuildMemberState(BaseState[Snowflake, GuildMember]):
                          after: Snowflake | None = ...,
                          limit: int | None = ...) -> list[GuildMember]: ...
 
+    def iterate(self, *, after: SnowflakeConvertible | None = ...,
+                limit: int | None = ...,
+                page_size: int = ...,
+                cache: bool = ...) -> Paginator[GuildMember]: ...
+
     async def search(self, query: str,
                      limit: int | None) -> list[GuildMember]: ...
 
@@ -1,14 +1,66 @@
 from __future__ import annotations
 
+import asyncio
 import typing as t
 
-from .basestate import BaseState
+from .basestate import BaseState, Paginator
 from ..clients.client import Client
 from ..objects.messageobject import Message
 from ..typedefs import Channel, SnowflakeConvertible
 from ..utils import Snowflake
 
-__all__ = ('MessageState',)
+__all__ = ('MessageCachePolicy', 'MessagePurge', 'MessageState',)
+
+
+class MessageCachePolicy:
+    max_messages: int | None
+    max_total: int | None
+    ttl: float | None
+
+    def __init__(self, *, max_messages: int | None = ...,
+                 max_total: int | None = ...,
+                 ttl: float | None = ...) -> None: ...
+
+    def __len__(self) -> int: ...
+
+    def is_protected(self, message: Message) -> bool: ...
+
+    def add(self, message: Message) -> None: ...
+
+    def remove(self, message: Message) -> None: ...
+
+    def evict(self, state: MessageState | None = ...) -> list[Message]: ...
+
+
+class MessagePurge:
+    BULK_DELETE_MAX_AGE: t.ClassVar[int]
+    BULK_DELETE_LIMIT: t.ClassVar[int]
+
+    state: MessageState
+    batches: list[tuple[Snowflake, ...]]
+    singles: list[Snowflake]
+    total: int
+    deleted: list[Snowflake]
+    failed: list[Snowflake]
+    errors: list[Exception]
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future[list[Snowflake]]
+
+    def __init__(self, *, state: MessageState,
+                 message_ids: t.Sequence[Snowflake]) -> None: ...
+
+    @property
+    def done(self) -> bool: ...
+
+    def start(self) -> MessagePurge: ...
+
+    def cancel(self) -> None: ...
+
+    async def wait(self) -> list[Snowflake]: ...
+
+    def __await__(self) -> t.Generator[t.Any, None, list[Snowflake]]: ...
+
+    def __aiter__(self) -> t.AsyncIterator[tuple[Snowflake, ...]]: ...
 
 
 class MessageState(BaseState[Snowflake, Message]):
@@ -23,6 +75,21 @@ class MessageState(BaseState[Snowflake, Message]):
                          after: Snowflake | None = ...,
                          limit: int | None = ...) -> list[Message]: ...
 
+    def history(self, *, before: SnowflakeConvertible | None = ...,
+                after: SnowflakeConvertible | None = ...,
+                oldest_first: bool = ...,
+                limit: int | None = ...,
+                page_size: int = ...,
+                cache: bool = ...) -> Paginator[Message]: ...
+
+    async def export(self, path: str, *, before: SnowflakeConvertible | None = ...,
+                     after: SnowflakeConvertible | None = ...,
+                     oldest_first: bool = ...,
+                     limit: int | None = ...,
+                     page_size: int = ...) -> int: ...
+
     async def create(self, **kwargs: t.Any) -> Message: ...
 
+    def purge(self, messages: t.Iterable[SnowflakeConvertible]) -> MessagePurge: ...
+
     async def bulk_delete(self, messages: t.Iterable[SnowflakeConvertible]) -> None: ...
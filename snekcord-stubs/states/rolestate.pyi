@@ -3,6 +3,7 @@ from __future__ import annotations
 import typing as t
 
 from .basestate import BaseState, BaseSubState
+from .memberstate import GuildMemberState
 from ..clients.client import Client
 from ..objects.guildobject import Guild
 from ..objects.memberobject import GuildMember
@@ -10,7 +11,7 @@ from ..objects.roleobject import Role
 from ..typedefs import SnowflakeConvertible
 from ..utils import Snowflake
 
-__all__ = ('RoleState', 'GuildMemberRoleState')
+__all__ = ('RoleState', 'GuildMemberRoleState', 'RoleMemberState')
 
 
 class GuildRolePosition(t.TypedDict):
@@ -44,3 +45,10 @@ class GuildMemberRoleState(BaseSubState[Snowflake, Role]):
     async def add(self, role: SnowflakeConvertible) -> None: ...
 
     async def remove(self, role: SnowflakeConvertible) -> None: ...
+
+
+class RoleMemberState(BaseSubState[Snowflake, GuildMember]):
+    superstate: GuildMemberState
+    role: Role
+
+    def __init__(self, *, superstate: GuildMemberState, role: Role) -> None: ...
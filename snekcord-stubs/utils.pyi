@@ -5,20 +5,56 @@ from datetime import datetime
 
 from .typedefs import Json, SnowflakeConvertible
 
-__all__ = ('JsonObject', 'JsonField', 'JsonArray', 'Snowflake', 'undefined')
+__all__ = ('JsonCodec', 'default_json_codec', 'JsonObject', 'JsonField', 'JsonArray',
+           'Snowflake', 'undefined')
 
 T = t.TypeVar('T')
 FT = t.TypeVar('FT')
 
 
+class JsonCodec:
+    name: str
+    loads: t.Callable[[str | bytes], t.Any]
+    dumps: t.Callable[[t.Any], str | bytes]
+    binary: bool
+
+    def __init__(self, name: str, loads: t.Callable[[str | bytes], t.Any],
+                 dumps: t.Callable[[t.Any], str | bytes], *,
+                 binary: bool = ...) -> None: ...
+
+    @classmethod
+    def from_stdlib(cls) -> JsonCodec: ...
+
+    @classmethod
+    def from_orjson(cls) -> JsonCodec: ...
+
+    @classmethod
+    def from_ujson(cls) -> JsonCodec: ...
+
+    @classmethod
+    def default(cls) -> JsonCodec: ...
+
+    def dumps_str(self, obj: t.Any) -> str: ...
+
+    def dumps_bytes(self, obj: t.Any) -> bytes: ...
+
+
+default_json_codec: JsonCodec
+
+
 class JsonObject:
     _json_data_: Json
+    _json_cache_: dict[str, t.Any] | None
 
     @classmethod
     def unmarshal(cls: type[T], data: Json | None = ..., **kwargs: t.Any) -> T: ...
 
     def update(self, data: Json) -> None: ...
 
+    def diff(self, data: Json) -> dict[str, t.Any]: ...
+
+    def _invalidate_(self, *keys: str) -> None: ...
+
     def to_dict(self) -> Json: ...
 
     def marshal(self, *args: t.Any, **kwargs: t.Any) -> str: ...
@@ -41,8 +77,6 @@ class JsonField(t.Generic[FT]):
 
     def __delete__(self, instance: JsonObject) -> t.NoReturn: ...
 
-    def _unmsrshal_(self, value: t.Any) -> FT: ...
-
     def unmarshaler(self, func: T) -> T: ...
 
 
@@ -53,8 +87,6 @@ class JsonArray(JsonField[FT]):
     @t.overload
     def __get__(self, instance: JsonObject, owner: type[JsonObject]) -> list[FT] | None: ...
 
-    def _unmsrshal_(self, value: list[t.Any]) -> list[FT]: ...
-
 
 class Snowflake(int):
     SNOWFLAKE_EPOCH: t.ClassVar[int]
@@ -16,4 +16,26 @@ class BaseWebSocket(WebSocketClient):
     @property
     def latency(self) -> float: ...
 
+    def ws_text_received(self, data: str | bytes) -> None: ...
+
+    def ws_binary_received(self, data: bytes) -> None: ...
+
+    def ws_close_received(self, code: int, data: bytes) -> None: ...
+
+    def closing_connection(self, exc: BaseException | None) -> None: ...
+
+    def connection_closing(self, exc: BaseException | None) -> None: ...
+
+    def connection_lost(self, exc: BaseException | None) -> None: ...
+
+    async def on_text_received(self, data: str | bytes) -> None: ...
+
+    async def on_binary_received(self, data: bytes) -> None: ...
+
+    async def on_close_received(self, code: int, data: bytes) -> None: ...
+
+    async def on_closing(self, exc: BaseException | None) -> None: ...
+
+    async def on_connection_lost(self, exc: BaseException | None) -> None: ...
+
     async def send_heartbeat(self) -> None: ...
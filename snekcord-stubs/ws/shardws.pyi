@@ -6,9 +6,14 @@ import typing as t
 from ..clients.wsclient import WebSocketClient, WebSocketIntents
 from ..enums import Enum
 from ..objects.userobject import User
+from ..states.memberstate import MemberChunkRequest
 from ..typedefs import Json, SnowflakeConvertible
+from ..utils import JsonCodec
 
-__all__ = ('ShardOpcode', 'ShardCloseCode', 'Shard', 'ShardWebSocket')
+__all__ = (
+    'ShardOpcode', 'ShardCloseCode', 'GatewaySendLimiter', 'IdentifyScheduler', 'Shard',
+    'ShardWebSocket'
+)
 
 
 class ShardOpcode(Enum[int]):
@@ -48,12 +53,70 @@ class ShardWebSocketCallbacks:
     READY: t.Callable[[Json], None]
     DISPATCH: t.Callable[[str, Json], None]
     GUILDS_RECEIVED: t.Callable[[], None]
+    RESUMED: t.Callable[[], None]
+    RECONNECT: t.Callable[[], None]
+    INVALID_SESSION: t.Callable[[bool], None]
     CLOSED: t.Callable[[int, Json], None]
     CLOSING: t.Callable[[BaseException], None]
     CONNECTION_LOST: t.Callable[[BaseException], None]
 
 
+class GatewaySendLimiter:
+    HEARTBEAT_PRIORITY: t.ClassVar[int]
+    PRIORITIES: t.ClassVar[dict[int, int]]
+    DEFAULT_PRIORITY: t.ClassVar[int]
+
+    loop: asyncio.AbstractEventLoop
+    limit: int
+    per: float
+    reserved: int
+    @property
+    def tokens(self) -> int: ...
+
+    def __init__(self, *, loop: asyncio.AbstractEventLoop, limit: int = ...,
+                 per: float = ..., reserved: int = ...) -> None: ...
+
+    @property
+    def queue_depth(self) -> int: ...
+
+    def get_priority(self, opcode: int) -> int: ...
+
+    async def acquire(self, priority: int) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class IdentifyScheduler:
+    IDENTIFY_INTERVAL: t.ClassVar[float]
+    SESSION_START_WINDOW: t.ClassVar[float]
+
+    loop: asyncio.AbstractEventLoop
+    max_concurrency: int
+    total: int | None
+    remaining: int | None
+    reset_at: float | None
+
+    def __init__(self, *, loop: asyncio.AbstractEventLoop, max_concurrency: int = ...,
+                 total: int | None = ..., remaining: int | None = ...,
+                 reset_after: float | None = ...) -> None: ...
+
+    @classmethod
+    def from_session_start_limit(cls, data: Json, *,
+                                 loop: asyncio.AbstractEventLoop) -> IdentifyScheduler: ...
+
+    def get_bucket(self, shard_id: int) -> int: ...
+
+    async def acquire(self, shard_id: int) -> None: ...
+
+
+FATAL_CLOSE_CODES: frozenset[int]
+UNRESUMABLE_CLOSE_CODES: frozenset[int]
+
+
 class Shard:
+    RECONNECT_BASE_DELAY: t.ClassVar[float]
+    RECONNECT_MAX_DELAY: t.ClassVar[float]
+
     client: WebSocketClient
     id: int
     count: int
@@ -68,6 +131,11 @@ class Shard:
     heartbeater_task: asyncio.Task[t.NoReturn] | None
     user: User | None
     ws: ShardWebSocket
+    url: str | None
+    closed: bool
+    close_code: int | None
+    reconnect_attempts: int
+    chunk_requests: dict[str, MemberChunkRequest]
 
     def __init__(self, client: WebSocketClient, shard_id: int) -> None: ...
 
@@ -80,8 +148,14 @@ class Shard:
 
     async def on_ready(self, data: Json) -> None: ...
 
+    async def on_resumed(self) -> None: ...
+
     async def on_dispatch(self, name: str, data: Json) -> None: ...
 
+    async def on_reconnect(self) -> None: ...
+
+    async def on_invalid_session(self, resumable: bool) -> None: ...
+
     async def on_guilds_received(self) -> None: ...
 
     async def on_closed(self, code: int, data: Json) -> None: ...
@@ -92,7 +166,14 @@ class Shard:
 
     async def heartbeater(self) -> t.NoReturn: ...
 
-    async def connect(self, *args: t.Any, **kwargs: t.Any) -> None: ...
+    async def connect(self, url: str, *args: t.Any, **kwargs: t.Any) -> None: ...
+
+    async def reconnect(self) -> None: ...
+
+    async def close(self, code: int = ...) -> None: ...
+
+
+ZLIB_SUFFIX: bytes
 
 
 class ShardWebSocket:
@@ -108,19 +189,41 @@ class ShardWebSocket:
     unavailable_guilds: set[str]
     available_guilds: set[str]
     sequence: int
+    compress: bool
+    json_codec: JsonCodec
+    heartbeat_acked: bool
+    identify_scheduler: IdentifyScheduler | None
+    send_limiter: GatewaySendLimiter
 
     def __init__(self, shard_id: int, shard_count: int, *,
                  loop: asyncio.AbstractEventLoop | None = ...,
                  token: str, intents: WebSocketIntents | None,
                  callbacks: ShardWebSocketCallbacks,
+                 compress: bool = ...,
+                 json_codec: JsonCodec | None = ...,
                  session_id: str | None = ...,
                  available_guilds: set[str] | None = ...,
                  unavailable_guilds: set[str] | None = ...,
-                 sequence: int = ...) -> None: ...
+                 sequence: int = ...,
+                 identify_scheduler: IdentifyScheduler | None = ...) -> None: ...
 
     @property
     def shard(self) -> tuple[int, int] | None: ...
 
+    def reset_session(self) -> None: ...
+
+    async def send_payload(self, payload: Json) -> None: ...
+
+    async def on_binary_received(self, data: bytes) -> None: ...
+
+    async def on_text_received(self, data: str | bytes) -> None: ...
+
+    async def on_closing(self, exc: BaseException | None) -> None: ...
+
+    async def on_close_received(self, code: int, data: bytes) -> None: ...
+
+    async def on_connection_lost(self, exc: BaseException | None) -> None: ...
+
     async def identify(self) -> None: ...
 
     async def resume(self) -> None: ...
@@ -129,4 +232,6 @@ class ShardWebSocket:
         self, guild: SnowflakeConvertible,
         presences: bool | None = ..., limit: int | None = ...,
         users: t.Iterable[SnowflakeConvertible] | None = ...,
-        query: str | None = ...) -> None: ...
+        query: str | None = ..., nonce: str | None = ...) -> None: ...
+
+    resuest_guild_members = request_guild_members
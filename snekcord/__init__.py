@@ -1,4 +1,5 @@
 from . import utils
+from .cache import *
 from .clients import *
 from .enums import *
 from .exceptions import *
@@ -0,0 +1,254 @@
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+__all__ = ('CacheBackend', 'LRUCache', 'TTLCache', 'WeakValueCache', 'NullCache')
+
+
+class CacheBackend(MutableMapping):
+    """The base class for state caches, an unbounded mapping that counts
+    its hits, misses and evictions
+
+    Attributes:
+        hits int: The number of lookups that found a value
+
+        misses int: The number of lookups that didn't find a value
+
+        evictions int: The number of values removed by the backend itself
+
+        on_evict Optional[Callable[[Any, Any], Any]]: Called with the key
+            and value of every value evicted by the backend
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.on_evict = None
+
+        self._data = {}
+
+    def __repr__(self):
+        return (
+            f'<{self.__class__.__name__} len({len(self)}), hits={self.hits}, '
+            f'misses={self.misses}, evictions={self.evictions}>'
+        )
+
+    def __getitem__(self, key):
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            raise
+
+        self.hits += 1
+        return value
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __reversed__(self):
+        return reversed(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def values(self):
+        return self._data.values()
+
+    def items(self):
+        return self._data.items()
+
+    def clear(self):
+        self._data.clear()
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+    def _evicted(self, key, value):
+        self.evictions += 1
+
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+
+class LRUCache(CacheBackend):
+    """A cache that evicts the least recently used value once it holds
+    more than `maxsize` values"""
+
+    def __init__(self, maxsize=1000):
+        super().__init__()
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._evicted(*self._data.popitem(last=False))
+
+
+class TTLCache(CacheBackend):
+    """A cache that evicts values `ttl` seconds after they were stored,
+    optionally evicting the oldest value once it holds more than
+    `maxsize` values"""
+
+    def __init__(self, ttl, maxsize=None):
+        super().__init__()
+        self.ttl = ttl
+        self.maxsize = maxsize
+
+        self._data = OrderedDict()
+        self._expires = {}
+
+    def __getitem__(self, key):
+        expires_at = self._expires.get(key)
+
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._evicted(key, self._pop(key))
+
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        self._expires[key] = time.monotonic() + self.ttl
+
+        self.expire()
+
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                key, value = self._data.popitem(last=False)
+                del self._expires[key]
+                self._evicted(key, value)
+
+    def __delitem__(self, key):
+        del self._data[key]
+        del self._expires[key]
+
+    def __contains__(self, key):
+        expires_at = self._expires.get(key)
+        return expires_at is not None and expires_at > time.monotonic()
+
+    def __iter__(self):
+        self.expire()
+        return super().__iter__()
+
+    def __len__(self):
+        self.expire()
+        return super().__len__()
+
+    def values(self):
+        self.expire()
+        return super().values()
+
+    def items(self):
+        self.expire()
+        return super().items()
+
+    def clear(self):
+        self._data.clear()
+        self._expires.clear()
+
+    def _pop(self, key):
+        del self._expires[key]
+        return self._data.pop(key)
+
+    def expire(self):
+        """Evicts every value that outlived the cache's ttl"""
+        now = time.monotonic()
+
+        # Values are ordered by the time they were stored so the
+        # first value that hasn't expired ends the search
+        while self._data:
+            key = next(iter(self._data))
+
+            if self._expires[key] > now:
+                break
+
+            self._evicted(key, self._pop(key))
+
+
+class WeakValueCache(CacheBackend):
+    """A cache that only holds weak references to its values, values are
+    evicted once nothing else references them"""
+
+    def __init__(self):
+        super().__init__()
+        self._callback = self._make_callback(weakref.ref(self))
+
+    @staticmethod
+    def _make_callback(selfref):
+        # The callback must not keep the cache alive
+        def callback(ref):
+            self = selfref()
+
+            if self is not None and self._data.get(ref.key) is ref:
+                del self._data[ref.key]
+                self.evictions += 1
+
+        return callback
+
+    def __getitem__(self, key):
+        ref = self._data.get(key)
+
+        if ref is not None:
+            value = ref()
+
+            if value is not None:
+                self.hits += 1
+                return value
+
+        self.misses += 1
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        self._data[key] = weakref.KeyedRef(value, self._callback, key)
+
+    def __contains__(self, key):
+        ref = self._data.get(key)
+        return ref is not None and ref() is not None
+
+    def __iter__(self):
+        return iter(tuple(self._data))
+
+    def __reversed__(self):
+        return reversed(tuple(self._data))
+
+    def values(self):
+        return [value for value in (ref() for ref in tuple(self._data.values()))
+                if value is not None]
+
+    def items(self):
+        return [(key, value) for key, value in
+                ((key, ref()) for key, ref in tuple(self._data.items()))
+                if value is not None]
+
+
+class NullCache(CacheBackend):
+    """A cache that never stores anything"""
+
+    def __setitem__(self, key, value):
+        pass
@@ -0,0 +1,167 @@
+import asyncio
+
+from ..utils import Snowflake
+
+__all__ = ('ChunkScheduler',)
+
+
+def _get_member_count(guild):
+    return guild.member_count or 0
+
+
+def _get_activity(guild):
+    # The presences sent with GUILD_CREATE are the members that are
+    # currently online
+    return len(guild._json_data_.get('presences', ()))
+
+
+CHUNK_ORDERS = {
+    'member_count': _get_member_count,
+    'activity': _get_activity,
+}
+
+
+class ChunkScheduler:
+    """Requests the members of every large guild in the background once
+    a shard has received its guilds, small guilds can be served right
+    away while the large ones fill in
+
+    Requests are sent through the shard's send limiter so they never
+    starve heartbeats or identifies. A shard that reconnects stops its
+    requests, they continue with the remaining guilds once the session
+    is resumed. Progress is reported with the
+    `CHUNK_PROGRESS` (shard, completed, total), `GUILD_CHUNKED`
+    (shard, guild, request) and `SHARD_CHUNKED` (shard) events.
+
+    Attributes:
+        client WebSocketClient: The client the scheduler belongs to
+
+        order Callable[[Guild], Any]: The sort key, guilds with the
+            largest key are chunked first. 'member_count' and 'activity'
+            are accepted as shortcuts
+
+        concurrency int: The number of requests each shard has in
+            flight at once
+
+        timeout Optional[float]: The number of seconds to wait for the
+            members of a guild before its request is retried
+
+        retries int: The number of times a request that timed out is
+            retried before the guild is given up on
+
+        progress dict[int, dict[str, int]]: The total, completed and
+            failed guild counts of each shard
+    """
+
+    def __init__(self, *, client, order='member_count', concurrency=1, timeout=60.0, retries=1):
+        self.client = client
+
+        if isinstance(order, str):
+            try:
+                order = CHUNK_ORDERS[order]
+            except KeyError:
+                raise ValueError(
+                    f'order should be a callable or one of {tuple(CHUNK_ORDERS)}, got {order!r}'
+                ) from None
+
+        self.order = order
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.retries = retries
+
+        self.progress = {}
+
+        self._tasks = {}
+        # The ids of the guilds each unfinished run is done with
+        self._handled = {}
+
+    def get_guilds(self, shard):
+        guilds = []
+
+        for guild_id in shard.ws.available_guilds:
+            guild = self.client.guilds.get(Snowflake(guild_id))
+
+            if guild is not None and guild.large:
+                guilds.append(guild)
+
+        guilds.sort(key=self.order, reverse=True)
+
+        return guilds
+
+    def schedule(self, shard):
+        self.cancel(shard)
+
+        self.progress[shard.id] = {'total': 0, 'completed': 0, 'failed': 0}
+        self._handled[shard.id] = set()
+        self._tasks[shard.id] = self.client.loop.create_task(self._run(shard))
+
+    def resume(self, shard):
+        """Continues the shard's unfinished run with the guilds it hasn't
+        requested yet, nothing happens if the run is finished or running
+        """
+        if shard.id in self._handled and shard.id not in self._tasks:
+            self._tasks[shard.id] = self.client.loop.create_task(self._run(shard))
+
+    def cancel(self, shard):
+        task = self._tasks.pop(shard.id, None)
+
+        if task is not None:
+            task.cancel()
+
+    def close(self):
+        for task in self._tasks.values():
+            task.cancel()
+
+        self._tasks.clear()
+
+    async def _request(self, guild):
+        for attempt in range(self.retries + 1):
+            request = guild.members.request_chunked(timeout=self.timeout)
+
+            try:
+                await request
+            except asyncio.TimeoutError:
+                # The chunks were lost, the guild is requested again
+                if attempt >= self.retries:
+                    raise
+            else:
+                return request
+
+    async def _worker(self, shard, guilds, progress, handled):
+        for guild in guilds:
+            try:
+                request = await self._request(guild)
+            except Exception:
+                progress['failed'] += 1
+            else:
+                progress['completed'] += 1
+                await self.client.dispatch('GUILD_CHUNKED', shard, guild, request)
+
+            handled.add(guild.id)
+
+            await self.client.dispatch(
+                'CHUNK_PROGRESS', shard, progress['completed'], progress['total']
+            )
+
+    async def _run(self, shard):
+        # Let the dispatch of the last startup guild finish caching it
+        await asyncio.sleep(0)
+
+        progress = self.progress[shard.id]
+        handled = self._handled[shard.id]
+
+        guilds = [guild for guild in self.get_guilds(shard) if guild.id not in handled]
+        progress['total'] = len(handled) + len(guilds)
+
+        # The workers share one iterator so guilds are still requested
+        # in order
+        guilds = iter(guilds)
+
+        await asyncio.gather(
+            *(self._worker(shard, guilds, progress, handled) for _ in range(self.concurrency))
+        )
+
+        self._tasks.pop(shard.id, None)
+        self._handled.pop(shard.id, None)
+
+        await self.client.dispatch('SHARD_CHUNKED', shard)
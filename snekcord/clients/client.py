@@ -3,6 +3,8 @@ import signal
 import weakref
 
 from ..auth import Authorization
+from ..snapshot import load_snapshot, save_snapshot, save_snapshot_sync
+from ..utils import default_json_codec
 
 __all__ = ('ClientClasses', 'Client',)
 
@@ -48,11 +50,13 @@ class _ClientClasses:
         'IntegrationState',
         'InviteState',
         'GuildMemberState',
+        'MessageCachePolicy',
         'MessageState',
         'ChannelPinsState',
         'PermissionOverwriteState',
         'ReactionsState',
         'GuildMemberRoleState',
+        'RoleMemberState',
         'RoleState',
         'StageInstanceState',
         'UserState',
@@ -77,6 +81,24 @@ class _ClientClasses:
 
 ClientClasses = _ClientClasses()
 
+# Friendly names accepted by Client(cache_backends=...) in addition
+# to state class names
+CACHE_BACKEND_ALIASES = {
+    'channels': 'ChannelState',
+    'emojis': 'GuildEmojiState',
+    'bans': 'GuildBanState',
+    'guilds': 'GuildState',
+    'integrations': 'IntegrationState',
+    'invites': 'InviteState',
+    'members': 'GuildMemberState',
+    'messages': 'MessageState',
+    'overwrites': 'PermissionOverwriteState',
+    'reactions': 'ReactionsState',
+    'roles': 'RoleState',
+    'stages': 'StageInstanceState',
+    'users': 'UserState',
+}
+
 
 class _EventWaiter:
     def __init__(self, name, client, timeout, filter):
@@ -111,8 +133,14 @@ class _EventWaiter:
         return self._get()
 
 
+LISTENER_OVERFLOW_POLICIES = ('block', 'drop_oldest', 'drop_newest')
+
+
 class _EventListener:
-    def __init__(self, name, client, callback, sync, persistent):
+    def __init__(
+        self, name, client, callback, sync, persistent, *, concurrency=None, maxsize=None,
+        overflow=None
+    ):
         self.name = name
         self.client = client
         self.callback = callback
@@ -120,25 +148,86 @@ class _EventListener:
         self.persistent = persistent
 
         if self.sync:
-            self._lock = asyncio.Lock()
+            self.concurrency = 1
+        elif concurrency is not None:
+            self.concurrency = concurrency
+        else:
+            self.concurrency = client.listener_concurrency
 
-    async def _do_put(self, args):
-        if self.sync:
-            await self._lock.acquire()
+        if maxsize is not None:
+            self.maxsize = maxsize
+        else:
+            self.maxsize = client.listener_queue_size
+
+        if overflow is not None:
+            self.overflow = overflow
+        else:
+            self.overflow = client.listener_overflow
+
+        if self.overflow not in LISTENER_OVERFLOW_POLICIES:
+            raise ValueError(
+                f'overflow should be one of {LISTENER_OVERFLOW_POLICIES}, got {self.overflow!r}'
+            )
+
+        self.processed = 0
+        self.dropped = 0
+        self.failed = 0
+
+        self._workers = 0
+        self._queue = asyncio.Queue(self.maxsize)
+
+    @property
+    def queue_depth(self):
+        return self._queue.qsize()
 
+    def metrics(self):
+        return {
+            'queue_depth': self.queue_depth,
+            'workers': self._workers,
+            'processed': self.processed,
+            'dropped': self.dropped,
+            'failed': self.failed,
+        }
+
+    async def _do_put(self, args):
         try:
             result = self.callback(*args)
 
             if asyncio.iscoroutinefunction(self.callback):
                 await result
-        except Exception:
-            pass
+        except Exception as exc:
+            self.failed += 1
+            self.client.handle_listener_error(self, exc)
+        else:
+            self.processed += 1
 
-        if self.sync:
-            self._lock.release()
+    async def _worker(self):
+        # Workers exit as soon as the queue is empty, _put starts new
+        # ones when events come in
+        try:
+            while not self._queue.empty():
+                await self._do_put(self._queue.get_nowait())
+        finally:
+            self._workers -= 1
 
     async def _put(self, args):
-        self.client.loop.create_task(self._do_put(args))
+        if self._queue.full():
+            if self.overflow == 'drop_newest':
+                self.dropped += 1
+                return
+
+            if self.overflow == 'drop_oldest':
+                self._queue.get_nowait()
+                self.dropped += 1
+                self._queue.put_nowait(args)
+            else:
+                await self._queue.put(args)
+        else:
+            self._queue.put_nowait(args)
+
+        if self._workers < self.concurrency:
+            self._workers += 1
+            self.client.loop.create_task(self._worker())
 
 
 class Client:
@@ -146,7 +235,12 @@ class Client:
 
     _handled_signals_ = [signal.SIGINT, signal.SIGTERM]
 
-    def __init__(self, token, *, loop=None, cache_flags=None):
+    def __init__(
+        self, token, *, loop=None, cache_flags=None, json_codec=None, message_cache_policy=None,
+        cache_backends=None, disabled_events=None, listener_concurrency=16, listener_queue_size=0,
+        listener_overflow='block', error_hook=None, sync_concurrency=8, defer_sync=False,
+        rest_options=None
+    ):
         if loop is not None:
             self.loop = loop
         else:
@@ -159,7 +253,40 @@ class Client:
 
         self.cache_flags = cache_flags
 
-        self.rest = ClientClasses.RestSession(client=self)
+        if json_codec is not None:
+            self.json_codec = json_codec
+        else:
+            self.json_codec = default_json_codec
+
+        if message_cache_policy is not None:
+            self.message_cache_policy = message_cache_policy
+        else:
+            self.message_cache_policy = ClientClasses.MessageCachePolicy()
+
+        self.cache_backends = {}
+
+        if cache_backends is not None:
+            for name, factory in cache_backends.items():
+                self.cache_backends[CACHE_BACKEND_ALIASES.get(name, name)] = factory
+
+        if disabled_events is not None:
+            self.disabled_events = {name.lower() for name in disabled_events}
+        else:
+            self.disabled_events = set()
+
+        self.listener_concurrency = listener_concurrency
+        self.listener_queue_size = listener_queue_size
+        self.listener_overflow = listener_overflow
+        self.error_hook = error_hook
+        self.sync_concurrency = sync_concurrency
+        self.defer_sync = defer_sync
+
+        # Passed to RestSession, e.g. max_retries, global_limit,
+        # coalesce_gets and response_cache_ttl
+        if rest_options is None:
+            rest_options = {}
+
+        self.rest = ClientClasses.RestSession(client=self, **rest_options)
         self.channels = ClientClasses.ChannelState(client=self)
         self.guilds = ClientClasses.GuildState(client=self)
         self.invites = ClientClasses.InviteState(client=self)
@@ -174,6 +301,12 @@ class Client:
         self._listeners = {}
         self._waiters = {}
 
+        # Shared by every guild so syncing thousands of guilds never has
+        # more than sync_concurrency requests in flight
+        self._sync_semaphore = asyncio.Semaphore(sync_concurrency)
+        self._sync_queue = asyncio.Queue()
+        self._sync_workers = 0
+
     @classmethod
     def add_handled_signal(cls, signo):
         cls._handled_signals_.append(signo)
@@ -186,10 +319,16 @@ class Client:
         for guild in self.guilds:
             yield from guild.emojis
 
-    def register_listener(self, name, callback, *, sync=False, persistent=True):
+    def register_listener(
+        self, name, callback, *, sync=False, persistent=True, concurrency=None, maxsize=None,
+        overflow=None
+    ):
         name = name.lower()
         listeners = self._listeners.get(name.lower())
-        listener = _EventListener(name, self, callback, sync, persistent)
+        listener = _EventListener(
+            name, self, callback, sync, persistent, concurrency=concurrency, maxsize=maxsize,
+            overflow=overflow
+        )
 
         if listeners is None:
             listeners = self._listeners[name] = []
@@ -208,6 +347,22 @@ class Client:
 
         return listener
 
+    def listener_metrics(self):
+        return {
+            name: [listener.metrics() for listener in listeners]
+            for name, listeners in self._listeners.items()
+        }
+
+    def handle_listener_error(self, listener, exc):
+        if self.error_hook is not None:
+            return self.error_hook(listener, exc)
+
+        self.loop.call_exception_handler({
+            'message': f'Unhandled exception in listener for {listener.name!r}',
+            'exception': exc,
+            'listener': listener,
+        })
+
     def register_waiter(self, name, *, timeout=None, filter=None):
         name = name.lower()
         waiters = self._waiters.get(name)
@@ -246,19 +401,32 @@ class Client:
             for waiter in tuple(waiters):
                 await waiter._put(args)
 
+    def has_callbacks(self, name):
+        name = name.lower()
+        return bool(self._listeners.get(name)) or bool(self._waiters.get(name))
+
     async def dispatch(self, name, *args):
-        if self._events_ is not None:
-            event = self._events_.get(name.lower())
+        name = name.lower()
+        has_callbacks = self.has_callbacks(name)
+
+        # Events nobody listens for still update the cache but the
+        # event object is never built, disabled events do neither
+        if self._events_ is not None and name not in self.disabled_events:
+            event = self._events_.get(name)
 
             if event is not None:
-                evt = await event(self, *args)
+                evt = await event(self, *args, construct=has_callbacks)
                 args = (evt,)
 
-        await self._run_callbacks(name, *args)
+        if has_callbacks:
+            await self._run_callbacks(name, *args)
 
-    def on(self, name=None, *, sync=False):
+    def on(self, name=None, *, sync=False, concurrency=None, maxsize=None, overflow=None):
         def wrapped(func):
-            self.register_listener(name or func.__name__, func, sync=sync)
+            self.register_listener(
+                name or func.__name__, func, sync=sync, concurrency=concurrency,
+                maxsize=maxsize, overflow=overflow
+            )
             return func
         return wrapped
 
@@ -291,6 +459,70 @@ class Client:
 
         asyncio.run_coroutine_threadsafe(self.finalize(), loop=self.loop)
 
+    async def _sync_worker(self):
+        # Like listener workers, sync workers exit once the queue is empty
+        try:
+            while not self._sync_queue.empty():
+                guild, payload = self._sync_queue.get_nowait()
+
+                try:
+                    await guild.sync(payload)
+                except Exception as exc:
+                    self.loop.call_exception_handler({
+                        'message': f'Unhandled exception while syncing guild {guild.id}',
+                        'exception': exc,
+                        'guild': guild,
+                    })
+                finally:
+                    self._sync_queue.task_done()
+        finally:
+            self._sync_workers -= 1
+
+    async def sync_guild(self, guild, payload):
+        """Syncs a guild, in the background if `defer_sync` is True so
+        the caller (usually an event's dispatch) isn't held up by the
+        requests"""
+        if not self.defer_sync:
+            return await guild.sync(payload)
+
+        # Sync only looks at widget_enabled, the rest of the payload
+        # doesn't need to stay alive while the guild is queued
+        if 'widget_enabled' in payload:
+            payload = {'widget_enabled': payload['widget_enabled']}
+        else:
+            payload = {}
+
+        self._sync_queue.put_nowait((guild, payload))
+
+        if self._sync_workers < self.sync_concurrency:
+            self._sync_workers += 1
+            self.loop.create_task(self._sync_worker())
+
+    async def wait_synced(self):
+        """Waits until every deferred guild sync has finished"""
+        await self._sync_queue.join()
+
+    def _snapshot_header_(self):
+        return {}
+
+    def _restore_snapshot_header_(self, header):
+        pass
+
+    async def save_snapshot(self, path):
+        """Writes the cached users, guilds, channels, roles, emojis and
+        members to `path`, see `snekcord.snapshot.save_snapshot`"""
+        await save_snapshot(self, path)
+
+    def save_snapshot_sync(self, path):
+        """Blocking version of `save_snapshot` for shutdown, see
+        `snekcord.snapshot.save_snapshot_sync`"""
+        save_snapshot_sync(self, path)
+
+    def load_snapshot(self, path):
+        """Fills the caches from a snapshot written by `save_snapshot`,
+        see `snekcord.snapshot.load_snapshot`"""
+        return load_snapshot(self, path)
+
     async def close(self):
         await self.rest.aclose()
 
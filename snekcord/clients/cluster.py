@@ -0,0 +1,482 @@
+import asyncio
+import hmac
+import math
+import multiprocessing
+import secrets
+import time
+
+from .client import Client
+from .wsclient import WebSocketClient
+from .. import rest
+from ..exceptions import ClusterError
+from ..utils import Snowflake, default_json_codec
+from ..ws.shardws import IdentifyScheduler
+
+__all__ = ('ClusterConnection', 'RemoteIdentifyScheduler', 'ClusterWorker', 'ClusterCoordinator')
+
+
+class ClusterConnection:
+    """A connection between the coordinator and a worker that exchanges
+    newline delimited JSON, both sides can send requests and the other
+    side replies with the request's nonce
+
+    Requests look like `{"op": ..., "nonce": ..., "d": ...}` and replies
+    like `{"op": "reply", "nonce": ..., "d": ...}` or
+    `{"op": "reply", "nonce": ..., "error": ...}`
+    """
+
+    def __init__(self, reader, writer, handler, *, loop):
+        self.reader = reader
+        self.writer = writer
+        self.handler = handler
+        self.loop = loop
+
+        self.closed = self.loop.create_future()
+
+        self._nonce = 0
+        self._pending = {}
+        self._reader_task = None
+
+    def start(self):
+        self._reader_task = self.loop.create_task(self._read_loop())
+
+    async def close(self):
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+
+        self.writer.close()
+
+    async def _send(self, payload):
+        self.writer.write(default_json_codec.dumps_bytes(payload) + b'\n')
+        await self.writer.drain()
+
+    async def request(self, op, data=None, *, timeout=None):
+        self._nonce += 1
+        nonce = self._nonce
+
+        future = self._pending[nonce] = self.loop.create_future()
+
+        try:
+            await self._send({'op': op, 'nonce': nonce, 'd': data})
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(nonce, None)
+
+    async def _reply(self, payload):
+        reply = {'op': 'reply', 'nonce': payload['nonce']}
+
+        try:
+            reply['d'] = await self.handler(self, payload['op'], payload['d'])
+        except Exception as exc:
+            reply['error'] = f'{exc.__class__.__name__}: {exc}'
+
+        await self._send(reply)
+
+    async def _read_loop(self):
+        try:
+            while True:
+                line = await self.reader.readline()
+
+                if not line:
+                    break
+
+                payload = default_json_codec.loads(line)
+
+                if payload['op'] != 'reply':
+                    self.loop.create_task(self._reply(payload))
+                    continue
+
+                future = self._pending.get(payload['nonce'])
+
+                if future is None or future.done():
+                    continue
+
+                if 'error' in payload:
+                    future.set_exception(ClusterError(payload['error']))
+                else:
+                    future.set_result(payload.get('d'))
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionResetError('Cluster connection closed'))
+
+            if not self.closed.done():
+                self.closed.set_result(None)
+
+
+class RemoteIdentifyScheduler:
+    """An identify scheduler that asks the coordinator for permission,
+    used by workers so identifies are spaced out across processes"""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    async def acquire(self, shard_id):
+        await self.connection.request('identify', {'shard_id': shard_id})
+
+
+class ClusterWorker:
+    """Runs a client for a subset of the shards and answers queries
+    from the coordinator
+
+    Handlers registered with `register_handler` are called with the
+    request's data and can be queried by other workers through
+    `request_cluster`
+    """
+
+    def __init__(
+        self, token, *, cluster_id, shard_ids, shard_count, host, port, secret, loop=None,
+        gateway_url=None, client_class=WebSocketClient, client_kwargs=None
+    ):
+        if loop is not None:
+            self.loop = loop
+        else:
+            self.loop = asyncio.get_event_loop()
+
+        self.token = token
+        self.cluster_id = cluster_id
+        self.shard_ids = shard_ids
+        self.shard_count = shard_count
+        self.host = host
+        self.port = port
+        self.secret = secret
+        self.gateway_url = gateway_url
+        self.client_class = client_class
+        self.client_kwargs = client_kwargs or {}
+
+        self.client = None
+        self.connection = None
+
+        self.handlers = {
+            'ping': self._handle_ping,
+            'get_guild': self._handle_get_guild,
+        }
+
+    def register_handler(self, op, handler):
+        self.handlers[op] = handler
+
+    async def _handle(self, connection, op, data):
+        handler = self.handlers.get(op)
+
+        if handler is None:
+            raise ClusterError(f'Unknown op {op!r}')
+
+        result = handler(data)
+
+        if asyncio.iscoroutine(result):
+            result = await result
+
+        return result
+
+    async def _handle_ping(self, data):
+        latencies = {}
+
+        for shard_id, shard in self.client.shards.items():
+            if math.isfinite(shard.latency):
+                latencies[shard_id] = shard.latency
+
+        return {'cluster_id': self.cluster_id, 'time': time.time(), 'latencies': latencies}
+
+    async def _handle_get_guild(self, data):
+        guild = self.client.guilds.get(Snowflake(data['guild_id']))
+
+        if guild is None:
+            return None
+
+        return guild.to_dict()
+
+    async def request_cluster(self, cluster_id, op, data=None, *, timeout=None):
+        return await self.connection.request(
+            'forward', {'cluster_id': cluster_id, 'op': op, 'd': data}, timeout=timeout
+        )
+
+    async def fetch_guild(self, guild, *, timeout=None):
+        """Returns the raw data of a guild cached by any cluster or None"""
+        guild_id = Snowflake.try_snowflake(guild)
+
+        if self.client.get_shard_id(guild_id) in self.shard_ids:
+            guild = self.client.guilds.get(guild_id)
+
+            if guild is not None:
+                return guild.to_dict()
+
+            return None
+
+        return await self.connection.request(
+            'fetch_guild', {'guild_id': str(guild_id)}, timeout=timeout
+        )
+
+    async def start(self):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+
+        self.connection = ClusterConnection(reader, writer, self._handle, loop=self.loop)
+        self.connection.start()
+
+        await self.connection.request(
+            'hello', {'cluster_id': self.cluster_id, 'secret': self.secret}
+        )
+
+        self.client = self.client_class(
+            self.token, loop=self.loop, shard_count=self.shard_count, shard_ids=self.shard_ids,
+            gateway_url=self.gateway_url,
+            identify_scheduler=RemoteIdentifyScheduler(self.connection), cluster=self,
+            **self.client_kwargs
+        )
+
+        await self.client.connect()
+
+
+def _run_worker(token, kwargs):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    worker = ClusterWorker(token, loop=loop, **kwargs)
+    loop.run_until_complete(worker.start())
+
+    # The coordinator going away means the worker is orphaned
+    loop.run_until_complete(worker.connection.closed)
+
+
+class ClusterCoordinator:
+    """Splits `shard_count` shards across `cluster_count` worker
+    processes, schedules their identifies, checks their health and
+    routes queries between them
+
+    Workers that die, stop answering health checks or don't connect
+    within `startup_timeout` seconds of being spawned are restarted.
+    Passing `gateway_url` (and optionally `session_start_limit`) skips
+    the /gateway/bot request, which allows running against a local
+    fake gateway. Workers prove they were spawned by the coordinator
+    with `secret`, connections that don't are refused.
+    """
+
+    def __init__(
+        self, token, *, shard_count, cluster_count, loop=None, host='127.0.0.1', port=0,
+        gateway_url=None, session_start_limit=None, client_class=WebSocketClient,
+        client_kwargs=None, health_check_interval=15.0, health_check_timeout=10.0,
+        startup_timeout=60.0, secret=None
+    ):
+        if loop is not None:
+            self.loop = loop
+        else:
+            self.loop = asyncio.get_event_loop()
+
+        self.token = token
+        self.shard_count = shard_count
+        self.cluster_count = cluster_count
+        self.host = host
+        self.port = port
+        self.gateway_url = gateway_url
+        self.session_start_limit = session_start_limit
+        self.client_class = client_class
+        self.client_kwargs = client_kwargs or {}
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.startup_timeout = startup_timeout
+
+        if secret is not None:
+            self.secret = secret
+        else:
+            self.secret = secrets.token_hex(32)
+
+        self.identify_scheduler = None
+
+        self.processes = {}
+        self.spawned_at = {}
+        self.connections = {}
+        self.health = {}
+
+        self._server = None
+        self._health_task = None
+        self._mp_context = multiprocessing.get_context('spawn')
+
+    def get_shard_ids(self, cluster_id):
+        size, extra = divmod(self.shard_count, self.cluster_count)
+        start = cluster_id * size + min(cluster_id, extra)
+        end = start + size + (cluster_id < extra)
+        return list(range(start, end))
+
+    def get_cluster_id(self, shard_id):
+        for cluster_id in range(self.cluster_count):
+            shard_ids = self.get_shard_ids(cluster_id)
+
+            if shard_ids and shard_ids[0] <= shard_id <= shard_ids[-1]:
+                return cluster_id
+
+        raise ValueError(f'Shard {shard_id} does not belong to any cluster')
+
+    def get_guild_cluster_id(self, guild):
+        guild_id = Snowflake.try_snowflake(guild)
+        return self.get_cluster_id((guild_id >> 22) % self.shard_count)
+
+    async def _fetch_gateway(self):
+        client = Client(self.token, loop=self.loop)
+
+        try:
+            return await rest.get_gateway_bot.request(client.rest)
+        finally:
+            await client.close()
+
+    async def _handle(self, connection, op, data):
+        if op == 'hello':
+            secret = data.get('secret')
+
+            if not isinstance(secret, str) or not hmac.compare_digest(secret, self.secret):
+                self.loop.create_task(connection.close())
+                raise ClusterError('Invalid secret')
+
+            self.connections[data['cluster_id']] = connection
+            self.health[data['cluster_id']] = {'last_seen': time.time(), 'latencies': {}}
+            return None
+
+        if connection not in self.connections.values():
+            raise ClusterError(f'{op!r} sent before hello')
+
+        if op == 'identify':
+            await self.identify_scheduler.acquire(data['shard_id'])
+            return None
+
+        elif op == 'fetch_guild':
+            cluster_id = self.get_guild_cluster_id(data['guild_id'])
+            return await self.request(cluster_id, 'get_guild', data)
+
+        elif op == 'forward':
+            return await self.request(data['cluster_id'], data['op'], data['d'])
+
+        raise ClusterError(f'Unknown op {op!r}')
+
+    async def _accept(self, reader, writer):
+        connection = ClusterConnection(reader, writer, self._handle, loop=self.loop)
+        connection.start()
+
+    async def request(self, cluster_id, op, data=None, *, timeout=None):
+        connection = self.connections.get(cluster_id)
+
+        if connection is None:
+            raise ClusterError(f'Cluster {cluster_id} is not connected')
+
+        return await connection.request(op, data, timeout=timeout)
+
+    def spawn(self, cluster_id):
+        kwargs = {
+            'cluster_id': cluster_id,
+            'shard_ids': self.get_shard_ids(cluster_id),
+            'shard_count': self.shard_count,
+            'host': self.host,
+            'port': self.port,
+            'secret': self.secret,
+            'gateway_url': self.gateway_url,
+            'client_class': self.client_class,
+            'client_kwargs': self.client_kwargs,
+        }
+
+        process = self._mp_context.Process(
+            target=_run_worker, args=(self.token, kwargs), daemon=True
+        )
+        process.start()
+
+        self.processes[cluster_id] = process
+        self.spawned_at[cluster_id] = self.loop.time()
+
+        return process
+
+    async def _join(self, process):
+        # join() blocks, the other clusters' connections keep being
+        # served while the process shuts down
+        await self.loop.run_in_executor(None, process.join)
+
+    async def restart(self, cluster_id):
+        process = self.processes.get(cluster_id)
+
+        if process is not None and process.is_alive():
+            process.terminate()
+            await self._join(process)
+
+        connection = self.connections.pop(cluster_id, None)
+
+        if connection is not None:
+            await connection.close()
+
+        return self.spawn(cluster_id)
+
+    async def check_health(self, cluster_id):
+        process = self.processes[cluster_id]
+
+        if not process.is_alive():
+            await self.restart(cluster_id)
+            return False
+
+        if cluster_id not in self.connections:
+            if self.loop.time() - self.spawned_at[cluster_id] < self.startup_timeout:
+                # Still starting up
+                return True
+
+            # The worker is alive but never connected
+            await self.restart(cluster_id)
+            return False
+
+        try:
+            data = await self.request(cluster_id, 'ping', timeout=self.health_check_timeout)
+        except (asyncio.TimeoutError, ClusterError, ConnectionError):
+            await self.restart(cluster_id)
+            return False
+
+        self.health[cluster_id] = {'last_seen': time.time(), 'latencies': data['latencies']}
+
+        return True
+
+    async def _health_checker(self):
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            await asyncio.gather(
+                *(self.check_health(cluster_id) for cluster_id in tuple(self.processes))
+            )
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._accept, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+        session_start_limit = self.session_start_limit
+
+        if self.gateway_url is None:
+            gateway = await self._fetch_gateway()
+            self.gateway_url = gateway['url']
+
+            if session_start_limit is None:
+                session_start_limit = gateway['session_start_limit']
+
+        if session_start_limit is not None:
+            self.identify_scheduler = IdentifyScheduler.from_session_start_limit(
+                session_start_limit, loop=self.loop
+            )
+        else:
+            self.identify_scheduler = IdentifyScheduler(loop=self.loop)
+
+        for cluster_id in range(self.cluster_count):
+            self.spawn(cluster_id)
+
+        self._health_task = self.loop.create_task(self._health_checker())
+
+    async def close(self):
+        if self._health_task is not None:
+            self._health_task.cancel()
+
+        for connection in self.connections.values():
+            await connection.close()
+
+        for process in self.processes.values():
+            process.terminate()
+
+        await asyncio.gather(*(self._join(process) for process in self.processes.values()))
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def run_forever(self):
+        self.loop.run_until_complete(self.start())
+
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.run_until_complete(self.close())
@@ -1,10 +1,15 @@
+import asyncio
+import itertools
 import warnings
+from urllib.parse import urlparse
 
-from .client import Client
+from .chunker import ChunkScheduler
+from .client import Client, ClientClasses
 from .wsevents import WS_EVENTS, WS_EVENTS_INTENTS
 from .. import rest
 from ..flags import WebSocketIntents
-from ..ws.shardws import Shard
+from ..utils import Snowflake
+from ..ws.shardws import IdentifyScheduler, Shard, ShardCloseCode
 
 __all__ = ('WebSocketClient',)
 
@@ -16,15 +21,44 @@ class WebSocketClient(Client):
         self.shards = {}
         self.shard_id = kwargs.pop('shard_id', 0)
         self.shard_count = kwargs.pop('shard_count', 1)
+        self.shard_ids = kwargs.pop('shard_ids', None)
         self.timeouts = kwargs.pop('timeouts', None)
 
         intents = int(kwargs.pop('intents', 0))
         self.intents = WebSocketIntents.from_value(intents)
 
         self.auto_intents = kwargs.pop('auto_intents', True)
+        self.compress = kwargs.pop('compress', False)
+        self.reconnect = kwargs.pop('reconnect', True)
+
+        self.gateway_url = kwargs.pop('gateway_url', None)
+        self.identify_scheduler = kwargs.pop('identify_scheduler', None)
+        self.cluster = kwargs.pop('cluster', None)
 
         self.connected = False
 
+        self._snapshot_sessions = {}
+
+        self.chunk_requests = {}
+        self._chunk_nonces = itertools.count()
+
+        chunk_on_startup = kwargs.pop('chunk_on_startup', False)
+        chunk_order = kwargs.pop('chunk_order', 'member_count')
+        chunk_concurrency = kwargs.pop('chunk_concurrency', 1)
+        chunk_timeout = kwargs.pop('chunk_timeout', 60.0)
+        chunk_retries = kwargs.pop('chunk_retries', 1)
+
+        if chunk_on_startup:
+            self.chunk_scheduler = ChunkScheduler(
+                client=self, order=chunk_order, concurrency=chunk_concurrency,
+                timeout=chunk_timeout, retries=chunk_retries
+            )
+
+            if self.auto_intents:
+                self.intents.guild_members = True
+        else:
+            self.chunk_scheduler = None
+
         super().__init__(*args, **kwargs)
 
         if not self.authorization.gateway_allowed():
@@ -33,9 +67,65 @@ class WebSocketClient(Client):
     @property
     def user(self):
         if self.shards:
-            return self.shards[self.shard_id].user
+            shard = self.shards.get(self.shard_id)
+
+            if shard is None:
+                shard = next(iter(self.shards.values()))
+
+            return shard.user
         return None
 
+    def create_chunk_nonce(self):
+        return str(next(self._chunk_nonces))
+
+    def request_members_chunked(self, guilds, **kwargs):
+        """Requests the members of every guild through the gateway,
+        equivalent to calling `guild.members.request_chunked(**kwargs)`
+        for each guild
+
+        The requests are spread across the guilds' shards and paced by
+        each shard's send limiter.
+
+        Returns:
+            list[MemberChunkRequest]: The requests, in the same order as
+                the guilds
+        """
+        requests = []
+
+        for guild in guilds:
+            if not isinstance(guild, ClientClasses.Guild):
+                guild = self.guilds[Snowflake.try_snowflake(guild)]
+
+            requests.append(guild.members.request_chunked(**kwargs))
+
+        return requests
+
+    def _snapshot_header_(self):
+        header = super()._snapshot_header_()
+        header['shard_count'] = self.shard_count
+        header['shards'] = {
+            str(shard_id): {
+                'session_id': shard.ws.session_id,
+                'sequence': shard.ws.sequence,
+                'guilds': list(shard.ws.available_guilds),
+            }
+            for shard_id, shard in self.shards.items()
+            if shard.ws.session_id is not None
+        }
+        return header
+
+    def _restore_snapshot_header_(self, header):
+        super()._restore_snapshot_header_(header)
+
+        if header.get('shard_count', self.shard_count) == self.shard_count:
+            self._snapshot_sessions = {
+                int(shard_id): session for shard_id, session in header.get('shards', {}).items()
+            }
+
+    def get_shard_id(self, guild):
+        guild_id = Snowflake.try_snowflake(guild)
+        return (guild_id >> 22) % self.shard_count
+
     def _handle_intent(self, name):
         intent = WS_EVENTS_INTENTS.get(name)
 
@@ -61,19 +151,85 @@ class WebSocketClient(Client):
     def fetch_gateway(self):
         return rest.get_gateway.request(self.rest)
 
+    def fetch_gateway_bot(self):
+        return rest.get_gateway_bot.request(self.rest)
+
     async def connect(self, *args, **kwargs):
-        gateway = await self.fetch_gateway()
-        gateway_url = gateway['url'] + '?v=9'
+        if self.gateway_url is not None:
+            gateway_url = self.gateway_url
+        elif self.authorization.is_bot():
+            gateway = await self.fetch_gateway_bot()
+            gateway_url = gateway['url']
+
+            if self.identify_scheduler is None:
+                self.identify_scheduler = IdentifyScheduler.from_session_start_limit(
+                    gateway['session_start_limit'], loop=self.loop
+                )
+        else:
+            gateway = await self.fetch_gateway()
+            gateway_url = gateway['url']
+
+        if self.identify_scheduler is None:
+            self.identify_scheduler = IdentifyScheduler(loop=self.loop)
+
+        # The websocket client only takes the port as a keyword, local
+        # gateways like ws://127.0.0.1:8080 would be reached on port 80
+        port = urlparse(gateway_url).port
 
-        for shard_id in range(self.shard_count):
+        if port is not None:
+            kwargs.setdefault('port', port)
+
+        gateway_url += '?v=9'
+
+        if self.compress:
+            gateway_url += '&compress=zlib-stream'
+
+        if self.shard_ids is not None:
+            shard_ids = self.shard_ids
+        else:
+            shard_ids = range(self.shard_count)
+
+        for shard_id in shard_ids:
             shard = Shard(shard_id=shard_id, client=self)
             self.shards[shard_id] = shard
 
-        for shard in self.shards.values():
-            await shard.ws.connect(gateway_url, *args, **kwargs)
+            session = self._snapshot_sessions.pop(shard_id, None)
+
+            if session is not None:
+                # The shard resumes the session it had when the
+                # snapshot was saved
+                shard.ws.session_id = session['session_id']
+                shard.ws.sequence = session['sequence']
+                shard.ws.available_guilds.update(session['guilds'])
+
+        # Shards connect in parallel, the identify scheduler decides
+        # when each of them is allowed to identify
+        await asyncio.gather(
+            *(shard.connect(gateway_url, *args, **kwargs) for shard in self.shards.values())
+        )
 
         self.connected = True
 
+    async def close(self, *, resumable=False):
+        """Closes every shard and the rest session
+
+        Closing with code 1000 makes Discord invalidate the sessions,
+        `resumable=True` closes with 4000 instead so that sessions saved
+        with `save_snapshot` can be resumed by the next process.
+        """
+        if self.chunk_scheduler is not None:
+            self.chunk_scheduler.close()
+
+        if resumable:
+            code = ShardCloseCode.UNKNOWN_ERROR
+        else:
+            code = 1000
+
+        for shard in self.shards.values():
+            await shard.close(code)
+
+        await super().close()
+
     def run_forever(self, *args, **kwargs):
         self.loop.create_task(self.connect(*args, **kwargs))
         super().run_forever()
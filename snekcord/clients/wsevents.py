@@ -21,6 +21,16 @@ def register(name, *, intent=None):
     return wrapped
 
 
+def _get_changes(state, key, payload):
+    # The old values have to be collected before the payload is applied
+    obj = state.get(key)
+
+    if obj is None:
+        return None
+
+    return obj.diff(payload)
+
+
 class BaseEvent:
     _fields_ = ('shard', 'payload')
 
@@ -43,7 +53,7 @@ class BaseEvent:
         return f'<{self.__class__.__name__} {formatted}>'
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         raise NotImplementedError
 
     @property
@@ -56,19 +66,30 @@ class ChannelCreateEvent(BaseEvent):
     _fields_ = ('channel',)
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         channel = client.channels.upsert(payload)
+
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, channel=channel)
 
 
 @register('CHANNEL_UPDATE', intent='GUILDS')
 class ChannelUpdateEvent(BaseEvent):
-    _fields_ = ('channel',)
+    _fields_ = ('channel', 'changes')
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
+        if construct:
+            changes = _get_changes(client.channels, Snowflake(payload['id']), payload)
+
         channel = client.channels.upsert(payload)
-        return cls(shard=shard, payload=payload, channel=channel)
+
+        if not construct:
+            return None
+
+        return cls(shard=shard, payload=payload, channel=channel, changes=changes)
 
 
 @register('CHANNEL_DELETE', intent='GUILDS')
@@ -76,9 +97,13 @@ class ChannelDeleteEvent(BaseEvent):
     _fields_ = ('channel',)
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         channel = client.channels.upsert(payload)
         channel._delete()
+
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, channel=channel)
 
 
@@ -86,12 +111,15 @@ class ChannelPinsUpdate(BaseEvent):
     _fields_ = ('channel',)
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         channel = client.channels.get(Snowflake(payload['channel_id']))
 
         if channel is not None:
             channel.last_pin_timestamp = payload['last_pin_timestamp']
 
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, channel=channel)
 
     @property
@@ -114,9 +142,13 @@ class GuildCreateEvent(BaseEvent):
     _fields_ = ('guild', 'from_unavailable', 'joined')
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         guild = client.guilds.upsert(payload)
-        await guild.sync(payload)
+        await client.sync_guild(guild, payload)
+
+        if not construct:
+            return None
+
         return cls(
             shard=shard, payload=payload, guild=guild,
             from_unavailable=payload.pop('_from_unavailable_'), joined=payload.pop('_joined_')
@@ -125,13 +157,20 @@ class GuildCreateEvent(BaseEvent):
 
 @register('GUILD_UPDATE', intent='GUILDS')
 class GuildUpdateEvent(BaseEvent):
-    _fields_ = ('guild',)
+    _fields_ = ('guild', 'changes')
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
+        if construct:
+            changes = _get_changes(client.guilds, Snowflake(payload['id']), payload)
+
         guild = client.guilds.upsert(payload)
-        await guild.sync(payload)
-        return cls(shard=shard, payload=payload, guild=guild)
+        await client.sync_guild(guild, payload)
+
+        if not construct:
+            return None
+
+        return cls(shard=shard, payload=payload, guild=guild, changes=changes)
 
 
 @register('GUILD_UNAVAILABLE', intent='GUILDS')
@@ -139,8 +178,12 @@ class GuildUnavailableEvent(BaseEvent):
     _fields_ = ('guild',)
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         guild = client.guilds.upsert(payload)
+
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, guild=guild)
 
 
@@ -149,9 +192,13 @@ class GuildDeleteEvent(BaseEvent):
     _fields_ = ('guild',)
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         guild = client.guilds.upsert(payload)
         guild._delete()
+
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, guild=guild)
 
 
@@ -160,13 +207,16 @@ class GuildBanAddEvent(BaseEvent):
     _fields_ = ('guild', 'ban')
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         ban = None
         guild = client.guilds.get(Snowflake(payload['guild_id']))
 
         if guild is not None:
             ban = guild.bans.upsert(payload)
 
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, guild=guild, ban=ban)
 
     @property
@@ -179,7 +229,7 @@ class GuildBanRemoveEvent(BaseEvent):
     _fields_ = ('guild', 'ban')
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         ban = None
         guild = client.guilds.get(Snowflake(payload['guild_id']))
 
@@ -187,6 +237,9 @@ class GuildBanRemoveEvent(BaseEvent):
             ban = guild.bans.upsert(payload)
             ban._delete()
 
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, guild=guild, ban=ban)
 
     @property
@@ -199,7 +252,7 @@ class GuildEmojisUpdateEvent(BaseEvent):
     _fields_ = ('guild',)
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         guild = client.guilds.get(Snowflake(payload['guild_id']))
 
         if guild is not None:
@@ -211,6 +264,9 @@ class GuildEmojisUpdateEvent(BaseEvent):
             for emoji_id in set(guild.emojis.keys()) - emojis:
                 del guild.emojis.mapping[emoji_id]
 
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, guild=guild)
 
     @property
@@ -228,13 +284,16 @@ class GuildMemberAddEvent(BaseEvent):
     _fields_ = ('guild', 'member')
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         member = None
         guild = client.guilds.get(Snowflake(payload['guild_id']))
 
         if guild is not None:
             member = guild.members.upsert(payload)
 
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, guild=guild, member=member)
 
     @property
@@ -242,19 +301,59 @@ class GuildMemberAddEvent(BaseEvent):
         return self.guild is None
 
 
+@register('GUILD_MEMBERS_CHUNK')
+class GuildMembersChunkEvent(BaseEvent):
+    _fields_ = ('guild', 'members', 'chunk_index', 'chunk_count', 'request')
+
+    @classmethod
+    async def execute(cls, client, shard, payload, *, construct=True):
+        members = []
+        guild = client.guilds.get(Snowflake(payload['guild_id']))
+
+        if guild is not None:
+            members = [guild.members.upsert(member) for member in payload['members']]
+
+        request = client.chunk_requests.get(payload.get('nonce'))
+
+        if request is not None:
+            request._add_chunk(payload, members)
+
+        if not construct:
+            return None
+
+        return cls(
+            shard=shard, payload=payload, guild=guild, members=members,
+            chunk_index=payload['chunk_index'], chunk_count=payload['chunk_count'],
+            request=request
+        )
+
+    @property
+    def partial(self):
+        return self.guild is None
+
+
 @register('GUILD_MEMBER_UPDATE', intent='GUILD_MEMBERS')
 class GuildMemberUpdateEvent(BaseEvent):
-    _fields_ = ('guild', 'member')
+    _fields_ = ('guild', 'member', 'changes')
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         member = None
+        changes = None
         guild = client.guilds.get(Snowflake(payload['guild_id']))
 
         if guild is not None:
+            if construct:
+                changes = _get_changes(
+                    guild.members, Snowflake(payload['user']['id']), payload
+                )
+
             member = guild.members.upsert(payload)
 
-        return cls(shard=shard, payload=payload, guild=guild, member=member)
+        if not construct:
+            return None
+
+        return cls(shard=shard, payload=payload, guild=guild, member=member, changes=changes)
 
     @property
     def partial(self):
@@ -266,7 +365,7 @@ class GuildMemberRemoveEvent(BaseEvent):
     _fields_ = ('user', 'guild', 'member')
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         member = None
         user = client.users.upsert(payload['user'])
         guild = client.guilds.get(Snowflake(payload['guild_id']))
@@ -277,6 +376,9 @@ class GuildMemberRemoveEvent(BaseEvent):
             if member is not None:
                 member._delete()
 
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, user=user, guild=guild, member=member)
 
     @property
@@ -289,13 +391,16 @@ class GuildRoleCreateEvent(BaseEvent):
     _fields_ = ('guild', 'role')
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         role = None
         guild = client.guilds.get(Snowflake(payload['guild_id']))
 
         if guild is not None:
             role = guild.roles.upsert(payload['role'])
 
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, guild=guild, role=role)
 
     @property
@@ -305,20 +410,29 @@ class GuildRoleCreateEvent(BaseEvent):
 
 @register('GUILD_ROLE_UPDATE', intent='GUILDS')
 class GuildRoleUpdateEvent(BaseEvent):
-    _fields_ = ('guild', 'role')
+    _fields_ = ('guild', 'role', 'changes')
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         role = None
+        changes = None
         guild = client.guilds.get(Snowflake(payload['guild_id']))
 
         if guild is not None:
+            if construct:
+                changes = _get_changes(
+                    guild.roles, Snowflake(payload['role']['id']), payload['role']
+                )
+
             role = guild.roles.upsert(payload['role'])
 
-        return cls(shard=shard, payload=payload, guild=guild, role=role)
+        if not construct:
+            return None
+
+        return cls(shard=shard, payload=payload, guild=guild, role=role, changes=changes)
 
     @property
-    def pertial(self):
+    def partial(self):
         return self.guild is None
 
 
@@ -327,7 +441,7 @@ class GuildRoleDeleteEvent(BaseEvent):
     _fields_ = ('guild', 'role')
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         role = None
         guild = client.guilds.get(Snowflake(payload['guild_id']))
 
@@ -337,6 +451,9 @@ class GuildRoleDeleteEvent(BaseEvent):
             if role is not None:
                 role._delete()
 
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, guild=guild, role=role)
 
     @property
@@ -364,8 +481,12 @@ class InviteCreateEvent(BaseEvent):
     _fields_ = ('invite',)
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         invite = client.invites.upsert(payload)
+
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, invite=invite)
 
 
@@ -374,12 +495,15 @@ class InviteDeleteEvent(BaseEvent):
     _fields_ = ('invite',)
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         invite = client.invites.get(payload['code'])
 
         if invite is not None:
             invite._delete()
 
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, invite=invite)
 
     @property
@@ -391,13 +515,16 @@ class MessageCreateEvent(BaseEvent):
     _fields_ = ('channel', 'message')
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         message = None
         channel = client.channels.get(Snowflake(payload['channel_id']))
 
         if channel is not None:
             message = channel.messages.upsert(payload)
-            channel._json_data_['last_message_id'] = message.id
+            channel.update({'last_message_id': message.id})
+
+        if not construct:
+            return None
 
         return cls(shard=shard, payload=payload, channel=channel, message=message)
 
@@ -420,13 +547,16 @@ class MessageUpdateEvent(BaseEvent):
     _fields_ = ('channel', 'message')
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         message = None
         channel = client.channels.get(Snowflake(payload['channel_id']))
 
         if channel is not None:
             message = channel.messages.upsert(payload)
 
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, channel=channel, message=message)
 
     @property
@@ -448,7 +578,7 @@ class MessageDeleteEvent(BaseEvent):
     _fields_ = ('channel', 'message')
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         message = None
         channel = client.channels.get(Snowflake(payload['channel_id']))
 
@@ -458,6 +588,9 @@ class MessageDeleteEvent(BaseEvent):
             if message is not None:
                 message._delete()
 
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, channel=channel, message=message)
 
     @property
@@ -480,7 +613,7 @@ class GuildMessageDeleteBulkEvent(BaseEvent):
     _fields_ = ('channel', 'messages')
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         messages = []
         channel = client.channels.get(Snowflake(payload['channel_id']))
 
@@ -491,6 +624,9 @@ class GuildMessageDeleteBulkEvent(BaseEvent):
                 if message is not None:
                     messages.append(message)
 
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, channel=channel, messages=messages)
 
     @property
@@ -502,7 +638,7 @@ class MessageReactionAddEvent(BaseEvent):
     _fields_ = ('channel', 'message', 'reactions', 'user')
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         message = None
         reactions = None
         channel = client.channels.get(Snowflake(payload['channel_id']))
@@ -513,6 +649,9 @@ class MessageReactionAddEvent(BaseEvent):
             if message is not None:
                 reactions = message.reactions.upsert(payload)
 
+        if not construct:
+            return None
+
         return cls(
             shard=shard, payload=payload, channel=channel, message=message,
             reactions=reactions, user=user
@@ -538,8 +677,12 @@ class StageInstanceCreateEvent(BaseEvent):
     _fields_ = ('stage',)
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         stage = client.stages.upsert(payload)
+
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, stage=stage)
 
 
@@ -548,8 +691,12 @@ class StageInstanceUpdateEvent(BaseEvent):
     _fields_ = ('stage',)
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         stage = client.stages.upsert(payload)
+
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, stage=stage)
 
 
@@ -558,7 +705,11 @@ class StageInstanceDeleteEvent(BaseEvent):
     _fields_ = ('stage',)
 
     @classmethod
-    async def execute(cls, client, shard, payload):
+    async def execute(cls, client, shard, payload, *, construct=True):
         stage = client.stages.upsert(payload)
         stage._delete()
+
+        if not construct:
+            return None
+
         return cls(shard=shard, payload=payload, stage=stage)
@@ -54,7 +54,8 @@ class Bitset:
     @classmethod
     def from_value(cls, value):
         self = cls.__new__(cls)
-        self.value = value
+        # Discord sends 53+ bit values such as permissions as strings
+        self.value = int(value)
         return self
 
     @classmethod
@@ -42,11 +42,11 @@ class BaseObject(JsonObject):
     def cache(self):
         """Stores the object in the state's cache"""
         self.state.mapping[self.id] = self
-        self.cached = True
+        self.cached = self.id in self.state.mapping
 
     def uncache(self):
         """Removes the object from the state's cache"""
-        del self.state.mapping[self.id]
+        self.state.mapping.pop(self.id, None)
         self.cached = False
 
     def fetch(self):
@@ -1,7 +1,9 @@
 from .baseobject import BaseObject
+from .memberobject import GuildMember
 from .. import rest
 from ..clients.client import ClientClasses
 from ..enums import ChannelType
+from ..flags import Permissions
 from ..utils import JsonArray, JsonField, Snowflake, undefined
 
 
@@ -33,6 +35,27 @@ class GuildChannel(BaseObject):
     def parent(self):
         return self.state.client.channels.get(self.parent_id)
 
+    def permissions_for(self, member):
+        """Returns the member's permissions in the channel, the member's
+        guild permissions with the channel's overwrites applied
+
+        Returns:
+            Optional[Permissions]: The permissions, None if the member
+                isn't cached
+        """
+        if not isinstance(member, GuildMember):
+            guild = self.guild
+
+            if guild is None:
+                return None
+
+            member = guild.members.get(Snowflake.try_snowflake(member))
+
+            if member is None:
+                return None
+
+        return Permissions.from_value(member._get_permissions_value(self))
+
     def _delete(self):
         super()._delete()
         if self.guild is not None:
@@ -69,7 +92,7 @@ class GuildChannel(BaseObject):
                 overwrites.add(self.permissions.upsert(overwrite).id)
 
             for overwrite_id in set(self.permissions.keys()) - overwrites:
-                del self.permissions.mapping[overwrite_id]
+                self.permissions[overwrite_id]._delete()
 
         return self
 
@@ -153,6 +176,8 @@ class TextChannel(GuildChannel):
 
 
 class CategoryChannel(GuildChannel):
+    __slots__ = ()
+
     def __str__(self):
         return f'#{self.name}'
 
@@ -172,6 +197,8 @@ class CategoryChannel(GuildChannel):
 
 
 class VoiceChannel(GuildChannel):
+    __slots__ = ()
+
     bitrate = JsonField('bitrate')
     user_limit = JsonField('user_limit')
 
@@ -222,6 +249,8 @@ class VoiceChannel(GuildChannel):
 
 
 class DMChannel(BaseObject):
+    __slots__ = ()
+
     last_message_id = JsonField('last_message_id', Snowflake)
     type = JsonField('type', ChannelType.get_enum)
     _recipients = JsonArray('recipients')
@@ -22,6 +22,8 @@ class EmbedThumbnail(JsonObject):
 
         width int: The thumbnail's width
     """
+    __slots__ = ()
+
     url = JsonField('url')
     proxy_url = JsonField('proxy_url')
     height = JsonField('height')
@@ -40,6 +42,8 @@ class EmbedVideo(JsonObject):
 
         width int: The video's width
     """
+    __slots__ = ()
+
     url = JsonField('url')
     proxy_url = JsonField('proxy_url')
     height = JsonField('height')
@@ -58,6 +62,8 @@ class EmbedImage(JsonObject):
 
         width int: The image's width
     """
+    __slots__ = ()
+
     url = JsonField('url')
     proxy_url = JsonField('proxy_url')
     height = JsonField('height')
@@ -72,6 +78,8 @@ class EmbedProvider(JsonObject):
 
         url str: The provider's url
     """
+    __slots__ = ()
+
     name = JsonField('name')
     url = JsonField('url')
 
@@ -86,6 +94,8 @@ class EmbedAuthor(JsonObject):
 
         proxy_icon_url str: The author's proxy icon url
     """
+    __slots__ = ()
+
     name = JsonField('name')
     icon_url = JsonField('icon_url')
     proxy_icon_url = JsonField('proxy_icon_url')
@@ -101,6 +111,8 @@ class EmbedFooter(JsonObject):
 
         proxy_icon_url str: The footer's proxy icon url
     """
+    __slots__ = ()
+
     text = JsonField('text')
     icon_url = JsonField('icon_url')
     proxy_icon_url = JsonField('proxy_icon_url')
@@ -116,6 +128,8 @@ class EmbedField(JsonObject):
 
         inline bool: Whether or not the field is inline
     """
+    __slots__ = ()
+
     name = JsonField('name')
     value = JsonField('value')
     inline = JsonField('inline')
@@ -151,7 +165,9 @@ class Embed(JsonObject):
 
         fields list[EmbedField]: The embed's fields
     """
-    title = JsonField('title'),
+    __slots__ = ()
+
+    title = JsonField('title')
     type = JsonField('type', EmbedType.get_enum, default=EmbedType.RICH)
     description = JsonField('description')
     url = JsonField('url')
@@ -218,17 +234,21 @@ class EmbedBuilder:
             EmbedBuilder: The builder
         """
         self = cls.__new__(cls)
-        self.embed = copy.copy(embed)
+        self.embed = Embed.unmarshal(copy.deepcopy(embed._json_data_))
         return self
 
+    def _clear(self, key):
+        self.embed._json_data_.pop(key, None)
+        self.embed._invalidate_(key)
+
     def set_title(self, title):
         """Sets the embed's title"""
-        self.embed._json_data_['title'] = str(title)
+        self.embed.update({'title': str(title)})
         return self
 
     def clear_title(self):
         """Clears the embed's title"""
-        self.embed._json_data_.pop('type', None)
+        self._clear('title')
         return self
 
     def set_type(self, type):
@@ -236,33 +256,33 @@ class EmbedBuilder:
         if type is not None:
             type = EmbedType.get_enum(type)
 
-        self.embed._json_data_['type'] = type
+        self.embed.update({'type': type})
 
         return self
 
     def clear_type(self):
         """Clears embed's type"""
-        self.embed._json_fields_.pop('type', None)
+        self._clear('type')
         return self
 
     def set_description(self, description):
         """Sets the embed's description"""
-        self.embed._json_data_['description'] = str(description)
+        self.embed.update({'description': str(description)})
         return self
 
     def clear_description(self):
         """Clears the embed's description"""
-        self.embed._json_fields_.pop('description', None)
+        self._clear('description')
         return self
 
     def set_url(self, url):
         """Sets the embed's url"""
-        self.embed._json_data_['url'] = str(url)
+        self.embed.update({'url': str(url)})
         return self
 
     def clear_url(self):
         """Clears the embed's url"""
-        self.embed._json_fields_.pop('url', None)
+        self._clear('url')
         return self
 
     def set_timestamp(self, timestamp):
@@ -282,23 +302,23 @@ class EmbedBuilder:
                 f'got {timestamp.__class__.__name__!r}'
             )
 
-        self.embed._json_data_['timestamp'] = timestamp.isoformat()
+        self.embed.update({'timestamp': timestamp.isoformat()})
 
         return self
 
     def clear_timestamp(self):
         """Clears the embed's timestamp"""
-        self.embed._json_fields_.pop('timestamp', None)
+        self._clear('timestamp')
         return self
 
     def set_color(self, color):
         """Sets the embed's color"""
-        self.embed._json_data_['color'] = int(color)
+        self.embed.update({'color': int(color)})
         return self
 
     def clear_color(self):
         """Clears the embed's color"""
-        self.embed._json_data_.pop('color', None)
+        self._clear('color')
         return self
 
     def set_footer(self, text, *, icon_url=None, proxy_icon_url=None):
@@ -317,7 +337,7 @@ class EmbedBuilder:
 
     def clear_footer(self):
         """Clears the embed's footer"""
-        self.embed._json_data_['footer'] = None
+        self._clear('footer')
         return self
 
     def _attachment(self, url=None, proxy_url=None, height=None, width=None):
@@ -344,7 +364,7 @@ class EmbedBuilder:
 
     def clear_image(self):
         """Clears the embed's image"""
-        self.embed._json_data_.pop('image', None)
+        self._clear('image')
         return self
 
     def set_thumbnail(self, *, url=None, proxy_url=None, height=None, width=None):
@@ -354,7 +374,7 @@ class EmbedBuilder:
 
     def clear_thumbnail(self):
         """Clears the embed's thumbnail"""
-        self.embed._json_data_.pop('thumbnail', None)
+        self._clear('thumbnail')
         return self
 
     def set_video(self, *, url=None, proxy_url=None, height=None, width=None):
@@ -364,7 +384,7 @@ class EmbedBuilder:
 
     def clear_video(self):
         """Clears the embed's video"""
-        self.embed._json_data_.pop('video', None)
+        self._clear('video')
         return self
 
     def set_provider(self, *, name=None, url=None):
@@ -383,7 +403,7 @@ class EmbedBuilder:
 
     def clear_provider(self):
         """Clears the embed's provider"""
-        self.embed._json_data_['provider'] = None
+        self._clear('provider')
         return self
 
     def set_author(self, name, *, icon_url=None, proxy_icon_url=None):
@@ -406,25 +426,29 @@ class EmbedBuilder:
 
     def clear_author(self):
         """Clears the embed's author"""
-        self.embed._json_data_.pop('author', None)
+        self._clear('author')
         return self
 
     def _field(self, name, value, inline=None):
-        json = {'name': str(name), 'valiue': str(value)}
+        json = {'name': str(name), 'value': str(value)}
 
         if inline is not None:
             json['inline'] = bool(inline)
 
-        return EmbedField.unmarshal(json)
+        return json
+
+    def _fields(self):
+        self.embed._invalidate_('fields')
+        return self.embed._json_data_.setdefault('fields', [])
 
     def add_field(self, name, value, *, inline=None):
         """Adds a field to the embed"""
-        self.embed.fields.append(self._field(name, value, inline))
+        self._fields().append(self._field(name, value, inline))
         return self
 
     def insert_field(self, index, name, value, *, inline=None):
         """Inserts a field into the embed at `index`"""
-        self.embed.fields.insert(index, self._field(name, value, inline))
+        self._fields().insert(index, self._field(name, value, inline))
         return self
 
     def extend_fields(self, *fields):
@@ -446,7 +470,7 @@ class EmbedBuilder:
 
     def clear_fields(self):
         """Clears the fields of the embed"""
-        self.embed.fields.clear()
+        self._fields().clear()
         return self
 
     def send_to(self, channel, **kwargs):
@@ -9,6 +9,8 @@ __all__ = ('GuildEmoji', 'PartialGuildEmoji', 'UnicodeEmoji', 'PartialUnicodeEmo
 
 
 class BaseEmoji:
+    __slots__ = ()
+
     @property
     def image(self):
         raise NotImplementedError
@@ -18,6 +20,8 @@ class BaseEmoji:
 
 
 class _BaseGuildEmoji(BaseEmoji):
+    __slots__ = ()
+
     def __str__(self):
         if self.animated:
             return f'<a:{self.name}:{self.id}>'
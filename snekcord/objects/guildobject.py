@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 
 from .baseobject import BaseObject
@@ -23,9 +24,13 @@ __all__ = ('Guild', 'GuildBan', 'WelcomeScreen', 'WelcomeScreenChannel')
 class Guild(BaseObject):
     __slots__ = (
         'unsynced', 'widget', 'vanity_url', 'welcome_screen', 'channels', 'emojis', 'roles',
-        'members', 'bans', 'integrations'
+        'members', 'bans', 'integrations', '_permission_cache'
     )
 
+    # The number of members whose permissions are cached, the cache
+    # starts over once it is full
+    PERMISSION_CACHE_SIZE = 10000
+
     name = JsonField('name')
     features = JsonArray('features', GuildFeature.get_enum)
     member_count = JsonField('approximate_member_count')
@@ -72,6 +77,9 @@ class Guild(BaseObject):
 
         self.unsynced = True
 
+        # member id -> channel id (None for the guild) -> permissions
+        self._permission_cache = {}
+
         self.widget = ClientClasses.GuildWidget.unmarshal(guild=self)
         self.vanity_url = ClientClasses.GuildVanityURL.unmarshal(guild=self)
         self.welcome_screen = ClientClasses.WelcomeScreen.unmarshal(guild=self)
@@ -120,22 +128,31 @@ class Guild(BaseObject):
         return None
 
     async def sync(self, payload):
-        cache_flags = self.state.client.cache_flags
+        client = self.state.client
+        cache_flags = client.cache_flags
 
         if cache_flags is None:
             return
 
+        fetches = []
+
         if self.unsynced and cache_flags.guild_bans:
-            await self.bans.fetch_all()
+            fetches.append(self.bans.fetch_all)
 
         if self.unsynced and cache_flags.guild_integrations:
-            await self.integrations.fetch_all()
+            fetches.append(self.integrations.fetch_all)
 
         if self.unsynced and cache_flags.guild_invites:
-            await self.fetch_invites()
+            fetches.append(self.fetch_invites)
 
         if 'widget_enabled' not in payload and cache_flags.guild_widget:
-            await self.widget.fetch()
+            fetches.append(self.widget.fetch)
+
+        async def fetch(func):
+            async with client._sync_semaphore:
+                await func()
+
+        await asyncio.gather(*(fetch(func) for func in fetches))
 
         self.unsynced = False
 
@@ -331,9 +348,18 @@ class Guild(BaseObject):
     async def delete(self):
         return self.state.delete(self.id)
 
+    def _invalidate_permissions(self, member_id=None):
+        if member_id is None:
+            self._permission_cache.clear()
+        else:
+            self._permission_cache.pop(member_id, None)
+
     def update(self, data):
         super().update(data)
 
+        if 'owner_id' in data:
+            self._invalidate_permissions()
+
         widget_data = {}
 
         if 'widget_channel_id' in data:
@@ -369,7 +395,8 @@ class Guild(BaseObject):
                 roles.add(self.roles.upsert(role).id)
 
             for role_id in set(self.roles.keys()) - roles:
-                del self.emojis.mapping[role_id]
+                del self.roles.mapping[role_id]
+                self.roles._drop_role(role_id)
 
         if 'members' in data:
             for member in data['members']:
@@ -404,6 +431,7 @@ class GuildBan(BaseObject):
         if 'user' in data:
             self.user = self.state.client.users.upsert(data['user'])
             self._json_data_['id'] = self.user.id
+            self._invalidate_('id')
 
         return self
 
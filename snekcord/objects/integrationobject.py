@@ -8,6 +8,8 @@ __all__ = ('IntegrationAccount', 'IntegrationApplication', 'Integration')
 
 
 class IntegrationAccount(JsonObject):
+    __slots__ = ()
+
     id = JsonField('id', Snowflake)
     name = JsonField('name')
 
@@ -21,7 +21,7 @@ class Invite(BaseObject):
     max_uses = JsonField('max_uses')
     max_age = JsonField('max_age')
     temporary = JsonField('temporary')
-    created_at = JsonField('temporary', datetime.fromisoformat)
+    created_at = JsonField('created_at', datetime.fromisoformat)
 
     def __init__(self, *, state):
         super().__init__(state=state)
@@ -36,22 +36,62 @@ class GuildMember(BaseObject):
         if 'permissions' in self._json_data_:
             return Permissions.from_value(self._json_data_['permissions'])
 
+        return Permissions.from_value(self._get_permissions_value(None))
+
+    def _compute_permissions_value(self):
         guild = self.guild
 
         if guild.owner_id == self.id:
-            return Permissions.all()
+            return Permissions.all().value
+
+        value = 0
 
-        value = guild.roles.everyone.permissions.value
+        everyone = guild.roles.everyone
+        if everyone is not None:
+            value = everyone.permissions.value
 
         for role in self.roles:
             value |= role.permissions.value
 
-        permissions = Permissions.from_value(value)
+        if Permissions.from_value(value).administrator:
+            return Permissions.all().value
+
+        return value
+
+    def _get_permissions_value(self, channel):
+        # Permissions are cached per member and channel until a role,
+        # overwrite, the guild's owner or the member's roles change
+        if channel is None:
+            key = None
+        else:
+            key = channel.id
+
+        if not self.cached:
+            if channel is None:
+                return self._compute_permissions_value()
+            return channel.permissions._apply_overwrites(self)
+
+        cache = self.guild._permission_cache
+        values = cache.get(self.id)
+
+        if values is None:
+            if len(cache) >= self.guild.PERMISSION_CACHE_SIZE:
+                cache.clear()
 
-        if permissions.administrator:
-            return Permissions.all()
+            values = cache[self.id] = {}
+        else:
+            try:
+                return values[key]
+            except KeyError:
+                pass
 
-        return permissions
+        if channel is None:
+            value = self._compute_permissions_value()
+        else:
+            value = channel.permissions._apply_overwrites(self)
+
+        values[key] = value
+        return value
 
     @property
     def mention(self):
@@ -120,9 +160,28 @@ class GuildMember(BaseObject):
         if 'user' in data:
             self.user = self.state.client.users.upsert(data['user'])
             self._json_data_['id'] = self.user.id
+            self._invalidate_('id')
 
         if 'roles' in data:
-            for role in data['roles']:
-                self.roles.add_key(Snowflake(role))
+            role_ids = {Snowflake(role) for role in data['roles']}
+
+            if self.cached:
+                old_role_ids = self.roles._keys
+                self.guild.roles._unindex_member(self.id, old_role_ids - role_ids)
+                self.guild.roles._index_member(self.id, role_ids - old_role_ids)
+
+            self.roles._keys = role_ids
+            self.guild._invalidate_permissions(self.id)
 
         return self
+
+    def cache(self):
+        super().cache()
+
+        if self.cached:
+            self.guild.roles._index_member(self.id, self.roles._keys)
+
+    def uncache(self):
+        super().uncache()
+        self.guild.roles._unindex_member(self.id, self.roles._keys)
+        self.guild._invalidate_permissions(self.id)
@@ -137,6 +137,15 @@ class Message(BaseObject):
         if self.pinned:
             self.channel.pins.remove_key(self.id)
 
+    def cache(self):
+        super().cache()
+        if self.cached:
+            self.state.client.message_cache_policy.add(self)
+
+    def uncache(self):
+        super().uncache()
+        self.state.client.message_cache_policy.remove(self)
+
     def update(self, data):
         super().update(data)
 
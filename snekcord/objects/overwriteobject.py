@@ -7,6 +7,8 @@ __all__ = ('PermissionOverwrite',)
 
 
 class PermissionOverwrite(BaseObject):
+    __slots__ = ()
+
     type = JsonField('type', PermissionOverwriteType.get_enum)
     allow = JsonField('allow', Permissions.from_value)
     deny = JsonField('deny', Permissions.from_value)
@@ -15,6 +17,21 @@ class PermissionOverwrite(BaseObject):
     def channel(self):
         return self.state.channel
 
+    def _invalidate_permissions(self):
+        guild = self.channel.guild
+
+        if guild is not None:
+            guild._invalidate_permissions()
+
+    def _delete(self):
+        super()._delete()
+        self._invalidate_permissions()
+
+    def update(self, data):
+        super().update(data)
+        self._invalidate_permissions()
+        return self
+
     @property
     def target(self):
         if self.type == PermissionOverwriteType.MEMBER:
@@ -1,6 +1,7 @@
 from .baseobject import BaseObject
 from .. import rest
-from ..states.basestate import BaseSubState
+from ..clients.client import ClientClasses
+from ..states.basestate import BaseSubState, Paginator
 from ..utils import JsonField, Snowflake
 
 __all__ = ('Reactions',)
@@ -42,11 +43,40 @@ class Reactions(BaseSubState, BaseObject):
                 'channel_id': self.state.message.channel.id,
                 'message_id': self.state.message.id,
                 'emoji': self.emoji.to_reaction()
-            }
+            },
+            params=params
         )
 
         return [self.upsert(user) for user in data]
 
+    def iterate(self, *, after=None, limit=None, page_size=100, cache=True):
+        """Returns an async iterator over the users that reacted in user
+        id order, users are not cached if `cache` is False
+
+        Returns:
+            Paginator: The iterator
+        """
+        async def fetch(params):
+            return await rest.get_reactions.request(
+                self.state.client.rest,
+                {
+                    'channel_id': self.state.message.channel.id,
+                    'message_id': self.state.message.id,
+                    'emoji': self.emoji.to_reaction()
+                },
+                params=params
+            )
+
+        if cache:
+            convert = self.upsert
+        else:
+            def convert(data):
+                return ClientClasses.User.unmarshal(data, state=self.superstate)
+
+        return Paginator(
+            fetch, convert, direction='after', cursor=after, limit=limit, page_size=page_size
+        )
+
     async def add(self):
         await self.state.add(self.emoji)
 
@@ -90,5 +120,6 @@ class Reactions(BaseSubState, BaseObject):
         if 'emoji' in data:
             self.emoji = self.state.message.guild.emojis.upsert(data['emoji'])
             self._json_data_['id'] = self.emoji.id
+            self._invalidate_('id')
 
         return self
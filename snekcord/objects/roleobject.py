@@ -1,5 +1,6 @@
 from .baseobject import BaseObject
 from .. import rest
+from ..clients.client import ClientClasses
 from ..flags import Permissions
 from ..utils import JsonField, JsonObject, Snowflake, undefined
 
@@ -7,12 +8,16 @@ __all__ = ('RoleTags', 'Role')
 
 
 class RoleTags(JsonObject):
-    bot_id = JsonField('bot_id', Snowflake),
+    __slots__ = ()
+
+    bot_id = JsonField('bot_id', Snowflake)
     integration_id = JsonField('integration_id', Snowflake)
     premium_subscriber = JsonField('premium_subscriber')
 
 
 class Role(BaseObject):
+    __slots__ = ()
+
     raw_name = JsonField('name')
     color = JsonField('color')
     hoist = JsonField('hoist')
@@ -46,6 +51,23 @@ class Role(BaseObject):
             return '@everyone'
         return f'<@&{self.id}>'
 
+    @property
+    def members(self):
+        """The cached members that have the role, every cached member
+        for the everyone role"""
+        if self.id == self.guild.id:
+            return self.guild.members
+        return ClientClasses.RoleMemberState(superstate=self.guild.members, role=self)
+
+    def _delete(self):
+        super()._delete()
+        self.state._drop_role(self.id)
+
+    def update(self, data):
+        super().update(data)
+        self.guild._invalidate_permissions()
+        return self
+
     async def modify(
         self, *, name=undefined, permissions=undefined, color=undefined, hoist=undefined,
         mentionable=undefined
@@ -7,6 +7,8 @@ __all__ = ('StageInstance',)
 
 
 class StageInstance(BaseObject):
+    __slots__ = ()
+
     guild_id = JsonField('guild_id', Snowflake)
     channel_id = JsonField('channel_id', Snowflake)
     topic = JsonField('topic')
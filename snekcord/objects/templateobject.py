@@ -9,6 +9,8 @@ __all__ = ('GuildTemplate',)
 
 
 class GuildTemplate(BaseObject):
+    __slots__ = ()
+
     id = JsonField('code')
     name = JsonField('name')
     description = JsonField('description')
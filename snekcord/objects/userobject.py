@@ -8,6 +8,8 @@ __all__ = ('User',)
 
 
 class User(BaseObject):
+    __slots__ = ()
+
     name = JsonField('username')
     discriminator = JsonField('discriminator')
     bot = JsonField('bot')
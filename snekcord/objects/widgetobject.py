@@ -6,12 +6,16 @@ __all__ = ('GuildWidgetChannel', 'GuildWidgetMember', 'GuildWidgetJson', 'GuildW
 
 
 class GuildWidgetChannel(JsonObject):
+    __slots__ = ()
+
     id = JsonField('id', Snowflake)
     name = JsonField('name')
     position = JsonField('position')
 
 
 class GuildWidgetMember(JsonObject):
+    __slots__ = ()
+
     id = JsonField('id', Snowflake)
     username = JsonField('username')
     discriminator = JsonField('discriminator')
@@ -21,6 +25,8 @@ class GuildWidgetMember(JsonObject):
 
 
 class GuildWidgetJson(JsonObject):
+    __slots__ = ()
+
     id = JsonField('id', Snowflake)
     name = JsonField('name')
     instant_invite = JsonField('instant_invite')
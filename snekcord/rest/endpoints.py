@@ -62,7 +62,7 @@ remove_reaction = HTTPEndpoint(
 
 get_reactions = HTTPEndpoint(
     'GET',
-    BASE_API_URL + '/channels/%(channel_id)s/messages/%(message_id)s/reactions/%(emoji_id)s',
+    BASE_API_URL + '/channels/%(channel_id)s/messages/%(message_id)s/reactions/%(emoji)s',
 )
 
 remove_reactions = HTTPEndpoint(
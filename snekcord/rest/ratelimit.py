@@ -1,10 +1,219 @@
-try:
-    raise NotImplementedError
-except object() if isinstance(object(), BaseException) else BaseException:
-    try:
-        raise NotImplemented()  # noqa
-    except BaseException:
-        try:
-            raise
-        except BaseException:
-            print('NotImplemented', 'Error')
+import asyncio
+
+__all__ = ('RateLimitBucket', 'RateLimiter')
+
+# Discord tracks rate limits per route and per "major parameter",
+# two requests to the same route with different channels are
+# counted in separate buckets.
+MAJOR_PARAMETERS = ('channel_id', 'guild_id', 'webhook_id', 'webhook_token')
+
+
+class RateLimitBucket:
+    def __init__(self, ratelimiter, key):
+        self.ratelimiter = ratelimiter
+        self.key = key
+
+        self.limit = None
+        self.remaining = 1
+        self.reset_at = None
+        self.unlimited = False
+
+        self._inflight = 0
+        self._waiter = None
+        self._lock = asyncio.Lock()
+
+    def __repr__(self):
+        return (
+            f'<{self.__class__.__name__} key={self.key!r}, limit={self.limit}, '
+            f'remaining={self.remaining}>'
+        )
+
+    @property
+    def idle(self):
+        if self._inflight or self._lock.locked():
+            return False
+
+        if self.reset_at is not None:
+            return self.ratelimiter.loop.time() >= self.reset_at
+
+        return True
+
+    def _wakeup(self):
+        if self._waiter is not None:
+            if not self._waiter.done():
+                self._waiter.set_result(None)
+            self._waiter = None
+
+    async def acquire(self):
+        # The lock makes callers line up in the order they arrived,
+        # only the caller at the front of the queue sleeps
+        loop = self.ratelimiter.loop
+
+        async with self._lock:
+            while not self.unlimited:
+                now = loop.time()
+
+                if self.reset_at is not None and now >= self.reset_at:
+                    # A 429 can arrive before the limit is known, one
+                    # request finds it out
+                    self.remaining = self.limit if self.limit is not None else 1
+                    self.reset_at = None
+
+                if self.remaining > 0:
+                    break
+
+                if self.reset_at is not None:
+                    await asyncio.sleep(self.reset_at - now)
+                else:
+                    # The window is unknown until a request that is
+                    # already in flight comes back with headers
+                    self._waiter = loop.create_future()
+                    await self._waiter
+
+            self.remaining -= 1
+            self._inflight += 1
+
+    def release(self):
+        # Called when a request never made it to Discord
+        self._inflight -= 1
+        self.remaining += 1
+        self._wakeup()
+
+    def update(self, headers, retry_after=None, status_code=200):
+        self._inflight -= 1
+
+        limit = headers.get('X-RateLimit-Limit')
+
+        if retry_after is not None:
+            if limit is not None:
+                self.limit = int(limit)
+
+            self.remaining = 0
+            self.reset_at = self.ratelimiter.loop.time() + retry_after
+        elif limit is None:
+            if 200 <= status_code < 300:
+                self.unlimited = True
+            elif self.limit is None:
+                # Errors like a proxy's 502 carry no headers, the next
+                # request gets another chance to learn the limit
+                self.remaining = max(self.remaining, 1)
+        else:
+            remaining = int(headers['X-RateLimit-Remaining']) - self._inflight
+
+            if self.limit is None:
+                self.remaining = remaining
+            else:
+                self.remaining = min(self.remaining, remaining)
+
+            self.remaining = max(self.remaining, 0)
+            self.limit = int(limit)
+            self.reset_at = (
+                self.ratelimiter.loop.time() + float(headers['X-RateLimit-Reset-After'])
+            )
+
+        self._wakeup()
+
+
+class RateLimiter:
+    def __init__(self, *, loop, global_limit=50):
+        self.loop = loop
+        self.global_limit = global_limit
+        self.global_reset_at = None
+
+        self.routes = {}
+        self.buckets = {}
+
+        self._global_count = 0
+        self._global_window_end = 0.0
+        self._global_lock = asyncio.Lock()
+
+    def _get_key(self, method, url, fmt):
+        route = (method, url)
+
+        if fmt is not None:
+            major = tuple(fmt.get(parameter) for parameter in MAJOR_PARAMETERS)
+        else:
+            major = ()
+
+        return self.routes.get(route, route), major
+
+    def _purge_idle(self):
+        for key, bucket in tuple(self.buckets.items()):
+            if bucket.idle:
+                del self.buckets[key]
+
+    def get_bucket(self, method, url, fmt=None):
+        key = self._get_key(method, url, fmt)
+        bucket = self.buckets.get(key)
+
+        if bucket is None:
+            if len(self.buckets) >= 4096:
+                self._purge_idle()
+
+            bucket = self.buckets[key] = RateLimitBucket(self, key)
+
+        return bucket
+
+    async def acquire_global(self):
+        if self.global_limit is None and self.global_reset_at is None:
+            return
+
+        async with self._global_lock:
+            while True:
+                now = self.loop.time()
+
+                if self.global_reset_at is not None:
+                    if now < self.global_reset_at:
+                        await asyncio.sleep(self.global_reset_at - now)
+                        continue
+
+                    self.global_reset_at = None
+
+                if self.global_limit is None:
+                    return
+
+                if now >= self._global_window_end:
+                    self._global_window_end = now + 1
+                    self._global_count = 0
+
+                if self._global_count < self.global_limit:
+                    self._global_count += 1
+                    return
+
+                await asyncio.sleep(self._global_window_end - now)
+
+    def update(self, bucket, method, url, response, data=None):
+        headers = response.headers
+        retry_after = None
+
+        if response.status_code == 429:
+            if isinstance(data, dict) and 'retry_after' in data:
+                retry_after = float(data['retry_after'])
+            else:
+                retry_after = float(headers.get('Retry-After', 1))
+
+            is_global = headers.get('X-RateLimit-Global', '').lower() == 'true'
+
+            if is_global or isinstance(data, dict) and data.get('global'):
+                self.global_reset_at = self.loop.time() + retry_after
+                bucket.release()
+                return
+
+        bucket.update(headers, retry_after, response.status_code)
+
+        bucket_hash = headers.get('X-RateLimit-Bucket')
+        if bucket_hash is not None:
+            self.routes[(method, url)] = bucket_hash
+            self._rekey(bucket, (bucket_hash, bucket.key[1]))
+
+    def _rekey(self, bucket, key):
+        # The bucket keeps its state and waiters once its hash is known,
+        # unless another route already created the hash's bucket
+        if bucket.key == key or key in self.buckets:
+            return
+
+        if self.buckets.get(bucket.key) is bucket:
+            del self.buckets[bucket.key]
+
+        bucket.key = key
+        self.buckets[key] = bucket
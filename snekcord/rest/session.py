@@ -1,8 +1,11 @@
-import json
+import asyncio
 from http import HTTPStatus
 
 from httpx import AsyncClient
 
+from .ratelimit import RateLimiter
+from ..cache import TTLCache
+
 __all__ = ('HTTPError', 'RestSession')
 
 
@@ -13,11 +16,49 @@ class HTTPError(Exception):
 
 
 class RestSession(AsyncClient):
+    """The HTTP session used to talk to Discord's API
+
+    Identical GET requests (same url and query parameters) made while
+    one of them is in flight share its response. Successful GET
+    responses can additionally be kept for `response_cache_ttl`
+    seconds. Once any other request to a url returns, the cached and in
+    flight responses of that url and the urls below it are dropped.
+
+    Attributes:
+        coalesce_gets bool: Whether identical GET requests share a
+            response
+
+        response_cache Optional[TTLCache]: The cached GET responses,
+            None unless `response_cache_ttl` is passed
+    """
+
     def __init__(self, client, *args, **kwargs):
         self.loop = client.loop
         self.client = client
 
         self.authorization = self.client.authorization
+        self.json_codec = self.client.json_codec
+
+        self.max_retries = kwargs.pop('max_retries', 5)
+        self.ratelimiter = RateLimiter(
+            loop=self.loop, global_limit=kwargs.pop('global_limit', 50)
+        )
+
+        self.coalesce_gets = kwargs.pop('coalesce_gets', True)
+
+        response_cache_ttl = kwargs.pop('response_cache_ttl', None)
+        response_cache_size = kwargs.pop('response_cache_size', 1000)
+
+        if response_cache_ttl is not None:
+            self.response_cache = TTLCache(response_cache_ttl, response_cache_size)
+        else:
+            self.response_cache = None
+
+        self._inflight = {}
+        # Every GET that may end up in the response cache, GETs that
+        # overlapped a request changing their url are marked stale
+        self._pending_gets = {}
+        self._stale_gets = set()
 
         self.global_headers = kwargs.pop('global_headers', {})
         self.global_headers.update({
@@ -50,21 +91,150 @@ class RestSession(AsyncClient):
             for key, value in data.items():
                 yield from self._iter_errors(value, keys + (key,))
 
+    def _load_response(self, response):
+        data = response.content
+
+        content_type = response.headers.get('content-type')
+        if content_type is not None and content_type.lower() == 'application/json':
+            data = self.json_codec.loads(data)
+
+        return data
+
+    @staticmethod
+    def _get_request_key(url, kwargs):
+        if kwargs.keys() - {'params'}:
+            return None
+
+        params = kwargs.get('params')
+
+        if params is None:
+            return url, ()
+
+        key = url, tuple(sorted(params.items()))
+
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        return key
+
+    @staticmethod
+    def _url_matches(key, url):
+        return key[0] == url or key[0].startswith(url + '/')
+
+    def _invalidate_responses(self, url):
+        if self.response_cache is not None:
+            for key in tuple(self.response_cache):
+                if self._url_matches(key, url):
+                    del self.response_cache[key]
+
+        for task, key in self._pending_gets.items():
+            if self._url_matches(key, url):
+                # The response may predate the change, it must neither
+                # be cached nor shared with new callers
+                self._stale_gets.add(task)
+
+                if self._inflight.get(key) is task:
+                    del self._inflight[key]
+
+    def _request_done(self, key, task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+        del self._pending_gets[task]
+
+        if task in self._stale_gets:
+            self._stale_gets.remove(task)
+            return
+
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        if self.response_cache is not None:
+            self.response_cache[key] = task.result()
+
     async def request(self, method, url, fmt=None, **kwargs):
+        if method != 'GET':
+            try:
+                response = await self._request(method, url, fmt, kwargs)
+            finally:
+                self._invalidate_responses(url % fmt if fmt is not None else url)
+
+            return self._load_response(response)
+
+        if not self.coalesce_gets and self.response_cache is None:
+            return self._load_response(await self._request(method, url, fmt, kwargs))
+
+        key = self._get_request_key(url % fmt if fmt is not None else url, kwargs)
+
+        if key is None:
+            return self._load_response(await self._request(method, url, fmt, kwargs))
+
+        if self.response_cache is not None:
+            response = self.response_cache.get(key)
+
+            if response is not None:
+                return self._load_response(response)
+
+        task = self._inflight.get(key)
+
+        if task is None:
+            task = self.loop.create_task(self._request(method, url, fmt, kwargs))
+
+            if self.coalesce_gets:
+                self._inflight[key] = task
+
+            self._pending_gets[task] = key
+            task.add_done_callback(lambda task: self._request_done(key, task))
+
+        # Every caller decodes the raw response so no two callers share
+        # the same (mutable) data. The shield keeps one caller's
+        # cancellation from failing the others
+        return self._load_response(await asyncio.shield(task))
+
+    async def _request(self, method, url, fmt, kwargs):
+        route = url
+        bucket = self.ratelimiter.get_bucket(method, route, fmt)
+
         if fmt is not None:
             url = url % fmt
 
         headers = kwargs.setdefault('headers', {})
         headers.update(self.global_headers)
 
-        response = await super().request(method, url, **kwargs)
-        await response.aclose()
+        if 'json' in kwargs:
+            kwargs['content'] = self.json_codec.dumps_bytes(kwargs.pop('json'))
+            headers['Content-Type'] = 'application/json'
 
-        data = response.content
+        retries = 0
 
-        content_type = response.headers.get('content-type')
-        if content_type is not None and content_type.lower() == 'application/json':
-            data = json.loads(data)
+        while True:
+            await bucket.acquire()
+
+            try:
+                await self.ratelimiter.acquire_global()
+                response = await super().request(method, url, **kwargs)
+                await response.aclose()
+            except BaseException:
+                bucket.release()
+                raise
+
+            # Successful responses are decoded by the caller
+            data = None
+
+            if response.status_code >= 400:
+                data = self._load_response(response)
+
+            self.ratelimiter.update(bucket, method, route, response, data)
+
+            if response.status_code != 429 or retries >= self.max_retries:
+                break
+
+            retries += 1
+
+            # The bucket may have been replaced now that its hash is known
+            bucket = self.ratelimiter.get_bucket(method, route, fmt)
 
         status_code = response.status_code
         if status_code >= 400:
@@ -88,4 +258,4 @@ class RestSession(AsyncClient):
 
             raise HTTPError(message, response)
 
-        return data
+        return response
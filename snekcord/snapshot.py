@@ -0,0 +1,164 @@
+import bz2
+import gzip
+import lzma
+import mmap
+import os
+
+from .utils import Snowflake
+
+__all__ = (
+    'SNAPSHOT_VERSION', 'open_compressed', 'save_snapshot', 'save_snapshot_sync', 'load_snapshot'
+)
+
+SNAPSHOT_VERSION = 1
+
+COMPRESSION_SUFFIXES = {
+    '.gz': gzip.open,
+    '.bz2': bz2.open,
+    '.xz': lzma.open,
+}
+
+# Keys of GUILD_CREATE payloads that are stored in other states, the
+# copies kept in the guild's raw data go stale
+_GUILD_STATE_KEYS = (
+    'channels', 'members', 'roles', 'emojis', 'presences', 'voice_states', 'threads',
+    'stage_instances'
+)
+
+
+def open_compressed(path, mode='rb'):
+    """Opens a file in binary mode, compressed with gzip, bz2 or lzma if
+    the path ends in .gz, .bz2 or .xz"""
+    opener = COMPRESSION_SUFFIXES.get(os.path.splitext(path)[1])
+
+    if opener is not None:
+        return opener(path, mode)
+
+    return open(path, mode)
+
+
+def _iter_records(client):
+    yield 'user', None, (user._json_data_ for user in client.users)
+
+    for guild in client.guilds:
+        data = {
+            key: value for key, value in guild._json_data_.items()
+            if key not in _GUILD_STATE_KEYS
+        }
+        data['roles'] = [role._json_data_ for role in guild.roles]
+        data['emojis'] = [emoji._json_data_ for emoji in guild.emojis]
+
+        yield 'guild', None, (data,)
+
+    yield 'channel', None, (channel._json_data_ for channel in client.channels)
+
+    for guild in client.guilds:
+        members = []
+
+        for member in guild.members:
+            data = member._json_data_
+
+            if member.user is not None:
+                # The user's raw data is newer than the copy the member
+                # was created with
+                data = dict(data, user=member.user._json_data_)
+
+            members.append(data)
+
+        yield 'member', guild.id, members
+
+
+def _get_header(client):
+    header = client._snapshot_header_()
+    header['v'] = SNAPSHOT_VERSION
+    return header
+
+
+def _write_snapshot(codec, header, records, path):
+    root, ext = os.path.splitext(path)
+    tmp_path = f'{root}.tmp{ext}'
+
+    with open_compressed(tmp_path, 'wb') as fp:
+        fp.write(codec.dumps_bytes(header) + b'\n')
+
+        for kind, guild_id, values in records:
+            for data in values:
+                record = [kind, data] if guild_id is None else [kind, data, guild_id]
+                fp.write(codec.dumps_bytes(record) + b'\n')
+
+    # A crash while writing leaves the previous snapshot intact
+    os.replace(tmp_path, path)
+
+
+async def save_snapshot(client, path):
+    """Writes the client's users, guilds, channels, roles, emojis and
+    members to `path`, one JSON record per line
+
+    The first line is a header made by `client._snapshot_header_()`.
+    The file is compressed if `path` ends in .gz, .bz2 or .xz.
+
+    The records are gathered on the loop, encoding, compressing and
+    writing them happen in the loop's default executor.
+    """
+    # The states can't change size while the executor walks them
+    records = [(kind, guild_id, list(values)) for kind, guild_id, values in _iter_records(client)]
+
+    await client.loop.run_in_executor(
+        None, _write_snapshot, client.json_codec, _get_header(client), records, path
+    )
+
+
+def save_snapshot_sync(client, path):
+    """Same as `save_snapshot` but blocks, meant for shutdown when the
+    loop is no longer running"""
+    _write_snapshot(client.json_codec, _get_header(client), _iter_records(client), path)
+
+
+def _iter_lines(path):
+    if os.path.splitext(path)[1] in COMPRESSION_SUFFIXES:
+        with open_compressed(path, 'rb') as fp:
+            yield from fp
+        return
+
+    with open(path, 'rb') as fp:
+        if os.fstat(fp.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from iter(mm.readline, b'')
+
+
+def load_snapshot(client, path):
+    """Fills the client's states from a snapshot written by
+    `save_snapshot`, should be called before connecting
+
+    Returns:
+        dict: The snapshot's header
+    """
+    codec = client.json_codec
+    lines = _iter_lines(path)
+
+    header = codec.loads(next(lines))
+
+    if header.get('v') != SNAPSHOT_VERSION:
+        raise ValueError(f'Unsupported snapshot version: {header.get("v")!r}')
+
+    for line in lines:
+        record = codec.loads(line)
+        kind, data = record[0], record[1]
+
+        if kind == 'user':
+            client.users.upsert(data)
+        elif kind == 'guild':
+            client.guilds.upsert(data)
+        elif kind == 'channel':
+            client.channels.upsert(data)
+        elif kind == 'member':
+            guild = client.guilds.get(Snowflake(record[2]))
+
+            if guild is not None:
+                guild.members.upsert(data)
+
+    client._restore_snapshot_header_(header)
+
+    return header
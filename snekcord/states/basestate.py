@@ -1,4 +1,9 @@
-__all__ = ('BaseState', 'BaseSubState')
+import asyncio
+
+from ..cache import CacheBackend
+from ..utils import Snowflake
+
+__all__ = ('BaseState', 'BaseSubState', 'Paginator')
 
 
 class _StateCommon:
@@ -17,7 +22,13 @@ class BaseState(_StateCommon):
 
     def __init__(self, *, client):
         self.client = client
-        self.mapping = self._mapping_()
+        self.mapping = client.cache_backends.get(self.__class__.__name__, self._mapping_)()
+
+        if isinstance(self.mapping, CacheBackend):
+            self.mapping.on_evict = self._evicted
+
+    def _evicted(self, key, value):
+        value.cached = False
 
     def __iter__(self):
         return iter(self.mapping.values())
@@ -113,3 +124,134 @@ class BaseSubState(_StateCommon):
                 continue
             else:
                 yield key, value
+
+
+class Paginator:
+    """An async iterator over a paginated endpoint that requests the next
+    page while the current one is being consumed
+
+    Attributes:
+        fetch Callable[[dict], Awaitable[list]]: Called with the query
+            parameters of a page, returns the page's raw objects
+
+        convert Callable[[dict], Any]: Turns a raw object into the
+            value that is yielded
+
+        key Callable[[dict], Snowflake]: Returns the id of a raw object
+
+        direction str: 'before' to walk from newer to older objects,
+            'after' to walk from older to newer objects
+
+        cursor Optional[Snowflake]: The id the first page starts at
+
+        until Optional[Snowflake]: The id iteration stops at, exclusive
+
+        limit Optional[int]: The maximum number of objects to yield
+
+        page_size int: The maximum number of objects per request
+
+        pages int: The number of pages requested so far
+    """
+
+    def __init__(
+        self, fetch, convert, *, key=None, direction='before', cursor=None, until=None,
+        limit=None, page_size=100
+    ):
+        if direction not in ('before', 'after'):
+            raise ValueError(f'direction should be \'before\' or \'after\', got {direction!r}')
+
+        self.fetch = fetch
+        self.convert = convert
+
+        if key is not None:
+            self.key = key
+        else:
+            self.key = self._get_id
+
+        self.direction = direction
+
+        if cursor is not None:
+            self.cursor = Snowflake.try_snowflake(cursor, allow_datetime=True)
+        else:
+            self.cursor = None
+
+        if until is not None:
+            self.until = Snowflake.try_snowflake(until, allow_datetime=True)
+        else:
+            self.until = None
+
+        self.limit = limit
+        self.page_size = page_size
+
+        self.pages = 0
+
+    @staticmethod
+    def _get_id(data):
+        return Snowflake(data['id'])
+
+    def _reached(self, object_id):
+        if self.until is None:
+            return False
+
+        if self.direction == 'before':
+            return object_id <= self.until
+
+        return object_id >= self.until
+
+    def _request(self, cursor, remaining):
+        params = {}
+
+        if cursor is not None:
+            params[self.direction] = cursor
+
+        if remaining is not None:
+            params['limit'] = min(self.page_size, remaining)
+        else:
+            params['limit'] = self.page_size
+
+        self.pages += 1
+
+        return asyncio.ensure_future(self.fetch(params)), params['limit']
+
+    async def _iterate(self):
+        remaining = self.limit
+
+        if remaining is not None and remaining <= 0:
+            return
+
+        page, requested = self._request(self.cursor, remaining)
+
+        try:
+            while page is not None:
+                data = await page
+                page = None
+
+                data.sort(key=self.key, reverse=self.direction == 'before')
+
+                if remaining is not None:
+                    remaining -= len(data)
+
+                # The next page is requested before this one is handed
+                # out so the request overlaps with the consumer's work
+                if (
+                    len(data) >= requested
+                    and (remaining is None or remaining > 0)
+                    and not self._reached(self.key(data[-1]))
+                ):
+                    page, requested = self._request(self.key(data[-1]), remaining)
+
+                for raw in data:
+                    if self._reached(self.key(raw)):
+                        return
+
+                    yield self.convert(raw)
+        finally:
+            if page is not None:
+                page.cancel()
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def flatten(self):
+        """Returns every object as a list"""
+        return [value async for value in self]
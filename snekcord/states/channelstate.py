@@ -1,3 +1,6 @@
+import asyncio
+import os
+
 from .basestate import BaseState, BaseSubState
 from .. import rest
 from ..clients.client import ClientClasses
@@ -47,6 +50,35 @@ class ChannelState(BaseState):
             self.client.rest, {'channel_id': channel_id}
         )
 
+    async def export_history(self, channels, directory, *, suffix='.ndjson.gz', concurrency=4,
+                             **kwargs):
+        """Exports the history of every channel to `directory` with
+        `MessageState.export`, `concurrency` channels at a time
+
+        Channels can be given as objects or ids, uncached channels are
+        fetched. Each channel is written to `<channel id><suffix>`, the
+        remaining keyword arguments are passed to `MessageState.export`.
+
+        Returns:
+            dict[Snowflake, int]: The number of messages written for
+                each channel
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def export(channel):
+            channel_id = Snowflake.try_snowflake(channel)
+
+            async with semaphore:
+                channel = self.get(channel_id)
+
+                if channel is None:
+                    channel = await self.fetch(channel_id)
+
+                path = os.path.join(directory, f'{channel_id}{suffix}')
+                return channel_id, await channel.messages.export(path, **kwargs)
+
+        return dict(await asyncio.gather(*(export(channel) for channel in channels)))
+
     async def close(self, channel):
         return self.delete(channel)
 
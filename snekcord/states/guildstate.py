@@ -1,4 +1,6 @@
-from .basestate import BaseState
+import asyncio
+
+from .basestate import BaseState, Paginator
 from .. import rest
 from ..clients.client import ClientClasses
 from ..enums import ExplicitContentFilterLevel, MessageNotificationsLevel
@@ -55,16 +57,38 @@ class GuildState(BaseState):
         if limit is not None:
             params['limit'] = int(limit)
 
-        data = await rest.get_my_guilds.request(self.client.rest)
+        data = await rest.get_my_guilds.request(self.client.rest, params=params)
 
         guilds = [self.upsert(guild) for guild in data]
 
         if sync:
-            for guild in guilds:
-                await guild.sync(data)
+            await asyncio.gather(
+                *(guild.sync(guild_data) for guild, guild_data in zip(guilds, data))
+            )
 
         return guilds
 
+    def iterate(self, *, before=None, after=None, limit=None, page_size=200, cache=True):
+        """Returns an async iterator over the current user's guilds in id
+        order, guilds are not cached if `cache` is False
+
+        Returns:
+            Paginator: The iterator
+        """
+        async def fetch(params):
+            return await rest.get_my_guilds.request(self.client.rest, params=params)
+
+        if cache:
+            convert = self.upsert
+        else:
+            def convert(data):
+                return ClientClasses.Guild.unmarshal(data, state=self)
+
+        return Paginator(
+            fetch, convert, direction='after', cursor=after, until=before, limit=limit,
+            page_size=page_size
+        )
+
     async def fetch_preview(self, guild):
         guild_id = Snowflake.try_snowflake(guild)
 
@@ -1,9 +1,132 @@
-from .basestate import BaseState
+import asyncio
+
+from .basestate import BaseState, Paginator
 from .. import rest
 from ..clients.client import ClientClasses
 from ..utils import Snowflake
 
-__all__ = ('GuildMemberState',)
+__all__ = ('MemberChunkRequest', 'GuildMemberState')
+
+
+class MemberChunkRequest:
+    """A REQUEST_GUILD_MEMBERS request whose GUILD_MEMBERS_CHUNK responses
+    are matched by nonce
+
+    Awaiting the request returns every member once the last chunk has
+    arrived, iterating over it with `async for` yields the members of
+    each chunk as soon as it arrives.
+
+    Attributes:
+        guild Guild: The guild the members are requested from
+
+        nonce str: The nonce sent with the request
+
+        members list[GuildMember]: The members received so far
+
+        not_found list[Snowflake]: The requested user ids that are not
+            members of the guild
+
+        chunk_count Optional[int]: The number of chunks Discord will
+            send, None until the first chunk arrives
+
+        chunks_received int: The number of chunks received so far
+
+        shard Optional[Shard]: The shard the request is sent through,
+            the request fails if the shard reconnects before it is done
+    """
+
+    def __init__(self, *, guild, nonce, timeout=None, shard=None):
+        self.guild = guild
+        self.nonce = nonce
+        self.timeout = timeout
+        self.shard = shard
+
+        self.members = []
+        self.not_found = []
+        self.chunk_count = None
+        self.chunks_received = 0
+
+        self.loop = guild.state.client.loop
+        self.future = self.loop.create_future()
+
+        self._chunks = asyncio.Queue()
+
+    def __repr__(self):
+        return (
+            f'<{self.__class__.__name__} nonce={self.nonce!r}, '
+            f'chunks={self.chunks_received}/{self.chunk_count}>'
+        )
+
+    @property
+    def done(self):
+        return self.future.done()
+
+    def _finish(self, exc=None):
+        self.guild.state.client.chunk_requests.pop(self.nonce, None)
+
+        if self.shard is not None:
+            self.shard.chunk_requests.pop(self.nonce, None)
+
+        if not self.future.done():
+            if exc is not None:
+                self.future.set_exception(exc)
+            else:
+                self.future.set_result(self.members)
+
+        self._chunks.put_nowait(None)
+
+    def _add_chunk(self, payload, members):
+        self.members.extend(members)
+        self.not_found.extend(Snowflake(user_id) for user_id in payload.get('not_found', ()))
+        self.chunk_count = payload['chunk_count']
+        self.chunks_received += 1
+
+        self._chunks.put_nowait(members)
+
+        if self.chunks_received >= self.chunk_count:
+            self._finish()
+
+    async def _send(self, shard, **kwargs):
+        try:
+            await shard.ws.request_guild_members(self.guild.id, nonce=self.nonce, **kwargs)
+        except asyncio.CancelledError:
+            self._finish(ConnectionError('The request was cancelled before it was sent'))
+            raise
+        except Exception as exc:
+            self._finish(exc)
+
+    async def wait(self):
+        try:
+            return await asyncio.wait_for(asyncio.shield(self.future), self.timeout)
+        except asyncio.TimeoutError as exc:
+            self._finish(exc)
+            # The caller receives the error, the future doesn't need to
+            # report it again
+            self.future.exception()
+            raise
+
+    def __await__(self):
+        return self.wait().__await__()
+
+    async def __aiter__(self):
+        while True:
+            try:
+                members = await asyncio.wait_for(self._chunks.get(), self.timeout)
+            except asyncio.TimeoutError as exc:
+                self._finish(exc)
+                self.future.exception()
+                raise
+
+            if members is None:
+                # Put the marker back so other iterators end as well
+                self._chunks.put_nowait(None)
+                break
+
+            for member in members:
+                yield member
+
+        if self.future.exception() is not None:
+            raise self.future.exception()
 
 
 class GuildMemberState(BaseState):
@@ -11,6 +134,11 @@ class GuildMemberState(BaseState):
         super().__init__(client=client)
         self.guild = guild
 
+    def _evicted(self, key, value):
+        super()._evicted(key, value)
+        self.guild.roles._unindex_member(key, value.roles._keys)
+        self.guild._invalidate_permissions(key)
+
     def upsert(self, data):
         member = self.get(Snowflake(data['user']['id']))
 
@@ -22,6 +150,34 @@ class GuildMemberState(BaseState):
 
         return member
 
+    def request_chunked(
+        self, *, query=None, limit=None, users=None, presences=None, timeout=None
+    ):
+        """Requests members through the gateway, the members are cached as
+        their chunks arrive
+
+        Returns:
+            MemberChunkRequest: The request, it can be awaited or
+                iterated over with `async for`
+        """
+        client = self.client
+        shard = client.shards.get(client.get_shard_id(self.guild.id))
+
+        if shard is None:
+            raise ValueError(f'The shard for guild {self.guild.id} is not running in this client')
+
+        request = MemberChunkRequest(
+            guild=self.guild, nonce=client.create_chunk_nonce(), timeout=timeout, shard=shard
+        )
+        client.chunk_requests[request.nonce] = request
+        shard.chunk_requests[request.nonce] = request
+
+        client.loop.create_task(request._send(
+            shard, query=query, limit=limit, users=users, presences=presences
+        ))
+
+        return request
+
     async def fetch(self, user):
         user_id = Snowflake.try_snowflake(user)
 
@@ -46,6 +202,33 @@ class GuildMemberState(BaseState):
 
         return [self.upsert(member) for member in data]
 
+    def iterate(self, *, after=None, limit=None, page_size=1000, cache=True):
+        """Returns an async iterator over the guild's members in user id
+        order, members are not cached if `cache` is False
+
+        Returns:
+            Paginator: The iterator
+        """
+        async def fetch(params):
+            return await rest.get_guild_members.request(
+                self.client.rest, {'guild_id': self.guild.id}, params=params
+            )
+
+        if cache:
+            convert = self.upsert
+        else:
+            def convert(data):
+                return ClientClasses.GuildMember.unmarshal(data, state=self)
+
+        return Paginator(
+            fetch, convert, key=self._get_member_id, direction='after', cursor=after,
+            limit=limit, page_size=page_size
+        )
+
+    @staticmethod
+    def _get_member_id(data):
+        return Snowflake(data['user']['id'])
+
     async def search(self, query, *, limit=None):
         params = {'query': str(query)}
 
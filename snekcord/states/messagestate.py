@@ -1,10 +1,15 @@
-from .basestate import BaseState, BaseSubState
+import asyncio
+import time
+from collections import Counter, OrderedDict
+
+from .basestate import BaseState, BaseSubState, Paginator
 from .. import rest
 from ..clients.client import ClientClasses
 from ..objects.embedobject import Embed, EmbedBuilder
+from ..snapshot import open_compressed
 from ..utils import Snowflake, undefined
 
-__all__ = ('MessageState', 'ChannelPinsState')
+__all__ = ('MessageCachePolicy', 'MessagePurge', 'MessageState', 'ChannelPinsState')
 
 
 def _embed_to_dict(embed):
@@ -19,11 +24,294 @@ def _embed_to_dict(embed):
     )
 
 
+class MessageCachePolicy:
+    """Decides how many messages are kept in the cache
+
+    Every channel's messages are kept in insertion order and the oldest
+    ones are evicted first. Pinned messages and messages referenced by a
+    cached message's `MessageReference` are never evicted.
+
+    Attributes:
+        max_messages Optional[int]: The maximum number of messages cached
+            per channel, None for no limit
+
+        max_total Optional[int]: The maximum number of messages cached
+            across all channels, None for no limit
+
+        ttl Optional[float]: The number of seconds a message stays
+            cached for, None for no limit
+    """
+
+    def __init__(self, *, max_messages=1000, max_total=None, ttl=None):
+        self.max_messages = max_messages
+        self.max_total = max_total
+        self.ttl = ttl
+
+        self._messages = OrderedDict()
+        self._references = Counter()
+
+    def __len__(self):
+        return len(self._messages)
+
+    def __repr__(self):
+        return (
+            f'<{self.__class__.__name__} max_messages={self.max_messages}, '
+            f'max_total={self.max_total}, ttl={self.ttl}, len({len(self)})>'
+        )
+
+    def is_protected(self, message):
+        return message.id in self._references or message.id in message.channel.pins._keys
+
+    def _get_reference_id(self, message):
+        if message.reference is not None:
+            message_id = message.reference._json_data_.get('message_id')
+
+            if message_id is not None:
+                return Snowflake(message_id)
+
+        return None
+
+    def add(self, message):
+        self._messages[message.id] = (message, time.monotonic())
+
+        reference_id = self._get_reference_id(message)
+        if reference_id is not None:
+            self._references[reference_id] += 1
+
+        self.evict(message.state)
+
+    def remove(self, message):
+        if self._messages.pop(message.id, None) is None:
+            return
+
+        reference_id = self._get_reference_id(message)
+        if reference_id is not None:
+            self._references[reference_id] -= 1
+
+            if self._references[reference_id] <= 0:
+                del self._references[reference_id]
+
+    def _evict_channel(self, state):
+        excess = len(state.mapping) - self.max_messages
+        evicted = []
+
+        for message in state.mapping.values():
+            if excess <= 0:
+                break
+
+            if not self.is_protected(message):
+                evicted.append(message)
+                excess -= 1
+
+        return evicted
+
+    def _evict_global(self):
+        if self.max_total is not None:
+            excess = len(self._messages) - self.max_total
+        else:
+            excess = 0
+
+        if self.ttl is not None:
+            expires_before = time.monotonic() - self.ttl
+        else:
+            expires_before = None
+
+        evicted = []
+
+        # Messages are ordered by the time they were cached so both
+        # checks can stop at the first message that should be kept
+        for message, cached_at in self._messages.values():
+            expired = expires_before is not None and cached_at <= expires_before
+
+            if excess <= 0 and not expired:
+                break
+
+            if not self.is_protected(message):
+                evicted.append(message)
+                excess -= 1
+
+        return evicted
+
+    def evict(self, state=None):
+        """Evicts messages that exceed the policy's limits
+
+        Arguments:
+            state Optional[MessageState]: The channel message state to
+                apply the per-channel limit to, only the global limits
+                are applied if None
+        """
+        evicted = []
+
+        if state is not None and self.max_messages is not None:
+            evicted.extend(self._evict_channel(state))
+
+        if self.max_total is not None or self.ttl is not None:
+            evicted.extend(self._evict_global())
+
+        for message in evicted:
+            if message.cached:
+                message.uncache()
+
+        return evicted
+
+
+class MessagePurge:
+    """Deletes messages with as few requests as possible, messages
+    younger than `BULK_DELETE_MAX_AGE` are deleted 100 at a time and
+    older ones one by one
+
+    Every request is sent at once and paced by the channel's rate limit
+    buckets. Awaiting the purge returns the ids of every deleted message
+    once the last request has finished, iterating over it with
+    `async for` yields the ids deleted by each request as soon as it
+    completes. Failed requests don't stop the purge.
+
+    Attributes:
+        state MessageState: The state of the channel being purged
+
+        batches list[tuple[Snowflake, ...]]: The ids deleted with the
+            bulk delete endpoint
+
+        singles list[Snowflake]: The ids deleted one by one
+
+        total int: The number of messages being deleted
+
+        deleted list[Snowflake]: The ids deleted so far
+
+        failed list[Snowflake]: The ids whose request failed
+
+        errors list[Exception]: The errors raised by failed requests
+    """
+
+    # Discord refuses to bulk delete messages older than two weeks, the
+    # margin covers requests delayed by the rate limit
+    BULK_DELETE_MAX_AGE = 14 * 24 * 60 * 60 - 5 * 60
+    BULK_DELETE_LIMIT = 100
+
+    def __init__(self, *, state, message_ids):
+        self.state = state
+
+        cutoff = time.time() - self.BULK_DELETE_MAX_AGE
+
+        recent = []
+        self.singles = []
+
+        for message_id in message_ids:
+            if message_id.timestamp > cutoff:
+                recent.append(message_id)
+            else:
+                self.singles.append(message_id)
+
+        self.batches = []
+
+        for i in range(0, len(recent), self.BULK_DELETE_LIMIT):
+            batch = tuple(recent[i:i + self.BULK_DELETE_LIMIT])
+
+            if len(batch) == 1:
+                # The bulk delete endpoint requires at least 2 messages
+                self.singles.extend(batch)
+            else:
+                self.batches.append(batch)
+
+        self.total = len(message_ids)
+
+        self.deleted = []
+        self.failed = []
+        self.errors = []
+
+        self.loop = state.client.loop
+        self.future = self.loop.create_future()
+
+        self._results = asyncio.Queue()
+        self._task = None
+
+    def __repr__(self):
+        return (
+            f'<{self.__class__.__name__} deleted={len(self.deleted)}/{self.total}, '
+            f'failed={len(self.failed)}>'
+        )
+
+    @property
+    def done(self):
+        return self.future.done()
+
+    def start(self):
+        if self._task is None:
+            self._task = self.loop.create_task(self._run())
+
+        return self
+
+    def cancel(self):
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _delete(self, coro, message_ids):
+        try:
+            await coro
+        except Exception as exc:
+            self.failed.extend(message_ids)
+            self.errors.append(exc)
+            return
+
+        self.deleted.extend(message_ids)
+        self._results.put_nowait(message_ids)
+
+    async def _run(self):
+        state = self.state
+        channel_id = state.channel.id
+
+        coros = [
+            self._delete(
+                rest.bulk_delete_messages.request(
+                    state.client.rest, {'channel_id': channel_id},
+                    json={'message_ids': batch}
+                ),
+                batch
+            )
+            for batch in self.batches
+        ]
+        coros.extend(
+            self._delete(state.delete(message_id), (message_id,))
+            for message_id in self.singles
+        )
+
+        try:
+            await asyncio.gather(*coros)
+        except asyncio.CancelledError:
+            self.future.cancel()
+            raise
+        else:
+            self.future.set_result(self.deleted)
+        finally:
+            self._results.put_nowait(None)
+
+    async def wait(self):
+        return await asyncio.shield(self.future)
+
+    def __await__(self):
+        return self.wait().__await__()
+
+    async def __aiter__(self):
+        while True:
+            message_ids = await self._results.get()
+
+            if message_ids is None:
+                # Put the sentinel back for any other iterator
+                self._results.put_nowait(None)
+                break
+
+            yield message_ids
+
+
 class MessageState(BaseState):
     def __init__(self, *, client, channel):
         super().__init__(client=client)
         self.channel = channel
 
+    def _evicted(self, key, value):
+        super()._evicted(key, value)
+        self.client.message_cache_policy.remove(value)
+
     def upsert(self, data):
         message = self.get(Snowflake(data['id']))
 
@@ -35,6 +323,10 @@ class MessageState(BaseState):
 
         return message
 
+    def clear(self):
+        for message in tuple(self.mapping.values()):
+            message.uncache()
+
     async def fetch(self, message):
         message_id = Snowflake.try_snowflake(message)
 
@@ -68,6 +360,87 @@ class MessageState(BaseState):
 
         return [self.upsert(message) for message in data]
 
+    def history(
+        self, *, before=None, after=None, oldest_first=False, limit=None, page_size=100,
+        cache=True
+    ):
+        """Returns an async iterator over the channel's messages, newest
+        first unless `oldest_first` is True
+
+        Messages outside of `before` and `after` (ids, objects or
+        datetimes) are not yielded. Messages are not cached if `cache`
+        is False.
+
+        Returns:
+            Paginator: The iterator
+        """
+        async def fetch(params):
+            return await rest.get_channel_messages.request(
+                self.client.rest, {'channel_id': self.channel.id}, params=params
+            )
+
+        if cache:
+            convert = self.upsert
+        else:
+            def convert(data):
+                return ClientClasses.Message.unmarshal(data, state=self)
+
+        if oldest_first:
+            return Paginator(
+                fetch, convert, direction='after', cursor=after if after is not None else 0,
+                until=before, limit=limit, page_size=page_size
+            )
+
+        return Paginator(
+            fetch, convert, direction='before', cursor=before, until=after, limit=limit,
+            page_size=page_size
+        )
+
+    async def export(
+        self, path, *, before=None, after=None, oldest_first=False, limit=None, page_size=100
+    ):
+        """Writes the channel's raw messages to `path`, one JSON object
+        per line, compressed if `path` ends in .gz, .bz2 or .xz
+
+        Messages are written a page at a time as they are received, they
+        are neither cached nor turned into objects. Compressing and
+        writing happen in the loop's default executor so a large export
+        doesn't hold up the gateway.
+
+        Returns:
+            int: The number of messages written
+        """
+        loop = self.client.loop
+        codec = self.client.json_codec
+        count = 0
+
+        pages = self.history(
+            before=before, after=after, oldest_first=oldest_first, limit=limit,
+            page_size=page_size
+        )
+        pages.convert = codec.dumps_bytes
+
+        fp = await loop.run_in_executor(None, open_compressed, path, 'wb')
+
+        try:
+            lines = []
+
+            async for line in pages:
+                lines.append(line)
+
+                if len(lines) >= page_size:
+                    await loop.run_in_executor(None, fp.write, b'\n'.join(lines) + b'\n')
+                    count += len(lines)
+                    lines.clear()
+
+            if lines:
+                await loop.run_in_executor(None, fp.write, b'\n'.join(lines) + b'\n')
+                count += len(lines)
+        finally:
+            await loop.run_in_executor(None, fp.close)
+
+        return count
+
     async def create(
         self, *, content=undefined, tts=undefined, file=undefined, embed=undefined, embeds=undefined
         # allowed mentions, message_reference, components
@@ -98,11 +471,20 @@ class MessageState(BaseState):
     async def delete(self, message):
         message_id = Snowflake.try_snowflake(message)
 
-        data = await rest.delete_message.request(
+        await rest.delete_message.request(
             self.client.rest, {'channel_id': self.channel.id, 'message_id': message_id}
         )
 
-        return self.upsert(data)
+    def purge(self, messages):
+        """Starts deleting `messages` in the background, see
+        `MessagePurge`
+
+        Returns:
+            MessagePurge: The purge, await it or iterate over it to
+                follow its progress
+        """
+        message_ids = Snowflake.try_snowflake_many(messages)
+        return MessagePurge(state=self, message_ids=message_ids).start()
 
     async def bulk_delete(self, messages):
         message_ids = Snowflake.try_snowflake_many(messages)
@@ -114,12 +496,19 @@ class MessageState(BaseState):
             message_id, = message_ids
             return await self.delete(message_id)
 
-        elif len(message_ids) > 100:
-            raise TypeError('bulk_delete can\'t delete more than 100 messages')
+        purge = MessagePurge(state=self, message_ids=message_ids)
 
-        await rest.bulk_delete_messages.request(
-            self.client.rest, {'channel_id': self.channel.id}, json={'message_ids': message_ids}
-        )
+        if len(purge.batches) == 1 and not purge.singles:
+            await rest.bulk_delete_messages.request(
+                self.client.rest, {'channel_id': self.channel.id},
+                json={'message_ids': message_ids}
+            )
+        else:
+            # Too many or too old for a single request
+            await purge.start()
+
+            if purge.errors:
+                raise purge.errors[0]
 
 
 class ChannelPinsState(BaseSubState):
@@ -58,21 +58,14 @@ class PermissionOverwriteState(BaseState):
         )
 
     def apply_to(self, member):
-        if not isinstance(member, ClientClasses.GuildMember):
-            guild = self.channel.guild
-            if guild is None:
-                return None
+        """Equivalent to `self.channel.permissions_for(member)`"""
+        return self.channel.permissions_for(member)
 
-            member = guild.members.get(member)
-            if member is None:
-                return None
+    def _apply_overwrites(self, member):
+        value = member._get_permissions_value(None)
 
-        permissions = member.permissions
-
-        if permissions.administrator:
-            return permissions
-
-        value = permissions.value
+        if Permissions.from_value(value).administrator:
+            return value
 
         overwrite = self.everyone
         if overwrite is not None:
@@ -90,9 +83,9 @@ class PermissionOverwriteState(BaseState):
         value &= ~deny
         value |= allow
 
-        overwrite = self.get(member)
+        overwrite = self.get(member.id)
         if overwrite is not None:
             value &= ~overwrite.deny.value
             value |= overwrite.allow.value
 
-        return Permissions.from_value(value)
+        return value
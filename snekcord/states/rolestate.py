@@ -4,7 +4,7 @@ from ..clients.client import ClientClasses
 from ..flags import Permissions
 from ..utils import Snowflake
 
-__all__ = ('RoleState', 'GuildMemberRoleState')
+__all__ = ('RoleState', 'GuildMemberRoleState', 'RoleMemberState')
 
 
 class RoleState(BaseState):
@@ -12,6 +12,9 @@ class RoleState(BaseState):
         super().__init__(client=client)
         self.guild = guild
 
+        # role id -> ids of the cached members that have the role
+        self._member_index = {}
+
     @property
     def everyone(self):
         return self.get(self.guild.id)
@@ -27,6 +30,34 @@ class RoleState(BaseState):
 
         return role
 
+    def _index_member(self, member_id, role_ids):
+        for role_id in role_ids:
+            member_ids = self._member_index.get(role_id)
+
+            if member_ids is None:
+                member_ids = self._member_index[role_id] = set()
+
+            member_ids.add(member_id)
+
+    def _unindex_member(self, member_id, role_ids):
+        for role_id in role_ids:
+            member_ids = self._member_index.get(role_id)
+
+            if member_ids is not None:
+                member_ids.discard(member_id)
+
+    def _drop_role(self, role_id):
+        self.guild._invalidate_permissions()
+
+        member_ids = self._member_index.pop(role_id, None)
+
+        if member_ids:
+            for member_id in member_ids:
+                member = self.guild.members.get(member_id)
+
+                if member is not None:
+                    member.roles.remove_key(role_id)
+
     async def fetch_all(self):
         data = await rest.get_guild_roles.request(
             self.client.rest, {'guild_id': self.guild.id}
@@ -116,3 +147,24 @@ class GuildMemberRoleState(BaseSubState):
                 'role_id': role_id
             }
         )
+
+
+class RoleMemberState(BaseSubState):
+    """The cached members that have a role, backed by an index that is
+    updated as members are cached, updated and removed"""
+
+    def __init__(self, *, superstate, role):
+        super().__init__(superstate=superstate)
+        self.role = role
+
+        member_index = role.state._member_index
+        self._keys = member_index.get(role.id)
+
+        if self._keys is None:
+            self._keys = member_index[role.id] = set()
+
+    def add_key(self, key):
+        raise TypeError(f'{self.__class__.__name__} is read-only')
+
+    def remove_key(self, key):
+        raise TypeError(f'{self.__class__.__name__} is read-only')
@@ -1,9 +1,23 @@
+import functools
 import json
 from datetime import datetime
 
 from .exceptions import PartialObjectError
 
-__all__ = ('undefined', 'JsonField', 'JsonArray', 'JsonObject', 'Snowflake')
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+__all__ = (
+    'undefined', 'JsonCodec', 'default_json_codec', 'JsonField', 'JsonArray', 'JsonObject',
+    'Snowflake'
+)
 
 
 class Undefined:
@@ -17,16 +31,88 @@ class Undefined:
 undefined = Undefined()
 
 
+class JsonCodec:
+    """A pair of JSON functions used to decode and encode payloads
+
+    name str: The codec's name
+
+    loads Callable[[str | bytes], Any]: The function used to decode JSON
+
+    dumps Callable[[Any], str | bytes]: The function used to encode JSON
+
+    binary bool: True if dumps returns bytes instead of str
+    """
+    def __init__(self, name, loads, dumps, *, binary=False):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+        self.binary = binary
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} name={self.name!r}, binary={self.binary}>'
+
+    @classmethod
+    def from_stdlib(cls):
+        return cls('json', json.loads, functools.partial(json.dumps, separators=(',', ':')))
+
+    @classmethod
+    def from_orjson(cls):
+        if orjson is None:
+            raise RuntimeError('orjson is not installed')
+        return cls('orjson', orjson.loads, orjson.dumps, binary=True)
+
+    @classmethod
+    def from_ujson(cls):
+        if ujson is None:
+            raise RuntimeError('ujson is not installed')
+        return cls('ujson', ujson.loads, ujson.dumps)
+
+    @classmethod
+    def default(cls):
+        """Returns the fastest codec that is installed, preferring
+        orjson, then ujson and finally the standard library"""
+        if orjson is not None:
+            return cls.from_orjson()
+        elif ujson is not None:
+            return cls.from_ujson()
+        return cls.from_stdlib()
+
+    def dumps_str(self, obj):
+        data = self.dumps(obj)
+        if self.binary:
+            return data.decode()
+        return data
+
+    def dumps_bytes(self, obj):
+        data = self.dumps(obj)
+        if not self.binary:
+            return data.encode()
+        return data
+
+
+default_json_codec = JsonCodec.default()
+
+
 class JsonObject:
-    __slots__ = ('_json_data_',)
+    __slots__ = ('_json_data_', '_json_cache_')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Fields are compiled once the class exists, __set_name__ has
+        # already given every field its name by then
+        for value in cls.__dict__.values():
+            if isinstance(value, JsonField):
+                value._compile_(cls)
 
     @classmethod
     def unmarshal(cls, data=None, **kwargs):
         if isinstance(data, (bytes, bytearray, memoryview, str)):
-            data = json.loads(data)
+            data = default_json_codec.loads(data)
 
         self = cls.__new__(cls)
         self._json_data_ = {}
+        self._json_cache_ = None
         cls.__init__(self, **kwargs)
 
         if data is not None:
@@ -36,17 +122,64 @@ class JsonObject:
 
     def update(self, data):
         self._json_data_.update(data)
+
+        if self._json_cache_:
+            self._invalidate_(*data)
+
         return self
 
+    def diff(self, data):
+        """Returns the raw values that applying `data` would replace, keys
+        that don't change are left out and keys that aren't present yet
+        are mapped to `undefined`"""
+        current = self._json_data_
+        changes = {}
+
+        for key, value in data.items():
+            old = current.get(key, undefined)
+
+            if old is not value and old != value:
+                changes[key] = old
+
+        return changes
+
+    def _invalidate_(self, *keys):
+        # Drops the decoded values of the given keys, the raw
+        # values have to be decoded again on the next access
+        cache = self._json_cache_
+
+        if cache:
+            if len(cache) < len(keys):
+                for key in tuple(cache):
+                    if key in keys:
+                        del cache[key]
+            else:
+                for key in keys:
+                    cache.pop(key, None)
+
     def to_dict(self):
         return self._json_data_
 
     def marshal(self, *args, **kwargs):
-        return json.dumps(self._json_data_, *args, **kwargs)
+        if args or kwargs:
+            return json.dumps(self._json_data_, *args, **kwargs)
+        return default_json_codec.dumps_str(self._json_data_)
+
+
+class JsonField(property):
+    """A field of a JsonObject that reads the value at `key` from the
+    object's raw data
 
+    Fields are properties whose getter is generated for the field when
+    its class is created, so reading a field doesn't have to check how
+    the field is configured. Decoded values are stored in the object's
+    `_json_cache_` until the raw value changes, null values are never
+    decoded.
+    """
 
-class JsonField:
     def __init__(self, key, unmarshaler=None, object=None, default=undefined):
+        super().__init__()
+
         self.key = key
         self.object = object
         self.default = default
@@ -63,35 +196,71 @@ class JsonField:
             raise TypeError(f'{self.__class__.__name__!r} can only be used with JsonObject')
         self.name = name
 
-    def __get__(self, instance, owner):
-        if instance is None:
-            return self
-
-        try:
-            value = instance._json_data_[self.key]
-        except KeyError:
-            if self.default is undefined:
-                raise PartialObjectError(
-                    f'{instance.__class__.__name__} object is missing field {self.name!r}'
-                ) from None
-
-            if callable(self.default):
-                value = self.default()
-            else:
-                value = self.default
-
-        return self._unmarshal_(value)
-
     def __set__(self, instance, value):
         raise AttributeError(f'Cannot set attribute {self.name!r}')
 
     def __delete__(self, instance):
         raise AttributeError(f'Cannot delete attribute {self.name!r}')
 
-    def _unmarshal_(self, value):
-        if self._unmarshaler is not None:
-            return self._unmarshaler(value)
-        return value
+    def _get_unmarshaler_(self):
+        return self._unmarshaler
+
+    def _missing_(self, instance):
+        raise PartialObjectError(
+            f'{instance.__class__.__name__} object is missing field {self.name!r}'
+        )
+
+    def _compile_(self, owner):
+        key = self.key
+        default = self.default
+        unmarshal = self._get_unmarshaler_()
+
+        if default is undefined:
+            missing = self._missing_
+        elif callable(default):
+            def missing(instance):
+                return default()
+        else:
+            def missing(instance):
+                return default
+
+        if unmarshal is None:
+            if default is undefined or callable(default):
+                def fget(instance):
+                    try:
+                        return instance._json_data_[key]
+                    except KeyError:
+                        return missing(instance)
+            else:
+                def fget(instance):
+                    return instance._json_data_.get(key, default)
+        else:
+            def fget(instance):
+                cache = instance._json_cache_
+
+                if cache is None:
+                    cache = instance._json_cache_ = {}
+                else:
+                    try:
+                        return cache[key]
+                    except KeyError:
+                        pass
+
+                try:
+                    value = instance._json_data_[key]
+                except KeyError:
+                    value = missing(instance)
+
+                if value is not None:
+                    value = unmarshal(value)
+
+                cache[key] = value
+                return value
+
+        fget.__name__ = self.name
+        fget.__qualname__ = f'{owner.__qualname__}.{self.name}'
+
+        property.__init__(self, fget)
 
 
 class JsonArray(JsonField):
@@ -99,8 +268,16 @@ class JsonArray(JsonField):
         kwargs.setdefault('default', list)
         super().__init__(*args, **kwargs)
 
-    def _unmarshal_(self, values):
-        return [super(JsonArray, self)._unmarshal_(value) for value in values]
+    def _get_unmarshaler_(self):
+        unmarshaler = self._unmarshaler
+
+        if unmarshaler is None:
+            return list
+
+        def unmarshal(values):
+            return [unmarshaler(value) for value in values]
+
+        return unmarshal
 
 
 class Snowflake(int):
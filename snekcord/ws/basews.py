@@ -15,6 +15,13 @@ class WebSocketResponse(JsonObject):
 
 
 class BaseWebSocket(WebSocketClient):
+    """The base of the gateway websockets
+
+    wsaio releases disagree on whether coroutine callbacks are awaited,
+    the wsaio callbacks are plain functions that run the `on_*`
+    coroutines of subclasses as tasks so they work with either.
+    """
+
     def __init__(self, *, loop=None):
         super().__init__(loop=loop)
 
@@ -25,6 +32,51 @@ class BaseWebSocket(WebSocketClient):
 
         self.ready = asyncio.Event()
 
+        self._callback_tasks = set()
+
+    def _create_callback_task(self, coro):
+        task = self.loop.create_task(coro)
+
+        # The loop only keeps weak references to its tasks
+        self._callback_tasks.add(task)
+        task.add_done_callback(self._callback_tasks.discard)
+
+        return task
+
+    def ws_text_received(self, data):
+        self._create_callback_task(self.on_text_received(data))
+
+    def ws_binary_received(self, data):
+        self._create_callback_task(self.on_binary_received(data))
+
+    def ws_close_received(self, code, data):
+        self._create_callback_task(self.on_close_received(code, data))
+
+    def closing_connection(self, exc):
+        self._create_callback_task(self.on_closing(exc))
+
+    # Newer wsaio releases renamed closing_connection
+    connection_closing = closing_connection
+
+    def connection_lost(self, exc):
+        super().connection_lost(exc)
+        self._create_callback_task(self.on_connection_lost(exc))
+
+    async def on_text_received(self, data):
+        pass
+
+    async def on_binary_received(self, data):
+        pass
+
+    async def on_close_received(self, code, data):
+        pass
+
+    async def on_closing(self, exc):
+        pass
+
+    async def on_connection_lost(self, exc):
+        pass
+
     @property
     def latency(self):
         return self.heartbeat_last_acked - self.heartbeat_last_sent
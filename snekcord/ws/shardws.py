@@ -1,13 +1,22 @@
 import asyncio
-import json
+import heapq
+import itertools
 import platform
 import random
 import time
+import zlib
+from collections import deque
 
 from .basews import BaseWebSocket, WebSocketResponse
-from ..utils import Snowflake
+from ..utils import Snowflake, default_json_codec
 
-__all__ = ('ShardOpcode', 'ShardCloseCode', 'Shard', 'ShardWebSocket')
+__all__ = (
+    'ShardOpcode', 'ShardCloseCode', 'GatewaySendLimiter', 'IdentifyScheduler', 'Shard',
+    'ShardWebSocket'
+)
+
+# Every complete zlib-stream message ends with a Z_SYNC_FLUSH
+ZLIB_SUFFIX = b'\x00\x00\xff\xff'
 
 
 class ShardOpcode:
@@ -42,7 +51,225 @@ class ShardCloseCode:
     DISALLOWED_INTENTS = 4014
 
 
+# The session can't be recovered, reconnecting would fail again
+FATAL_CLOSE_CODES = frozenset({
+    ShardCloseCode.AUTHENTICATION_FAILED,
+    ShardCloseCode.INVALID_SHARD,
+    ShardCloseCode.SHARDING_REQUIRED,
+    ShardCloseCode.INVALID_API_VERSION,
+    ShardCloseCode.INVALID_INTENTS,
+    ShardCloseCode.DISALLOWED_INTENTS,
+})
+
+# The connection can be reopened but the session is gone
+UNRESUMABLE_CLOSE_CODES = frozenset({
+    ShardCloseCode.INVALID_SEQUENCE,
+    ShardCloseCode.SESSION_TIMED_OUT,
+})
+
+
+class GatewaySendLimiter:
+    """A sliding window that paces the payloads sent by a shard
+
+    Discord closes connections that send more than 120 payloads per 60
+    seconds, no `per` second window ever holds more than `limit` sends.
+    `reserved` slots can only be spent by heartbeats so that a burst of
+    other payloads never delays a heartbeat, the remaining payloads are
+    sent in order of priority.
+    """
+    HEARTBEAT_PRIORITY = 0
+
+    # Lower values are sent first
+    PRIORITIES = {
+        ShardOpcode.HEARTBEAT: HEARTBEAT_PRIORITY,
+        ShardOpcode.IDENTIFY: 1,
+        ShardOpcode.RESUME: 1,
+        ShardOpcode.VOICE_STATE_UPDATE: 2,
+        ShardOpcode.PRESENCE_UPDATE: 3,
+        ShardOpcode.REQUEST_GUILD_MEMBERS: 4,
+    }
+    DEFAULT_PRIORITY = 3
+
+    def __init__(self, *, loop, limit=120, per=60.0, reserved=3):
+        self.loop = loop
+        self.limit = limit
+        self.per = per
+        self.reserved = reserved
+
+        # The times of the sends in the current window, oldest first
+        self._sent = deque()
+        self._waiters = []
+        self._counter = itertools.count()
+        self._wakeup_task = None
+
+    @property
+    def queue_depth(self):
+        return len(self._waiters)
+
+    def get_priority(self, opcode):
+        return self.PRIORITIES.get(opcode, self.DEFAULT_PRIORITY)
+
+    @property
+    def tokens(self):
+        self._expire(self.loop.time())
+        return self.limit - len(self._sent)
+
+    def _expire(self, now):
+        while self._sent and self._sent[0] <= now - self.per:
+            self._sent.popleft()
+
+    def _get_threshold(self, priority):
+        if priority == self.HEARTBEAT_PRIORITY:
+            return 1
+        return self.reserved + 1
+
+    def _try_take(self, priority):
+        if self.tokens >= self._get_threshold(priority):
+            self._sent.append(self.loop.time())
+            return True
+
+        return False
+
+    def _get_delay(self, priority):
+        # The wait until enough of the oldest sends leave the window
+        missing = self._get_threshold(priority) - self.tokens
+        return self._sent[missing - 1] + self.per - self.loop.time()
+
+    async def _wakeup(self):
+        while self._waiters:
+            priority, _, future = self._waiters[0]
+
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+
+            if self._try_take(priority):
+                heapq.heappop(self._waiters)
+                future.set_result(None)
+                continue
+
+            await asyncio.sleep(self._get_delay(priority))
+
+        self._wakeup_task = None
+
+    async def acquire(self, priority):
+        # Nothing is queued ahead of this payload
+        if not self._waiters or priority < self._waiters[0][0]:
+            if self._try_take(priority):
+                return
+
+        future = self.loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+
+        if self._waiters[0][2] is future and self._wakeup_task is not None:
+            # The sleeping task waits for the old head's threshold
+            self._wakeup_task.cancel()
+            self._wakeup_task = None
+
+        if self._wakeup_task is None:
+            self._wakeup_task = self.loop.create_task(self._wakeup())
+
+        await future
+
+    def close(self):
+        if self._wakeup_task is not None:
+            self._wakeup_task.cancel()
+            self._wakeup_task = None
+
+        for _, _, future in self._waiters:
+            if not future.done():
+                future.cancel()
+
+        self._waiters.clear()
+
+
+class IdentifyScheduler:
+    """Spaces out shard identifies the way Discord expects them
+
+    Shards are split into `max_concurrency` buckets by
+    `shard_id % max_concurrency`, every bucket identifies at most once
+    per `IDENTIFY_INTERVAL` seconds and the buckets run in parallel.
+    Identifies wait for the session start limit to reset once its
+    remaining budget runs out, the budget is refilled once every
+    `SESSION_START_WINDOW` seconds.
+    """
+    IDENTIFY_INTERVAL = 5.0
+    SESSION_START_WINDOW = 86400.0
+
+    def __init__(self, *, loop, max_concurrency=1, total=None, remaining=None, reset_after=None):
+        self.loop = loop
+        self.max_concurrency = max_concurrency
+        self.total = total
+        self.remaining = remaining
+
+        if reset_after is not None:
+            self.reset_at = self.loop.time() + reset_after
+        else:
+            self.reset_at = None
+
+        self._locks = {}
+        self._ready_at = {}
+        self._budget_lock = asyncio.Lock()
+
+    @classmethod
+    def from_session_start_limit(cls, data, *, loop):
+        return cls(
+            loop=loop, max_concurrency=data.get('max_concurrency', 1), total=data.get('total'),
+            remaining=data.get('remaining'), reset_after=data.get('reset_after', 0) / 1000
+        )
+
+    def get_bucket(self, shard_id):
+        return shard_id % self.max_concurrency
+
+    async def _spend_session_start(self):
+        if self.remaining is None:
+            return
+
+        async with self._budget_lock:
+            if self.reset_at is not None:
+                if self.remaining <= 0:
+                    delay = self.reset_at - self.loop.time()
+
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                now = self.loop.time()
+
+                if now >= self.reset_at:
+                    if self.total is not None:
+                        self.remaining = self.total
+
+                    while self.reset_at <= now:
+                        self.reset_at += self.SESSION_START_WINDOW
+
+            self.remaining -= 1
+
+    async def acquire(self, shard_id):
+        bucket = self.get_bucket(shard_id)
+        lock = self._locks.get(bucket)
+
+        if lock is None:
+            lock = self._locks[bucket] = asyncio.Lock()
+
+        async with lock:
+            delay = self._ready_at.get(bucket, 0.0) - self.loop.time()
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            await self._spend_session_start()
+
+            self._ready_at[bucket] = self.loop.time() + self.IDENTIFY_INTERVAL
+
+
+async def _null_callback(*args):
+    pass
+
+
 class Shard:
+    RECONNECT_BASE_DELAY = 1.0
+    RECONNECT_MAX_DELAY = 60.0
+
     def __init__(self, *, shard_id, client):
         self.id = shard_id
         self.client = client
@@ -50,52 +277,199 @@ class Shard:
         self._callbacks = {
             'HELLO': self.on_hello,
             'READY': self.on_ready,
+            'RESUMED': self.on_resumed,
             'GUILDS_RECEIVED': self.on_guilds_received,
             'DISPATCH': self.on_dispatch,
+            'RECONNECT': self.on_reconnect,
+            'INVALID_SESSION': self.on_invalid_session,
             'CLOSED': self.on_closed,
             'CLOSING': self.on_closing,
             'CONNECTION_LOST': self.on_connection_lost,
         }
 
+        self.ws = None
+        self.user = None
+        self.heartbeater_task = None
+
+        self.url = None
+        self.closed = False
+        self.close_code = None
+        self.reconnect_attempts = 0
+
+        self.chunk_requests = {}
+
+        self._connect_args = ()
+        self._connect_kwargs = {}
+        self._reconnect_task = None
+
         self.create_ws()
 
     @property
     def latency(self):
         return self.ws.latency
 
-    def create_ws(self):
+    def create_ws(self, *, reconnect=False):
+        kwargs = {}
+
+        if self.ws is not None:
+            # Late callbacks from the old connection must not reach the shard
+            self.ws.callbacks = dict.fromkeys(self._callbacks, _null_callback)
+            self.ws.send_limiter.close()
+
+            if self.client.chunk_scheduler is not None:
+                self.client.chunk_scheduler.cancel(self)
+
+            self._fail_chunk_requests()
+
+        if reconnect and self.ws is not None:
+            # Carry the session over so the new connection can resume it
+            kwargs['session_id'] = self.ws.session_id
+            kwargs['sequence'] = self.ws.sequence
+            kwargs['available_guilds'] = self.ws.available_guilds
+            kwargs['unavailable_guilds'] = self.ws.unavailable_guilds
+        else:
+            self.user = None
+
         self.ws = ShardWebSocket(
             self.id, self.client.shard_count, loop=self.client.loop,
             token=self.client.authorization.token, intents=self.client.intents,
-            callbacks=self._callbacks
+            callbacks=self._callbacks, compress=self.client.compress,
+            json_codec=self.client.json_codec, identify_scheduler=self.client.identify_scheduler,
+            **kwargs
         )
 
-        self.user = None
-        self.heartbeater_task = None
+        self._cancel_heartbeater()
+
+    async def connect(self, url, *args, **kwargs):
+        self.url = url
+        self.closed = False
+        self._connect_args = args
+        self._connect_kwargs = kwargs
+
+        await self.ws.connect(url, *args, **kwargs)
+
+    async def close(self, code=1000):
+        self.closed = True
+        self._cancel_heartbeater()
+
+        if self.client.chunk_scheduler is not None:
+            self.client.chunk_scheduler.cancel(self)
+
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+
+        self._fail_chunk_requests()
+
+        await self._close_ws(code)
+
+    async def _close_ws(self, code):
+        transport = self.ws.transport
+
+        if transport is not None and not transport.is_closing():
+            await self.ws.close(code)
+
+    def _fail_chunk_requests(self):
+        # Chunks requested through a lost connection never arrive
+        for request in tuple(self.chunk_requests.values()):
+            request._finish(ConnectionError(
+                f'Shard {self.id} disconnected before every chunk was received'
+            ))
+
+    def _cancel_heartbeater(self):
+        if self.heartbeater_task is not None:
+            self.heartbeater_task.cancel()
+            self.heartbeater_task = None
+
+    def _get_reconnect_delay(self):
+        delay = min(
+            self.RECONNECT_MAX_DELAY, self.RECONNECT_BASE_DELAY * 2 ** self.reconnect_attempts
+        )
+        # Full jitter keeps shards that dropped together from
+        # reconnecting together
+        return random.uniform(0, delay)
+
+    def _schedule_reconnect(self):
+        if self.closed or self.url is None or not self.client.reconnect:
+            return
+
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = self.client.loop.create_task(self.reconnect())
+
+    async def reconnect(self):
+        self._cancel_heartbeater()
+
+        while not self.closed:
+            await asyncio.sleep(self._get_reconnect_delay())
+            self.reconnect_attempts += 1
+
+            self.create_ws(reconnect=True)
+
+            try:
+                await self.ws.connect(self.url, *self._connect_args, **self._connect_kwargs)
+            except Exception:
+                continue
+            else:
+                break
 
     async def on_hello(self):
+        self._cancel_heartbeater()
         self.heartbeater_task = self.client.loop.create_task(self._heartbeater())
 
     async def on_ready(self, data):
+        self.reconnect_attempts = 0
         self.user = self.client.users.upsert(data['user'])
 
+    async def on_resumed(self):
+        self.reconnect_attempts = 0
+
+        if self.client.chunk_scheduler is not None:
+            self.client.chunk_scheduler.resume(self)
+
+        await self.client.dispatch('SHARD_RESUMED', self)
+
     async def on_guilds_received(self):
+        if self.client.chunk_scheduler is not None:
+            self.client.chunk_scheduler.schedule(self)
+
         await self.client.dispatch('SHARD_READY', self)
 
     async def on_dispatch(self, name, data):
         await self.client.dispatch(name, self, data)
 
+    async def on_reconnect(self):
+        # Closing with a non-1000 code keeps the session resumable
+        await self._close_ws(ShardCloseCode.UNKNOWN_ERROR)
+        self._schedule_reconnect()
+
+    async def on_invalid_session(self, resumable):
+        await asyncio.sleep(random.uniform(1, 5))
+
+        if resumable:
+            await self.ws.resume()
+        else:
+            self.ws.reset_session()
+            await self.ws.identify()
+
     async def on_closed(self, code, data):
-        print(f'SHARD {self.id} DIED. {code}, {data}')
+        self.close_code = code
 
-    async def on_closing(self, exc):
-        print(f'SHARD {self.id} DIED. {exc}')
+        if code in FATAL_CLOSE_CODES:
+            self.closed = True
+            self._cancel_heartbeater()
+            await self.client.dispatch('SHARD_CLOSED', self, code)
+            return
 
-    async def on_connection_lost(self, exc):
-        print(f'SHARD {self.id} LOST CONNECTION. {exc}')
+        if code in UNRESUMABLE_CLOSE_CODES:
+            self.ws.reset_session()
+
+        self._schedule_reconnect()
+
+    async def on_closing(self, exc):
+        self._schedule_reconnect()
 
     async def on_connection_lost(self, exc):
-        print(f'SHARD {self.id} LOST CONNECTION. {exc}')
+        self._schedule_reconnect()
 
     async def _heartbeater(self):
         heartbeat_interval = self.ws.heartbeat_interval / 1000
@@ -103,6 +477,13 @@ class Shard:
         await asyncio.sleep(random.random() * heartbeat_interval)
 
         while True:
+            if not self.ws.heartbeat_acked:
+                # The connection is a zombie, Discord stopped answering
+                # without closing it
+                await self._close_ws(ShardCloseCode.UNKNOWN_ERROR)
+                self._schedule_reconnect()
+                return
+
             await self.ws.send_heartbeat()
             await asyncio.sleep(heartbeat_interval)
 
@@ -142,27 +523,62 @@ _MESSAGE_RENAME_TABLE = {
 
 
 class ShardWebSocket(BaseWebSocket):
-    def __init__(self, shard_id, shard_count, *, loop=None, token, intents, callbacks):
+    def __init__(
+        self, shard_id, shard_count, *, loop=None, token, intents, callbacks, compress=False,
+        json_codec=None, session_id=None, sequence=-1, available_guilds=None,
+        unavailable_guilds=None, identify_scheduler=None
+    ):
         super().__init__(loop=loop)
         self.shard_id = shard_id
         self.shard_count = shard_count
         self.token = token
         self.intents = intents
         self.callbacks = callbacks
+        self.compress = compress
+        self.identify_scheduler = identify_scheduler
+        self.send_limiter = GatewaySendLimiter(loop=self.loop)
+
+        if json_codec is not None:
+            self.json_codec = json_codec
+        else:
+            self.json_codec = default_json_codec
+
+        if self.compress:
+            self._inflator = zlib.decompressobj()
+        else:
+            self._inflator = None
+
+        # The buffer keeps its capacity between messages, _inflate_size
+        # is the number of bytes in use
+        self._inflate_buffer = bytearray()
+        self._inflate_size = 0
 
         self.version = None
         self.shard_info = None
-        self.session_id = None
+        self.session_id = session_id
 
         self.startup_guilds = set()
-        self.available_guilds = set()
-        self.unavailable_guilds = set()
 
-        self.sequence = -1
+        if available_guilds is not None:
+            self.available_guilds = available_guilds
+        else:
+            self.available_guilds = set()
+
+        if unavailable_guilds is not None:
+            self.unavailable_guilds = unavailable_guilds
+        else:
+            self.unavailable_guilds = set()
+
+        self.sequence = sequence
+        self.heartbeat_acked = True
 
         self._ready = False
         self._guilds_received = False
 
+    def reset_session(self):
+        self.session_id = None
+        self.sequence = -1
+
     def _remove_startup_guild(self, guild_id):
         try:
             self.startup_guilds.remove(guild_id)
@@ -205,14 +621,27 @@ class ShardWebSocket(BaseWebSocket):
         except KeyError:
             pass
 
+    async def send_payload(self, payload):
+        await self.send_limiter.acquire(self.send_limiter.get_priority(payload['op']))
+
+        data = self.json_codec.dumps(payload)
+
+        # Binary codecs skip the str -> bytes round trip, the frame is
+        # still sent with the text opcode
+        if self.json_codec.binary:
+            await self.send_bytes(data)
+        else:
+            await self.send_str(data)
+
     async def send_heartbeat(self):
         payload = {
             'op': ShardOpcode.HEARTBEAT,
             'd': None
         }
 
-        await self.send_str(json.dumps(payload))
+        await self.send_payload(payload)
 
+        self.heartbeat_acked = False
         self.heartbeat_last_sent = time.perf_counter()
 
     async def identify(self):
@@ -234,7 +663,10 @@ class ShardWebSocket(BaseWebSocket):
         if self.shard_count != 1:
             payload['d']['shard'] = (self.shard_id, self.shard_count)
 
-        await self.send_str(json.dumps(payload))
+        if self.identify_scheduler is not None:
+            await self.identify_scheduler.acquire(self.shard_id)
+
+        await self.send_payload(payload)
 
     async def resume(self):
         payload = {
@@ -246,36 +678,79 @@ class ShardWebSocket(BaseWebSocket):
             }
         }
 
-        await self.send_str(json.dumps(payload))
+        await self.send_payload(payload)
 
-    async def resuest_guild_members(
-        self, guild, presences=None, limit=None, users=None, query=None
+    async def request_guild_members(
+        self, guild, presences=None, limit=None, users=None, query=None, nonce=None
     ):
         payload = {
             'op': ShardOpcode.REQUEST_GUILD_MEMBERS,
-            'guild_id': Snowflake.try_snowflake(guild)
+            'd': {
+                'guild_id': Snowflake.try_snowflake(guild)
+            }
         }
 
         if presences is not None:
-            payload['presences'] = int(presences)
+            payload['d']['presences'] = bool(presences)
 
-        if query is not None:
-            payload['query'] = str(query)
+        if users is not None:
+            payload['d']['user_ids'] = Snowflake.try_snowflake_many(users)
 
             if limit is not None:
-                payload['limit'] = int(limit)
+                payload['d']['limit'] = int(limit)
+        else:
+            # Discord requires either a query or user ids, an empty
+            # query with no limit requests every member
+            if query is not None:
+                payload['d']['query'] = str(query)
             else:
-                payload['limit'] = 0
-        elif users is not None:
-            payload['user_ids'] = Snowflake.try_snowflake_many(users)
+                payload['d']['query'] = ''
 
             if limit is not None:
-                payload['limit'] = int(limit)
+                payload['d']['limit'] = int(limit)
+            else:
+                payload['d']['limit'] = 0
+
+        if nonce is not None:
+            payload['d']['nonce'] = str(nonce)
+
+        await self.send_payload(payload)
+
+    resuest_guild_members = request_guild_members
+
+    def _inflate(self, data):
+        size = self._inflate_size
+
+        if not size and data[-4:] == ZLIB_SUFFIX:
+            # Fast path: the message fit in a single frame
+            return self._inflator.decompress(data)
+
+        end = size + len(data)
+        self._inflate_buffer[size:end] = data
 
-        await self.send_str(json.dumps(payload))
+        # The suffix can be split across frames, the end of the message
+        # is looked for in the buffer
+        if end < 4 or self._inflate_buffer[end - 4:end] != ZLIB_SUFFIX:
+            self._inflate_size = end
+            return None
 
-    async def ws_text_received(self, data):
-        response = WebSocketResponse.unmarshal(data)
+        self._inflate_size = 0
+
+        with memoryview(self._inflate_buffer) as view:
+            with view[:end] as message:
+                return self._inflator.decompress(message)
+
+    async def on_binary_received(self, data):
+        if self._inflator is None:
+            return
+
+        data = self._inflate(data)
+
+        if data is not None:
+            await self.on_text_received(data)
+
+    async def on_text_received(self, data):
+        response = WebSocketResponse.unmarshal(self.json_codec.loads(data))
 
         if response.sequence is not None and response.sequence > self.sequence:
             self.sequence = response.sequence
@@ -296,6 +771,12 @@ class ShardWebSocket(BaseWebSocket):
                 self._ready = True
 
                 await self.callbacks['READY'](response.data)
+            elif name == 'RESUMED':
+                # Guilds were received by the previous connection
+                self._ready = True
+                self._guilds_received = True
+
+                await self.callbacks['RESUMED']()
             elif name == 'GUILD_CREATE':
                 guild_id = response.data['id']
 
@@ -330,25 +811,32 @@ class ShardWebSocket(BaseWebSocket):
             await self.send_heartbeat()
 
         elif response.opcode == ShardOpcode.RECONNECT:
-            pass
+            await self.callbacks['RECONNECT']()
 
         elif response.opcode == ShardOpcode.INVALID_SESSION:
-            pass
+            await self.callbacks['INVALID_SESSION'](bool(response.data))
 
         elif response.opcode == ShardOpcode.HELLO:
             self.heartbeat_interval = response.data['heartbeat_interval']
 
-            await self.identify()
+            # The heartbeater starts first, identify can wait on the
+            # identify scheduler for longer than the heartbeat interval
             await self.callbacks['HELLO']()
 
+            if self.session_id is not None:
+                await self.resume()
+            else:
+                await self.identify()
+
         elif response.opcode == ShardOpcode.HEARTBEAT_ACK:
+            self.heartbeat_acked = True
             self.heartbeat_last_acked = time.perf_counter()
 
-    async def closing_connection(self, exc):
+    async def on_closing(self, exc):
         await self.callbacks['CLOSING'](exc)
 
-    async def ws_close_received(self, code, data):
+    async def on_close_received(self, code, data):
         await self.callbacks['CLOSED'](code, data)
 
-    async def connection_lost(self, exc):
+    async def on_connection_lost(self, exc):
         await self.callbacks['CONNECTION_LOST'](exc)
@@ -0,0 +1,104 @@
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+
+WEBSOCKET_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+
+class FakeGateway:
+    """A minimal gateway that answers HELLO and IDENTIFY, records the
+    payloads it receives"""
+
+    def __init__(self):
+        self.payloads = []
+        self.server = None
+        self.port = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._handle, '127.0.0.1', 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    @property
+    def url(self):
+        return f'ws://127.0.0.1:{self.port}'
+
+    async def _send(self, writer, payload):
+        data = json.dumps(payload).encode()
+
+        if len(data) < 126:
+            header = struct.pack('!BB', 0x81, len(data))
+        else:
+            header = struct.pack('!BBH', 0x81, 126, len(data))
+
+        writer.write(header + data)
+        await writer.drain()
+
+    async def _receive(self, reader):
+        first, second = await reader.readexactly(2)
+        length = second & 0x7F
+
+        if length == 126:
+            length, = struct.unpack('!H', await reader.readexactly(2))
+        elif length == 127:
+            length, = struct.unpack('!Q', await reader.readexactly(8))
+
+        mask = await reader.readexactly(4)
+        data = bytes(b ^ mask[i % 4] for i, b in enumerate(await reader.readexactly(length)))
+
+        return first & 0x0F, data
+
+    async def _handle(self, reader, writer):
+        headers = {}
+
+        await reader.readline()
+        while True:
+            line = (await reader.readline()).decode().strip()
+
+            if not line:
+                break
+
+            name, value = line.split(':', 1)
+            headers[name.strip().lower()] = value.strip()
+
+        accept = base64.b64encode(
+            hashlib.sha1((headers['sec-websocket-key'] + WEBSOCKET_GUID).encode()).digest()
+        ).decode()
+
+        writer.write(
+            b'HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n'
+            b'Connection: Upgrade\r\nSec-WebSocket-Accept: ' + accept.encode() + b'\r\n\r\n'
+        )
+
+        await self._send(writer, {'op': 10, 's': None, 't': None,
+                                  'd': {'heartbeat_interval': 41250}})
+
+        try:
+            while True:
+                opcode, data = await self._receive(reader)
+
+                if opcode == 0x8:
+                    break
+
+                payload = json.loads(data)
+                self.payloads.append(payload)
+
+                if payload['op'] == 2:
+                    shard_id, shard_count = payload['d'].get('shard', (0, 1))
+                    await self._send(writer, {
+                        'op': 0, 's': 1, 't': 'READY',
+                        'd': {
+                            'v': 9, 'session_id': f'session-{shard_id}',
+                            'shard': [shard_id, shard_count], 'guilds': [],
+                            'user': {'id': '1', 'username': 'bot', 'discriminator': '0001'},
+                        }
+                    })
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,25 @@
+import time
+
+from snekcord.cache import TTLCache
+
+
+def test_ttl_cache_expires_oldest_first():
+    cache = TTLCache(0.05)
+    cache['a'] = 1
+    time.sleep(0.06)
+    cache['b'] = 2
+
+    assert 'a' not in cache
+    assert cache['b'] == 2
+    assert cache.evictions == 1
+
+
+def test_ttl_cache_inserts_are_constant_time():
+    cache = TTLCache(60)
+
+    start = time.perf_counter()
+    for i in range(50000):
+        cache[i] = i
+
+    assert len(cache) == 50000
+    assert time.perf_counter() - start < 1
@@ -0,0 +1,125 @@
+import asyncio
+
+from snekcord.clients.wsclient import WebSocketClient
+from snekcord.ws.shardws import Shard
+
+
+def make_client(monkeypatch, member_counts, *, lost=(), **kwargs):
+    client = WebSocketClient('Bot token', chunk_on_startup=True, **kwargs)
+    shard = client.shards[0] = Shard(shard_id=0, client=client)
+
+    for guild_id, member_count in member_counts.items():
+        client.guilds.upsert({'id': guild_id, 'large': True, 'member_count': member_count})
+        shard.ws.available_guilds.add(guild_id)
+
+    requested = []
+    state = {'in_flight': 0, 'max_in_flight': 0}
+
+    async def answer(guild_id, nonce):
+        state['in_flight'] += 1
+        state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+
+        await asyncio.sleep(0.01)
+        state['in_flight'] -= 1
+
+        if requested.count(guild_id) <= lost.count(guild_id):
+            # The chunk never arrives
+            return
+
+        client.chunk_requests[nonce]._add_chunk({'chunk_count': 1}, [])
+
+    async def request_guild_members(guild_id, *, nonce, **kwargs):
+        requested.append(str(guild_id))
+        client.loop.create_task(answer(str(guild_id), nonce))
+
+    def patch_ws():
+        monkeypatch.setattr(shard.ws, 'request_guild_members', request_guild_members)
+
+    patch_ws()
+
+    return client, shard, requested, patch_ws, state
+
+
+def test_chunk_scheduler_orders_by_member_count(monkeypatch):
+    async def main():
+        client, shard, requested, patch_ws, state = make_client(
+            monkeypatch, {'1': 10, '2': 30, '3': 20}
+        )
+
+        waiter = client.register_waiter('shard_chunked', timeout=1)
+        client.chunk_scheduler.schedule(shard)
+        await waiter
+
+        assert requested == ['2', '3', '1']
+        assert client.chunk_scheduler.progress[0] == {'total': 3, 'completed': 3, 'failed': 0}
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_chunk_scheduler_caps_concurrency(monkeypatch):
+    async def main():
+        client, shard, requested, patch_ws, state = make_client(
+            monkeypatch, {str(guild_id): guild_id for guild_id in range(1, 9)},
+            chunk_concurrency=3
+        )
+
+        waiter = client.register_waiter('shard_chunked', timeout=1)
+        client.chunk_scheduler.schedule(shard)
+        await waiter
+
+        assert len(requested) == 8
+        assert state['max_in_flight'] == 3
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_chunk_scheduler_retries_lost_chunks_then_gives_up(monkeypatch):
+    async def main():
+        client, shard, requested, patch_ws, state = make_client(
+            monkeypatch, {'1': 20, '2': 10}, lost=('1', '2', '2'), chunk_timeout=0.05
+        )
+
+        waiter = client.register_waiter('shard_chunked', timeout=1)
+        client.chunk_scheduler.schedule(shard)
+        await waiter
+
+        # Guild 1 is chunked by its retry, guild 2 loses both attempts
+        assert requested == ['1', '1', '2', '2']
+        assert client.chunk_scheduler.progress[0] == {'total': 2, 'completed': 1, 'failed': 1}
+        assert not client.chunk_requests
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_chunk_scheduler_stops_on_reconnect_and_resumes(monkeypatch):
+    async def main():
+        client, shard, requested, patch_ws, state = make_client(monkeypatch, {'1': 20, '2': 10})
+
+        client.chunk_scheduler.schedule(shard)
+        while not requested:
+            await asyncio.sleep(0)
+
+        shard.create_ws(reconnect=True)
+        patch_ws()
+        await asyncio.sleep(0.05)
+
+        # The request in flight failed and nothing else was requested
+        assert requested == ['1']
+        assert not client.chunk_requests
+
+        waiter = client.register_waiter('shard_chunked', timeout=1)
+        await shard.on_resumed()
+        await waiter
+
+        assert requested == ['1', '1', '2']
+        assert client.chunk_scheduler.progress[0] == {'total': 2, 'completed': 2, 'failed': 0}
+
+        await client.close()
+
+    asyncio.run(main())
@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from snekcord.clients.cluster import ClusterConnection, ClusterCoordinator
+from snekcord.exceptions import ClusterError
+from snekcord.ws.shardws import ShardOpcode
+
+from .fakegateway import FakeGateway
+
+
+async def _wait_for(predicate, timeout):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+
+    while not predicate():
+        if loop.time() > deadline:
+            raise asyncio.TimeoutError
+        await asyncio.sleep(0.1)
+
+
+def test_cluster_identifies_against_fake_gateway():
+    async def main():
+        gateway = FakeGateway()
+        await gateway.start()
+
+        coordinator = ClusterCoordinator(
+            'Bot token', shard_count=2, cluster_count=2, gateway_url=gateway.url,
+            session_start_limit={
+                'total': 1000, 'remaining': 1000, 'reset_after': 0, 'max_concurrency': 2
+            },
+            health_check_interval=3600
+        )
+
+        try:
+            await coordinator.start()
+
+            def identified():
+                return len([p for p in gateway.payloads if p['op'] == ShardOpcode.IDENTIFY]) == 2
+
+            await _wait_for(identified, 30)
+
+            shards = sorted(
+                tuple(p['d']['shard']) for p in gateway.payloads
+                if p['op'] == ShardOpcode.IDENTIFY
+            )
+            assert shards == [(0, 2), (1, 2)]
+
+            await _wait_for(lambda: len(coordinator.connections) == 2, 10)
+
+            data = await coordinator.request(0, 'ping', timeout=10)
+            assert data['cluster_id'] == 0
+
+            process = coordinator.processes[1]
+            await coordinator.restart(1)
+            assert not process.is_alive()
+            assert coordinator.processes[1].is_alive()
+        finally:
+            await coordinator.close()
+            await gateway.close()
+
+    asyncio.run(main())
+
+
+def test_coordinator_refuses_wrong_secret():
+    async def main():
+        loop = asyncio.get_running_loop()
+        coordinator = ClusterCoordinator('Bot token', shard_count=1, cluster_count=1)
+
+        server = await asyncio.start_server(coordinator._accept, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+
+        async def handler(connection, op, data):
+            return None
+
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        connection = ClusterConnection(reader, writer, handler, loop=loop)
+        connection.start()
+
+        with pytest.raises(ClusterError):
+            await connection.request('fetch_guild', {'guild_id': '1'}, timeout=5)
+
+        with pytest.raises(ClusterError):
+            await connection.request('hello', {'cluster_id': 0, 'secret': 'wrong'}, timeout=5)
+
+        assert coordinator.connections == {}
+
+        await connection.close()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(main())
+
+
+class FakeProcess:
+    def is_alive(self):
+        return True
+
+
+def test_health_check_restarts_workers_that_never_connect(monkeypatch):
+    async def main():
+        loop = asyncio.get_running_loop()
+        coordinator = ClusterCoordinator(
+            'Bot token', shard_count=2, cluster_count=2, startup_timeout=30
+        )
+
+        restarted = []
+
+        async def restart(cluster_id):
+            restarted.append(cluster_id)
+
+        monkeypatch.setattr(coordinator, 'restart', restart)
+
+        for cluster_id in (0, 1):
+            coordinator.processes[cluster_id] = FakeProcess()
+
+        coordinator.spawned_at[0] = loop.time() - 10
+        coordinator.spawned_at[1] = loop.time() - 60
+
+        assert await coordinator.check_health(0) is True
+        assert await coordinator.check_health(1) is False
+        assert restarted == [1]
+
+    asyncio.run(main())
@@ -0,0 +1,65 @@
+import asyncio
+
+from snekcord.clients.wsclient import WebSocketClient
+from snekcord.utils import JsonField, JsonObject, undefined
+
+
+class Sample(JsonObject):
+    __slots__ = ()
+
+    name = JsonField('name')
+
+
+def test_diff_keeps_only_changed_keys():
+    sample = Sample.unmarshal({'name': 'old', 'topic': None, 'tags': ['a'], 'nsfw': False})
+
+    changes = sample.diff({'name': 'new', 'topic': None, 'tags': ['a'], 'nsfw': True, 'new': 1})
+
+    assert changes == {'name': 'old', 'nsfw': False, 'new': undefined}
+
+
+def test_diff_does_not_apply_the_payload():
+    sample = Sample.unmarshal({'name': 'old'})
+
+    sample.diff({'name': 'new'})
+
+    assert sample.name == 'old'
+    assert sample.diff({}) == {}
+
+
+def test_update_events_carry_changes():
+    async def main():
+        client = WebSocketClient('Bot token')
+        guild = client.guilds.upsert({'id': '1', 'name': 'guild'})
+        guild.roles.upsert({'id': '2', 'name': 'old', 'color': 0, 'position': 1})
+
+        waiter = client.register_waiter('guild_role_update', timeout=1)
+        await client.dispatch('GUILD_ROLE_UPDATE', None, {
+            'guild_id': '1', 'role': {'id': '2', 'name': 'new', 'color': 0, 'position': 1}
+        })
+        event = await waiter
+
+        assert event.changes == {'name': 'old'}
+        assert event.role.name == 'new'
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_update_events_of_uncached_objects_have_no_changes():
+    async def main():
+        client = WebSocketClient('Bot token')
+
+        waiter = client.register_waiter('channel_update', timeout=1)
+        await client.dispatch('CHANNEL_UPDATE', None, {
+            'id': '3', 'type': 0, 'guild_id': '1', 'name': 'channel'
+        })
+        event = await waiter
+
+        assert event.changes is None
+        assert event.channel.name == 'channel'
+
+        await client.close()
+
+    asyncio.run(main())
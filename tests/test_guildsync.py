@@ -0,0 +1,79 @@
+import asyncio
+
+import snekcord
+from snekcord import rest
+from snekcord.flags import CacheFlags
+
+SYNC_ENDPOINTS = {
+    'get_guild_bans': [],
+    'get_guild_integrations': [],
+    'get_guild_invites': [],
+    'get_guild_widget': {'enabled': False, 'channel_id': None},
+}
+
+
+def _patch_endpoints(monkeypatch, state):
+    def make_request(result):
+        async def request(session, fmt=None, **kwargs):
+            state['in_flight'] += 1
+            state['peak'] = max(state['peak'], state['in_flight'])
+
+            await asyncio.sleep(0.01)
+
+            state['in_flight'] -= 1
+            state['requests'] += 1
+            return result
+
+        return request
+
+    for name, result in SYNC_ENDPOINTS.items():
+        monkeypatch.setattr(getattr(rest, name), 'request', make_request(result))
+
+
+def _guilds(client, count):
+    return [client.guilds.upsert({'id': str(guild_id), 'name': 'guild'})
+            for guild_id in range(1, count + 1)]
+
+
+def test_sync_requests_are_capped_across_guilds(monkeypatch):
+    state = {'in_flight': 0, 'peak': 0, 'requests': 0}
+    _patch_endpoints(monkeypatch, state)
+
+    async def main():
+        client = snekcord.Client('Bot token', cache_flags=CacheFlags.all(), sync_concurrency=3)
+
+        await asyncio.gather(*(guild.sync({}) for guild in _guilds(client, 5)))
+
+        assert state['requests'] == 20
+        assert state['peak'] == 3
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_deferred_syncs_run_in_the_background(monkeypatch):
+    state = {'in_flight': 0, 'peak': 0, 'requests': 0}
+    _patch_endpoints(monkeypatch, state)
+
+    async def main():
+        client = snekcord.Client(
+            'Bot token', cache_flags=CacheFlags.all(), sync_concurrency=2, defer_sync=True
+        )
+        guilds = _guilds(client, 4)
+
+        for guild in guilds:
+            await client.sync_guild(guild, {'id': str(guild.id), 'widget_enabled': False})
+
+        assert state['requests'] == 0
+
+        await asyncio.wait_for(client.wait_synced(), 1)
+
+        # widget_enabled in the payload skips the widget request
+        assert state['requests'] == 12
+        assert state['peak'] <= 2
+        assert not any(guild.unsynced for guild in guilds)
+
+        await client.close()
+
+    asyncio.run(main())
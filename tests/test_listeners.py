@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+
+import snekcord
+
+
+async def _run_listener(overflow, events, *, maxsize=2, concurrency=1):
+    client = snekcord.Client('Bot token')
+    release = asyncio.Event()
+    received = []
+
+    async def callback(value):
+        await release.wait()
+        received.append(value)
+
+    listener = client.register_listener(
+        'test', callback, concurrency=concurrency, maxsize=maxsize, overflow=overflow
+    )
+
+    for value in events:
+        await client.dispatch('test', value)
+        # Let the workers pick up the event
+        await asyncio.sleep(0)
+
+    release.set()
+
+    while listener.queue_depth or listener._workers:
+        await asyncio.sleep(0)
+
+    await client.close()
+
+    return listener, received
+
+
+def test_drop_newest_overflow():
+    async def main():
+        listener, received = await _run_listener('drop_newest', range(5))
+
+        # 0 is being handled, 1 and 2 fill the queue
+        assert received == [0, 1, 2]
+        assert listener.dropped == 2
+        assert listener.processed == 3
+
+    asyncio.run(main())
+
+
+def test_drop_oldest_overflow():
+    async def main():
+        listener, received = await _run_listener('drop_oldest', range(5))
+
+        assert received == [0, 3, 4]
+        assert listener.dropped == 2
+
+    asyncio.run(main())
+
+
+def test_block_overflow_waits_for_room():
+    async def main():
+        client = snekcord.Client('Bot token')
+        release = asyncio.Event()
+        received = []
+
+        async def callback(value):
+            await release.wait()
+            received.append(value)
+
+        client.register_listener('test', callback, concurrency=1, maxsize=1, overflow='block')
+
+        await client.dispatch('test', 0)
+        await asyncio.sleep(0)
+        await client.dispatch('test', 1)
+
+        blocked = asyncio.ensure_future(client.dispatch('test', 2))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        release.set()
+        await asyncio.wait_for(blocked, 1)
+
+        while len(received) < 3:
+            await asyncio.sleep(0)
+
+        assert received == [0, 1, 2]
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_concurrency_cap():
+    async def main():
+        client = snekcord.Client('Bot token')
+        running = []
+        peak = []
+
+        async def callback(value):
+            running.append(value)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(value)
+
+        listener = client.register_listener('test', callback, concurrency=3)
+
+        for value in range(10):
+            await client.dispatch('test', value)
+
+        while listener.processed < 10:
+            await asyncio.sleep(0.01)
+
+        assert max(peak) == 3
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_failed_callbacks_are_not_counted_as_processed():
+    async def main():
+        errors = []
+        client = snekcord.Client('Bot token')
+        client.error_hook = lambda listener, exc: errors.append(exc)
+
+        def callback(value):
+            if value % 2:
+                raise ValueError(value)
+
+        listener = client.register_listener('test', callback, sync=True)
+
+        for value in range(4):
+            await client.dispatch('test', value)
+
+        while listener.queue_depth or listener._workers:
+            await asyncio.sleep(0)
+
+        assert listener.metrics()['processed'] == 2
+        assert listener.metrics()['failed'] == 2
+        assert [exc.args[0] for exc in errors] == [1, 3]
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_unknown_overflow_policy():
+    async def main():
+        client = snekcord.Client('Bot token')
+
+        with pytest.raises(ValueError):
+            client.register_listener('test', print, overflow='spill')
+
+        await client.close()
+
+    asyncio.run(main())
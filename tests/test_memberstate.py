@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from snekcord.clients.wsclient import WebSocketClient
+from snekcord.states.memberstate import MemberChunkRequest
+from snekcord.ws.shardws import Shard
+
+
+def test_chunk_request_iteration_timeout_forgets_nonce():
+    async def main():
+        client = WebSocketClient('Bot token')
+        guild = client.guilds.upsert({'id': '1'})
+
+        request = MemberChunkRequest(guild=guild, nonce='nonce', timeout=0.01)
+        client.chunk_requests[request.nonce] = request
+
+        with pytest.raises(asyncio.TimeoutError):
+            async for _ in request:
+                pass
+
+        assert request.done
+        assert 'nonce' not in client.chunk_requests
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_chunk_request_end_marker_ends_every_iterator():
+    async def main():
+        client = WebSocketClient('Bot token')
+        guild = client.guilds.upsert({'id': '1'})
+
+        request = MemberChunkRequest(guild=guild, nonce='nonce', timeout=1)
+        client.chunk_requests[request.nonce] = request
+        request._add_chunk({'chunk_count': 1}, ['member'])
+
+        assert [member async for member in request] == ['member']
+        # The first iterator consumed the marker, the second one still ends
+        assert [member async for member in request] == []
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_chunk_requests_fail_when_the_shard_reconnects(monkeypatch):
+    async def main():
+        client = WebSocketClient('Bot token')
+        guild = client.guilds.upsert({'id': '1'})
+        shard = client.shards[0] = Shard(shard_id=0, client=client)
+
+        sent = asyncio.Event()
+
+        async def request_guild_members(*args, **kwargs):
+            sent.set()
+
+        monkeypatch.setattr(shard.ws, 'request_guild_members', request_guild_members)
+
+        request = guild.members.request_chunked(timeout=1)
+        await sent.wait()
+
+        assert shard.chunk_requests == {request.nonce: request}
+
+        shard.create_ws(reconnect=True)
+
+        with pytest.raises(ConnectionError):
+            await request
+
+        assert not shard.chunk_requests
+        assert not client.chunk_requests
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_chunk_request_cancelled_send_fails_the_request(monkeypatch):
+    async def main():
+        client = WebSocketClient('Bot token')
+        guild = client.guilds.upsert({'id': '1'})
+        shard = client.shards[0] = Shard(shard_id=0, client=client)
+
+        async def request_guild_members(*args, **kwargs):
+            await asyncio.sleep(60)
+
+        monkeypatch.setattr(shard.ws, 'request_guild_members', request_guild_members)
+
+        request = MemberChunkRequest(guild=guild, nonce='nonce', shard=shard)
+        task = asyncio.ensure_future(request._send(shard))
+        await asyncio.sleep(0)
+
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        with pytest.raises(ConnectionError):
+            await request
+
+        await client.close()
+
+    asyncio.run(main())
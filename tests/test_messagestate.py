@@ -0,0 +1,152 @@
+import asyncio
+import gzip
+import json
+import time
+
+import snekcord
+from snekcord import rest
+from snekcord.states.messagestate import MessageCachePolicy
+from snekcord.utils import Snowflake
+
+
+def test_purge_can_be_iterated_after_it_finished(monkeypatch):
+    async def bulk_delete(session, fmt=None, **kwargs):
+        pass
+
+    monkeypatch.setattr(rest.bulk_delete_messages, 'request', bulk_delete)
+
+    async def main():
+        client = snekcord.Client('Bot token')
+        channel = client.channels.upsert({'id': '1', 'type': 0, 'guild_id': '2'})
+
+        now = time.time()
+        message_ids = [Snowflake.build(now - i, increment=i) for i in range(1, 151)]
+
+        purge = channel.messages.purge(message_ids)
+
+        async def collect():
+            return [batch async for batch in purge]
+
+        batches = await asyncio.wait_for(collect(), 1)
+        assert sum(map(len, batches)) == 150
+
+        # The purge is over, a second iteration ends right away
+        assert await asyncio.wait_for(collect(), 1) == []
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_export_history_accepts_ids(tmp_path, monkeypatch):
+    async def get_channel(session, fmt=None, **kwargs):
+        return {'id': str(fmt['channel_id']), 'type': 0, 'guild_id': '2'}
+
+    async def get_channel_messages(session, fmt=None, params=None, **kwargs):
+        before = params.get('before', 251)
+        return [
+            {'id': str(i), 'channel_id': str(fmt['channel_id'])}
+            for i in range(before - 1, max(before - 1 - params['limit'], 0), -1)
+        ]
+
+    monkeypatch.setattr(rest.get_channel, 'request', get_channel)
+    monkeypatch.setattr(rest.get_channel_messages, 'request', get_channel_messages)
+
+    async def main():
+        client = snekcord.Client('Bot token')
+        client.channels.upsert({'id': '1', 'type': 0, 'guild_id': '2'})
+
+        counts = await client.channels.export_history(['1', 3], str(tmp_path))
+
+        assert counts == {1: 250, 3: 250}
+        assert client.channels.get(3) is not None
+        assert len(client.channels.get(1).messages) == 0
+
+        with gzip.open(tmp_path / '3.ndjson.gz') as fp:
+            lines = fp.read().splitlines()
+
+        assert [json.loads(line)['id'] for line in lines] == [str(i) for i in range(250, 0, -1)]
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def _cache_messages(channel, ids, **extra):
+    for message_id in ids:
+        data = {'id': str(message_id), 'channel_id': str(channel.id), 'pinned': False}
+        channel.messages.upsert(dict(data, **extra))
+
+
+def test_message_cache_policy_evicts_oldest_per_channel():
+    async def main():
+        policy = MessageCachePolicy(max_messages=3)
+        client = snekcord.Client('Bot token', message_cache_policy=policy)
+        first = client.channels.upsert({'id': '1', 'type': 0, 'guild_id': '2'})
+        second = client.channels.upsert({'id': '3', 'type': 0, 'guild_id': '2'})
+
+        _cache_messages(first, range(10, 15))
+        _cache_messages(second, range(20, 22))
+
+        assert [message.id for message in first.messages] == [12, 13, 14]
+        assert [message.id for message in second.messages] == [20, 21]
+        assert len(policy) == 5
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_message_cache_policy_protects_referenced_messages():
+    async def main():
+        policy = MessageCachePolicy(max_messages=3)
+        client = snekcord.Client('Bot token', message_cache_policy=policy)
+        channel = client.channels.upsert({'id': '1', 'type': 0, 'guild_id': '2'})
+
+        _cache_messages(channel, [10])
+        channel.messages.upsert({
+            'id': '11', 'channel_id': '1', 'pinned': False,
+            'message_reference': {'message_id': '10', 'channel_id': '1'}
+        })
+        _cache_messages(channel, [12, 13])
+
+        # 10 is referenced by the cached reply, the reply itself is evicted
+        assert [message.id for message in channel.messages] == [10, 12, 13]
+        assert channel.messages.get(10) is not None
+        assert channel.messages.get(11) is None
+
+        # Once the reply is gone 10 can be evicted as well
+        _cache_messages(channel, [14])
+        assert channel.messages.get(10) is None
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_message_cache_policy_global_limit_and_ttl(monkeypatch):
+    async def main():
+        clock = [1000.0]
+        monkeypatch.setattr(time, 'monotonic', lambda: clock[0])
+
+        policy = MessageCachePolicy(max_messages=None, max_total=3, ttl=60)
+        client = snekcord.Client('Bot token', message_cache_policy=policy)
+        first = client.channels.upsert({'id': '1', 'type': 0, 'guild_id': '2'})
+        second = client.channels.upsert({'id': '3', 'type': 0, 'guild_id': '2'})
+
+        _cache_messages(first, [10, 11])
+        _cache_messages(second, [20, 21])
+
+        # The oldest message across every channel is evicted
+        assert first.messages.get(10) is None
+        assert len(policy) == 3
+
+        clock[0] += 61
+        _cache_messages(second, [22])
+
+        assert [message.id for message in second.messages] == [22]
+        assert len(policy) == 1
+
+        await client.close()
+
+    asyncio.run(main())
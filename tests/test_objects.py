@@ -0,0 +1,46 @@
+import pytest
+
+from snekcord.objects.channelobject import CategoryChannel, DMChannel, TextChannel, VoiceChannel
+from snekcord.objects.embedobject import (
+    Embed, EmbedAuthor, EmbedField, EmbedFooter, EmbedImage, EmbedProvider, EmbedThumbnail,
+    EmbedVideo
+)
+from snekcord.objects.emojiobject import GuildEmoji
+from snekcord.objects.integrationobject import IntegrationAccount
+from snekcord.objects.overwriteobject import PermissionOverwrite
+from snekcord.objects.roleobject import Role, RoleTags
+from snekcord.objects.stageobject import StageInstance
+from snekcord.objects.templateobject import GuildTemplate
+from snekcord.objects.userobject import User
+from snekcord.objects.widgetobject import GuildWidgetChannel, GuildWidgetMember
+
+SLOTTED_CLASSES = (
+    Embed, EmbedAuthor, EmbedField, EmbedFooter, EmbedImage, EmbedProvider, EmbedThumbnail,
+    EmbedVideo, RoleTags, Role, User, GuildEmoji, IntegrationAccount, PermissionOverwrite,
+    StageInstance, GuildTemplate, TextChannel, CategoryChannel, VoiceChannel, DMChannel,
+    GuildWidgetChannel, GuildWidgetMember
+)
+
+
+@pytest.mark.parametrize('cls', SLOTTED_CLASSES, ids=lambda cls: cls.__name__)
+def test_instances_have_no_dict(cls):
+    instance = cls.__new__(cls)
+
+    assert not hasattr(instance, '__dict__')
+
+    with pytest.raises(AttributeError):
+        instance.unknown_attribute = None
+
+
+def test_embed_fields_decode_nested_objects():
+    embed = Embed.unmarshal({
+        'title': 'title',
+        'footer': {'text': 'footer'},
+        'fields': [{'name': 'name', 'value': 'value', 'inline': True}],
+    })
+
+    assert embed.title == 'title'
+    assert isinstance(embed.footer, EmbedFooter)
+    assert embed.footer.text == 'footer'
+    assert [field.name for field in embed.fields] == ['name']
+    assert not hasattr(embed.footer, '__dict__')
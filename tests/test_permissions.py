@@ -0,0 +1,119 @@
+import asyncio
+
+from snekcord.clients.wsclient import WebSocketClient
+
+VIEW_CHANNEL = 1 << 10
+SEND_MESSAGES = 1 << 11
+MANAGE_MESSAGES = 1 << 13
+ADMINISTRATOR = 1 << 3
+
+
+def _role(role_id, permissions):
+    return {'id': str(role_id), 'name': str(role_id), 'position': 1,
+            'permissions': str(permissions)}
+
+
+def _overwrite(target_id, type, *, allow=0, deny=0):
+    return {'id': str(target_id), 'type': type, 'allow': str(allow), 'deny': str(deny)}
+
+
+def _setup():
+    client = WebSocketClient('Bot token')
+    guild = client.guilds.upsert({'id': '1', 'name': 'guild', 'owner_id': '999'})
+
+    guild.roles.upsert(_role(1, VIEW_CHANNEL | SEND_MESSAGES))
+    guild.roles.upsert(_role(10, MANAGE_MESSAGES))
+
+    member = guild.members.upsert({
+        'user': {'id': '100', 'username': 'user', 'discriminator': '0001'}, 'roles': ['10']
+    })
+
+    channel = client.channels.upsert({
+        'id': '2', 'type': 0, 'guild_id': '1', 'name': 'channel',
+        'permission_overwrites': [_overwrite(10, 0, deny=SEND_MESSAGES)]
+    })
+
+    return client, guild, member, channel
+
+
+def _value(channel, member):
+    return channel.permissions_for(member).value
+
+
+def test_overwrites_apply_and_are_cached():
+    async def main():
+        client, guild, member, channel = _setup()
+
+        assert _value(channel, member) == VIEW_CHANNEL | MANAGE_MESSAGES
+        assert guild._permission_cache[member.id][channel.id] == VIEW_CHANNEL | MANAGE_MESSAGES
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_role_updates_invalidate():
+    async def main():
+        client, guild, member, channel = _setup()
+        _value(channel, member)
+
+        guild.roles.upsert(_role(10, ADMINISTRATOR))
+
+        assert not guild._permission_cache
+        assert channel.permissions_for(member).administrator
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_overwrite_changes_invalidate():
+    async def main():
+        client, guild, member, channel = _setup()
+        _value(channel, member)
+
+        client.channels.upsert({
+            'id': '2', 'type': 0, 'guild_id': '1',
+            'permission_overwrites': [_overwrite(100, 1, deny=VIEW_CHANNEL)]
+        })
+
+        assert _value(channel, member) == SEND_MESSAGES | MANAGE_MESSAGES
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_member_role_changes_invalidate_only_that_member():
+    async def main():
+        client, guild, member, channel = _setup()
+        other = guild.members.upsert({
+            'user': {'id': '101', 'username': 'user', 'discriminator': '0001'}, 'roles': []
+        })
+
+        _value(channel, member)
+        _value(channel, other)
+
+        member.update({'roles': []})
+
+        assert member.id not in guild._permission_cache
+        assert other.id in guild._permission_cache
+        assert _value(channel, member) == VIEW_CHANNEL | SEND_MESSAGES
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_owner_changes_invalidate():
+    async def main():
+        client, guild, member, channel = _setup()
+        _value(channel, member)
+
+        guild.update({'owner_id': '100'})
+
+        assert channel.permissions_for(member).administrator
+
+        await client.close()
+
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+import asyncio
+
+from snekcord.rest.ratelimit import RateLimiter
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers):
+        self.status_code = status_code
+        self.headers = headers
+
+
+def test_reset_after_429_without_limit():
+    async def main():
+        ratelimiter = RateLimiter(loop=asyncio.get_running_loop())
+        bucket = ratelimiter.get_bucket('GET', '/channels/%(channel_id)s', {'channel_id': 1})
+
+        await bucket.acquire()
+        ratelimiter.update(
+            bucket, 'GET', '/channels/%(channel_id)s', FakeResponse(429, {}),
+            {'retry_after': 0.05}
+        )
+
+        assert bucket.limit is None
+        assert bucket.remaining == 0
+
+        await asyncio.wait_for(bucket.acquire(), 1)
+        assert bucket.remaining == 0
+
+    asyncio.run(main())
+
+
+def test_429_reads_limit():
+    async def main():
+        ratelimiter = RateLimiter(loop=asyncio.get_running_loop())
+        bucket = ratelimiter.get_bucket('GET', '/users/@me')
+
+        await bucket.acquire()
+        ratelimiter.update(
+            bucket, 'GET', '/users/@me', FakeResponse(429, {'X-RateLimit-Limit': '5'}),
+            {'retry_after': 0.01}
+        )
+
+        assert bucket.limit == 5
+
+        await asyncio.sleep(0.02)
+        await bucket.acquire()
+        assert bucket.remaining == 4
+
+    asyncio.run(main())
+
+
+def test_bucket_keeps_state_when_hash_is_learned():
+    async def main():
+        ratelimiter = RateLimiter(loop=asyncio.get_running_loop())
+        fmt = {'channel_id': 1}
+        bucket = ratelimiter.get_bucket('GET', '/channels/%(channel_id)s', fmt)
+
+        await bucket.acquire()
+        ratelimiter.update(
+            bucket, 'GET', '/channels/%(channel_id)s',
+            FakeResponse(200, {
+                'X-RateLimit-Limit': '5', 'X-RateLimit-Remaining': '4',
+                'X-RateLimit-Reset-After': '1', 'X-RateLimit-Bucket': 'abc'
+            })
+        )
+
+        assert ratelimiter.get_bucket('GET', '/channels/%(channel_id)s', fmt) is bucket
+        assert bucket.key[0] == 'abc'
+        assert bucket.remaining == 4
+
+    asyncio.run(main())
+
+
+def test_headerless_error_does_not_unlimit_bucket():
+    async def main():
+        ratelimiter = RateLimiter(loop=asyncio.get_running_loop())
+        bucket = ratelimiter.get_bucket('GET', '/users/@me')
+
+        await bucket.acquire()
+        ratelimiter.update(bucket, 'GET', '/users/@me', FakeResponse(502, {}))
+
+        assert not bucket.unlimited
+
+        await asyncio.wait_for(bucket.acquire(), 1)
+        ratelimiter.update(
+            bucket, 'GET', '/users/@me',
+            FakeResponse(200, {
+                'X-RateLimit-Limit': '2', 'X-RateLimit-Remaining': '0',
+                'X-RateLimit-Reset-After': '0.2'
+            })
+        )
+
+        assert not bucket.unlimited
+        assert bucket.remaining == 0
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await bucket.acquire()
+        assert loop.time() - start >= 0.15
+
+    asyncio.run(main())
+
+
+def test_headerless_success_unlimits_bucket():
+    async def main():
+        ratelimiter = RateLimiter(loop=asyncio.get_running_loop())
+        bucket = ratelimiter.get_bucket('GET', '/gateway')
+
+        await bucket.acquire()
+        ratelimiter.update(bucket, 'GET', '/gateway', FakeResponse(200, {}))
+
+        assert bucket.unlimited
+
+    asyncio.run(main())
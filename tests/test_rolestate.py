@@ -0,0 +1,96 @@
+import asyncio
+
+from snekcord.clients.wsclient import WebSocketClient
+
+
+def _member(user_id, roles):
+    return {
+        'user': {'id': str(user_id), 'username': 'user', 'discriminator': '0001'},
+        'roles': [str(role_id) for role_id in roles],
+    }
+
+
+def _setup():
+    client = WebSocketClient('Bot token')
+    guild = client.guilds.upsert({'id': '1', 'name': 'guild'})
+
+    for role_id in (10, 11, 12):
+        guild.roles.upsert({'id': str(role_id), 'name': str(role_id), 'position': 1})
+
+    return client, guild
+
+
+def _member_ids(guild, role_id):
+    return sorted(member.id for member in guild.roles.get(role_id).members)
+
+
+def test_role_members_follow_member_updates():
+    async def main():
+        client, guild = _setup()
+
+        guild.members.upsert(_member(100, [10, 11]))
+        guild.members.upsert(_member(101, [11]))
+
+        assert _member_ids(guild, 10) == [100]
+        assert _member_ids(guild, 11) == [100, 101]
+
+        payload = dict(_member(100, [11, 12]), guild_id='1')
+        await client.dispatch('GUILD_MEMBER_UPDATE', None, payload)
+
+        assert _member_ids(guild, 10) == []
+        assert _member_ids(guild, 11) == [100, 101]
+        assert _member_ids(guild, 12) == [100]
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_removed_members_leave_the_index():
+    async def main():
+        client, guild = _setup()
+
+        guild.members.upsert(_member(100, [10]))
+        guild.members.upsert(_member(101, [10]))
+
+        await client.dispatch('GUILD_MEMBER_REMOVE', None, {
+            'guild_id': '1', 'user': {'id': '100', 'username': 'user', 'discriminator': '0001'}
+        })
+
+        assert _member_ids(guild, 10) == [101]
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_deleted_roles_leave_members():
+    async def main():
+        client, guild = _setup()
+
+        member = guild.members.upsert(_member(100, [10, 11]))
+
+        await client.dispatch('GUILD_ROLE_DELETE', None, {'guild_id': '1', 'role_id': '10'})
+
+        assert sorted(role.id for role in member.roles) == [11]
+        assert 10 not in guild.roles._member_index
+        assert _member_ids(guild, 11) == [100]
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_everyone_role_has_every_member():
+    async def main():
+        client, guild = _setup()
+        guild.roles.upsert({'id': '1', 'name': '@everyone', 'position': 0})
+
+        guild.members.upsert(_member(100, []))
+        guild.members.upsert(_member(101, [10]))
+
+        assert _member_ids(guild, 1) == [100, 101]
+
+        await client.close()
+
+    asyncio.run(main())
@@ -0,0 +1,105 @@
+import asyncio
+
+import snekcord
+
+
+def test_client_forwards_rest_options():
+    async def main():
+        client = snekcord.Client(
+            'Bot token', rest_options={
+                'max_retries': 2, 'global_limit': 10, 'coalesce_gets': False,
+                'response_cache_ttl': 5
+            }
+        )
+
+        assert client.rest.max_retries == 2
+        assert client.rest.ratelimiter.global_limit == 10
+        assert client.rest.coalesce_gets is False
+        assert client.rest.response_cache.ttl == 5
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+        self.headers = {}
+
+
+def fake_session(monkeypatch, **options):
+    client = snekcord.Client('Bot token', rest_options=options)
+    state = {'version': 0, 'gets': 0}
+    release = asyncio.Event()
+
+    async def _request(method, url, fmt, kwargs):
+        url = url % fmt if fmt is not None else url
+
+        if method == 'GET':
+            state['gets'] += 1
+            version = state['version']
+            if url == '/slow':
+                await release.wait()
+            return FakeResponse(f'{url}:{version}'.encode())
+
+        state['version'] += 1
+        return FakeResponse(b'')
+
+    monkeypatch.setattr(client.rest, '_request', _request)
+    return client, state, release
+
+
+def test_get_overlapping_mutation_is_not_cached_or_joined(monkeypatch):
+    async def main():
+        client, state, release = fake_session(monkeypatch, response_cache_ttl=60)
+        rest = client.rest
+
+        first = asyncio.ensure_future(rest.request('GET', '/slow'))
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        await rest.request('PATCH', '/slow')
+
+        # The GET started before the PATCH returned must not be joined
+        second = asyncio.ensure_future(rest.request('GET', '/slow'))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await first == b'/slow:0'
+        assert await second == b'/slow:1'
+        assert state['gets'] == 2
+
+        # ... nor cached over the fresh response
+        assert await rest.request('GET', '/slow') == b'/slow:1'
+        assert state['gets'] == 2
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_invalidation_matches_path_segments(monkeypatch):
+    async def main():
+        client, state, release = fake_session(monkeypatch, response_cache_ttl=60)
+        rest = client.rest
+
+        await rest.request('GET', '/channels/%s', '1')
+        await rest.request('GET', '/channels/%s/messages', '1')
+        await rest.request('GET', '/channels/%s', '12')
+        assert state['gets'] == 3
+
+        await rest.request('PATCH', '/channels/%s', '1')
+
+        assert await rest.request('GET', '/channels/%s', '12') == b'/channels/12:0'
+        assert state['gets'] == 3
+
+        assert await rest.request('GET', '/channels/%s', '1') == b'/channels/1:1'
+        assert await rest.request('GET', '/channels/%s/messages', '1') == (
+            b'/channels/1/messages:1'
+        )
+        assert state['gets'] == 5
+
+        await client.close()
+
+    asyncio.run(main())
@@ -0,0 +1,166 @@
+import asyncio
+
+import pytest
+
+from snekcord.clients.wsclient import WebSocketClient
+from snekcord.ws import shardws
+from snekcord.ws.shardws import Shard, ShardCloseCode, ShardOpcode, ShardWebSocket
+
+HELLO = '{"op": 10, "s": null, "t": null, "d": {"heartbeat_interval": 41250}}'
+
+
+class FakeTransport:
+    def is_closing(self):
+        return False
+
+
+@pytest.fixture
+def gateway(monkeypatch):
+    state = {'connects': 0, 'sent': [], 'closed': []}
+
+    async def connect(self, url, *args, **kwargs):
+        state['connects'] += 1
+        self.transport = FakeTransport()
+
+    async def close(self, code, *args, **kwargs):
+        state['closed'].append(code)
+
+    async def send_payload(self, payload):
+        state['sent'].append(payload)
+
+    monkeypatch.setattr(ShardWebSocket, 'connect', connect)
+    monkeypatch.setattr(ShardWebSocket, 'close', close, raising=False)
+    monkeypatch.setattr(ShardWebSocket, 'send_payload', send_payload)
+    monkeypatch.setattr(Shard, '_get_reconnect_delay', lambda self: 0)
+    monkeypatch.setattr(shardws.random, 'uniform', lambda a, b: 0)
+
+    return state
+
+
+async def _connected_shard():
+    client = WebSocketClient('Bot token')
+    shard = client.shards[0] = Shard(shard_id=0, client=client)
+    await shard.connect('wss://gateway.test')
+
+    shard.ws.session_id = 'session'
+    shard.ws.sequence = 42
+
+    return client, shard
+
+
+async def _wait_reconnected(shard, old_ws):
+    while shard.ws is old_ws or shard._reconnect_task is None or not shard._reconnect_task.done():
+        await asyncio.sleep(0)
+
+
+@pytest.mark.parametrize('code', [ShardCloseCode.UNKNOWN_ERROR, ShardCloseCode.RATE_LIMITED])
+def test_resumable_close_resumes(gateway, code):
+    async def main():
+        client, shard = await _connected_shard()
+        old_ws = shard.ws
+
+        await old_ws.on_close_received(code, b'')
+        await _wait_reconnected(shard, old_ws)
+
+        assert gateway['connects'] == 2
+        await shard.ws.on_text_received(HELLO)
+
+        payload = gateway['sent'][-1]
+        assert payload['op'] == ShardOpcode.RESUME
+        assert payload['d']['session_id'] == 'session'
+        assert payload['d']['seq'] == 42
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    'code', [ShardCloseCode.INVALID_SEQUENCE, ShardCloseCode.SESSION_TIMED_OUT]
+)
+def test_unresumable_close_identifies(gateway, code):
+    async def main():
+        client, shard = await _connected_shard()
+        old_ws = shard.ws
+
+        await old_ws.on_close_received(code, b'')
+        await _wait_reconnected(shard, old_ws)
+
+        assert shard.ws.session_id is None
+        await shard.ws.on_text_received(HELLO)
+
+        assert gateway['sent'][-1]['op'] == ShardOpcode.IDENTIFY
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_fatal_close_stops_the_shard(gateway):
+    async def main():
+        client, shard = await _connected_shard()
+        waiter = client.register_waiter('shard_closed', timeout=1)
+
+        await shard.ws.on_close_received(ShardCloseCode.AUTHENTICATION_FAILED, b'')
+
+        closed_shard, code = await waiter
+        assert closed_shard is shard
+        assert code == ShardCloseCode.AUTHENTICATION_FAILED
+        assert shard.closed
+        assert shard._reconnect_task is None
+        assert gateway['connects'] == 1
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_reconnect_opcode_keeps_the_session(gateway):
+    async def main():
+        client, shard = await _connected_shard()
+        old_ws = shard.ws
+
+        await old_ws.on_text_received('{"op": 7, "s": null, "t": null, "d": null}')
+        await _wait_reconnected(shard, old_ws)
+
+        # The old connection is closed with a code that keeps it resumable
+        assert gateway['closed'] == [ShardCloseCode.UNKNOWN_ERROR]
+        assert shard.ws.session_id == 'session'
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize('resumable, opcode', [
+    ('true', ShardOpcode.RESUME), ('false', ShardOpcode.IDENTIFY)
+])
+def test_invalid_session(gateway, resumable, opcode):
+    async def main():
+        client, shard = await _connected_shard()
+
+        await shard.ws.on_text_received(f'{{"op": 9, "s": null, "t": null, "d": {resumable}}}')
+
+        assert gateway['sent'][-1]['op'] == opcode
+
+        if opcode == ShardOpcode.IDENTIFY:
+            assert shard.ws.session_id is None
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_resumed_resets_the_backoff(gateway):
+    async def main():
+        client, shard = await _connected_shard()
+        shard.reconnect_attempts = 3
+
+        await shard.ws.on_text_received('{"op": 0, "s": 43, "t": "RESUMED", "d": {}}')
+
+        assert shard.reconnect_attempts == 0
+        assert shard.ws.sequence == 43
+
+        await client.close()
+
+    asyncio.run(main())
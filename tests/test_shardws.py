@@ -0,0 +1,162 @@
+import asyncio
+import json
+import zlib
+
+from snekcord.ws.shardws import (
+    GatewaySendLimiter, IdentifyScheduler, ShardOpcode, ShardWebSocket
+)
+
+
+def test_send_limiter_window():
+    async def main():
+        loop = asyncio.get_running_loop()
+        limiter = GatewaySendLimiter(loop=loop, limit=20, per=0.5, reserved=3)
+        sent = []
+
+        async def send(priority):
+            await limiter.acquire(priority)
+            sent.append(loop.time())
+
+        await asyncio.wait_for(
+            asyncio.gather(*(send(limiter.DEFAULT_PRIORITY) for _ in range(60))), 10
+        )
+
+        assert len(sent) == 60
+
+        # No window may hold more sends than the limit
+        for i, start in enumerate(sent):
+            in_window = sum(1 for t in sent[i:] if t < start + limiter.per)
+            assert in_window <= limiter.limit
+
+    asyncio.run(main())
+
+
+def test_send_limiter_reserves_heartbeats():
+    async def main():
+        limiter = GatewaySendLimiter(loop=asyncio.get_running_loop(), limit=5, per=10, reserved=1)
+
+        for _ in range(4):
+            await limiter.acquire(limiter.DEFAULT_PRIORITY)
+
+        assert limiter.tokens == 1
+
+        await asyncio.wait_for(limiter.acquire(limiter.HEARTBEAT_PRIORITY), 0.1)
+        assert limiter.tokens == 0
+
+    asyncio.run(main())
+
+
+def test_hello_starts_heartbeater_before_identify():
+    async def main():
+        loop = asyncio.get_running_loop()
+        events = []
+        scheduler_released = loop.create_future()
+
+        class BlockingScheduler:
+            async def acquire(self, shard_id):
+                events.append('identify_wait')
+                await scheduler_released
+
+        async def on_hello():
+            events.append('hello')
+
+        ws = ShardWebSocket(
+            0, 1, loop=loop, token='token', intents=None, callbacks={'HELLO': on_hello},
+            identify_scheduler=BlockingScheduler()
+        )
+
+        sent = []
+
+        async def send_payload(payload):
+            sent.append(payload)
+
+        ws.send_payload = send_payload
+
+        hello = '{"op": 10, "s": null, "t": null, "d": {"heartbeat_interval": 41250}}'
+        task = loop.create_task(ws.on_text_received(hello))
+        await asyncio.sleep(0)
+
+        assert events == ['hello', 'identify_wait']
+        assert sent == []
+
+        scheduler_released.set_result(None)
+        await task
+
+        assert sent[0]['op'] == ShardOpcode.IDENTIFY
+
+    asyncio.run(main())
+
+
+def test_identify_scheduler_refills_every_window():
+    async def main():
+        loop = asyncio.get_running_loop()
+
+        scheduler = IdentifyScheduler(loop=loop, total=2, remaining=1, reset_after=0.05)
+        scheduler.IDENTIFY_INTERVAL = 0
+        scheduler.SESSION_START_WINDOW = 0.2
+
+        start = loop.time()
+        times = []
+
+        for _ in range(4):
+            await scheduler.acquire(0)
+            times.append(loop.time() - start)
+
+        # The first window resets after 0.05 seconds, the second one
+        # a window later
+        assert times[0] < 0.05
+        assert 0.05 <= times[1] < 0.25
+        assert times[2] < 0.25
+        assert times[3] >= 0.25
+        assert scheduler.reset_at - start > 0.4
+
+    asyncio.run(main())
+
+
+def test_zlib_stream_inflates_messages_split_across_frames():
+    async def main():
+        loop = asyncio.get_running_loop()
+        received = []
+
+        async def on_dispatch(name, data):
+            received.append(data)
+
+        ws = ShardWebSocket(
+            0, 1, loop=loop, token='token', intents=None, compress=True,
+            callbacks={'DISPATCH': on_dispatch}
+        )
+
+        compressor = zlib.compressobj()
+
+        def compress(index):
+            payload = {'op': 0, 's': index, 't': 'TEST', 'd': {'index': index, 'pad': 'x' * 64}}
+            return (
+                compressor.compress(json.dumps(payload).encode())
+                + compressor.flush(zlib.Z_SYNC_FLUSH)
+            )
+
+        # A message in a single frame
+        await ws.on_binary_received(compress(0))
+
+        # A message split in the middle of its data
+        message = compress(1)
+        await ws.on_binary_received(message[:10])
+        await ws.on_binary_received(message[10:])
+
+        # A message split right before the Z_SYNC_FLUSH suffix
+        message = compress(2)
+        await ws.on_binary_received(message[:-4])
+        await ws.on_binary_received(message[-4:])
+
+        # A message split in the middle of the suffix
+        message = compress(3)
+        await ws.on_binary_received(message[:-2])
+        await ws.on_binary_received(message[-2:])
+
+        # The shared inflater still decodes messages after the split ones
+        await ws.on_binary_received(compress(4))
+
+        assert [data['index'] for data in received] == [0, 1, 2, 3, 4]
+        assert ws.sequence == 4
+
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+import asyncio
+import gzip
+
+from snekcord.clients.wsclient import WebSocketClient
+from snekcord.ws.shardws import ShardCloseCode, ShardOpcode, ShardWebSocket
+
+
+class FakeTransport:
+    def is_closing(self):
+        return False
+
+
+def test_resume_from_snapshot(tmp_path, monkeypatch):
+    path = str(tmp_path / 'snapshot.ndjson.gz')
+    closed = []
+    sent = []
+
+    async def connect(self, url, *args, **kwargs):
+        self.transport = FakeTransport()
+
+    async def close(self, code, *args, **kwargs):
+        closed.append(code)
+
+    async def send_payload(self, payload):
+        sent.append(payload)
+
+    monkeypatch.setattr(ShardWebSocket, 'connect', connect)
+    monkeypatch.setattr(ShardWebSocket, 'close', close, raising=False)
+    monkeypatch.setattr(ShardWebSocket, 'send_payload', send_payload)
+
+    async def save():
+        client = WebSocketClient('Bot token', gateway_url='wss://gateway.test')
+        await client.connect()
+
+        shard = client.shards[0]
+        shard.ws.session_id = 'session'
+        shard.ws.sequence = 42
+
+        await client.save_snapshot(path)
+        await client.close(resumable=True)
+
+    async def load():
+        client = WebSocketClient('Bot token', gateway_url='wss://gateway.test')
+        client.load_snapshot(path)
+        await client.connect()
+
+        hello = '{"op": 10, "s": null, "t": null, "d": {"heartbeat_interval": 41250}}'
+        await client.shards[0].ws.on_text_received(hello)
+        await client.close()
+
+    asyncio.run(save())
+    assert closed == [ShardCloseCode.UNKNOWN_ERROR]
+
+    asyncio.run(load())
+    assert sent[0]['op'] == ShardOpcode.RESUME
+    assert sent[0]['d']['session_id'] == 'session'
+    assert sent[0]['d']['seq'] == 42
+    assert closed[-1] == 1000
+
+
+def test_async_and_sync_snapshots_match(tmp_path):
+    async def main():
+        client = WebSocketClient('Bot token')
+        client.users.upsert({'id': '1', 'username': 'user', 'discriminator': '0001'})
+        client.guilds.upsert({'id': '2', 'name': 'guild'})
+
+        await client.save_snapshot(str(tmp_path / 'async.gz'))
+        client.save_snapshot_sync(str(tmp_path / 'sync.gz'))
+
+        loaded = WebSocketClient('Bot token')
+        loaded.load_snapshot(str(tmp_path / 'async.gz'))
+
+        assert loaded.users.get(1).name == 'user'
+        assert loaded.guilds.get(2).name == 'guild'
+
+        await client.close()
+        await loaded.close()
+
+    asyncio.run(main())
+
+    with gzip.open(tmp_path / 'async.gz') as fp, gzip.open(tmp_path / 'sync.gz') as other:
+        assert fp.read() == other.read()
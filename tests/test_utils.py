@@ -0,0 +1,136 @@
+import pytest
+
+from snekcord.exceptions import PartialObjectError
+from snekcord.utils import JsonArray, JsonCodec, JsonField, JsonObject, Snowflake
+
+
+class Sample(JsonObject):
+    __slots__ = ()
+
+    id = JsonField('id', Snowflake)
+    name = JsonField('name')
+    topic = JsonField('topic', default=None)
+    tags = JsonField('tags', default=list)
+    roles = JsonArray('roles', Snowflake)
+    nested = JsonField('nested', object=JsonObject)
+
+
+def test_field_shapes():
+    sample = Sample.unmarshal({'id': '1', 'name': 'name', 'roles': ['2', '3']})
+
+    assert sample.id == 1 and isinstance(sample.id, Snowflake)
+    assert sample.name == 'name'
+    assert sample.topic is None
+    assert sample.tags == [] and sample.tags is not sample.tags
+    assert sample.roles == [2, 3]
+    assert all(isinstance(role, Snowflake) for role in sample.roles)
+
+
+def test_missing_field_without_default_raises():
+    sample = Sample.unmarshal({})
+
+    with pytest.raises(PartialObjectError):
+        sample.name
+
+    with pytest.raises(PartialObjectError):
+        sample.id
+
+    assert Sample.unmarshal({}).roles == []
+
+
+def test_null_values_are_not_decoded():
+    sample = Sample.unmarshal({'id': None, 'nested': None})
+
+    assert sample.id is None
+    assert sample.nested is None
+
+
+def test_generated_getters_see_updates():
+    sample = Sample.unmarshal({'id': '1', 'name': 'old', 'roles': ['2']})
+
+    assert sample.id == 1
+    assert sample.name == 'old'
+    assert sample.roles == [2]
+
+    sample.update({'id': '4', 'name': 'new', 'roles': ['5', '6']})
+
+    assert sample.id == 4
+    assert sample.name == 'new'
+    assert sample.roles == [5, 6]
+
+
+def test_fields_are_read_only_and_named():
+    sample = Sample.unmarshal({'name': 'name'})
+
+    assert isinstance(Sample.name, JsonField)
+    assert Sample.name.fget.__qualname__ == 'Sample.name'
+
+    with pytest.raises(AttributeError):
+        sample.name = 'other'
+
+    with pytest.raises(AttributeError):
+        del sample.name
+
+
+def test_fields_require_a_json_object():
+    with pytest.raises((TypeError, RuntimeError)):
+        class NotJson:
+            name = JsonField('name')
+
+
+class Counted(JsonObject):
+    __slots__ = ()
+
+    calls = []
+
+    value = JsonField('value', lambda value: Counted.calls.append(value) or value * 2)
+    other = JsonField('other', lambda value: Counted.calls.append(value) or value * 3)
+
+
+def test_decoded_values_are_memoized_until_updated():
+    Counted.calls.clear()
+    sample = Counted.unmarshal({'value': 1, 'other': 1})
+
+    assert sample.value == 2
+    assert sample.value == 2
+    assert Counted.calls == [1]
+
+    assert sample.other == 3
+
+    # Only the updated key is decoded again
+    sample.update({'value': 5})
+    assert sample.value == 10
+    assert sample.other == 3
+    assert Counted.calls == [1, 1, 5]
+
+
+def test_invalidate_drops_direct_writes():
+    Counted.calls.clear()
+    sample = Counted.unmarshal({'value': 1})
+
+    assert sample.value == 2
+
+    sample._json_data_['value'] = 4
+    assert sample.value == 2
+
+    sample._invalidate_('value')
+    assert sample.value == 8
+
+
+@pytest.mark.parametrize('codec', [
+    JsonCodec.from_stdlib(), JsonCodec.default()
+], ids=lambda codec: codec.name)
+def test_json_codec_round_trip(codec):
+    data = {'id': '1', 'list': [1, 2], 'nested': {'ok': True}}
+
+    assert codec.loads(codec.dumps_str(data)) == data
+    assert codec.loads(codec.dumps_bytes(data)) == data
+    assert isinstance(codec.dumps_str(data), str)
+    assert isinstance(codec.dumps_bytes(data), bytes)
+
+
+def test_unmarshal_accepts_encoded_json():
+    sample = Sample.unmarshal(b'{"id": "7", "name": "name"}')
+
+    assert sample.id == 7
+    assert sample.name == 'name'
@@ -0,0 +1,83 @@
+import asyncio
+
+from snekcord.clients import wsevents
+from snekcord.clients.wsclient import WebSocketClient
+
+
+def _count_constructions(monkeypatch):
+    built = []
+    changes = []
+
+    init = wsevents.BaseEvent.__init__
+    get_changes = wsevents._get_changes
+
+    def __init__(self, **kwargs):
+        built.append(self.__class__.__name__)
+        init(self, **kwargs)
+
+    def _get_changes(*args):
+        changes.append(args)
+        return get_changes(*args)
+
+    monkeypatch.setattr(wsevents.BaseEvent, '__init__', __init__)
+    monkeypatch.setattr(wsevents, '_get_changes', _get_changes)
+
+    return built, changes
+
+
+CHANNEL = {'id': '1', 'type': 0, 'guild_id': '2', 'name': 'old'}
+
+
+def test_unobserved_events_update_the_cache_without_constructing(monkeypatch):
+    built, changes = _count_constructions(monkeypatch)
+
+    async def main():
+        client = WebSocketClient('Bot token')
+        client.channels.upsert(CHANNEL)
+
+        await client.dispatch('CHANNEL_UPDATE', None, dict(CHANNEL, name='new'))
+
+        assert client.channels.get(1).name == 'new'
+        assert built == []
+        assert changes == []
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_observed_events_are_constructed(monkeypatch):
+    built, changes = _count_constructions(monkeypatch)
+
+    async def main():
+        client = WebSocketClient('Bot token')
+        client.channels.upsert(CHANNEL)
+
+        waiter = client.register_waiter('channel_update', timeout=1)
+        await client.dispatch('CHANNEL_UPDATE', None, dict(CHANNEL, name='new'))
+        event = await waiter
+
+        assert built == ['ChannelUpdateEvent']
+        assert event.channel is client.channels.get(1)
+        assert event.changes == {'name': 'old'}
+
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_disabled_events_skip_the_cache(monkeypatch):
+    built, changes = _count_constructions(monkeypatch)
+
+    async def main():
+        client = WebSocketClient('Bot token', disabled_events=['CHANNEL_UPDATE'])
+        client.channels.upsert(CHANNEL)
+
+        await client.dispatch('CHANNEL_UPDATE', None, dict(CHANNEL, name='new'))
+
+        assert client.channels.get(1).name == 'old'
+        assert built == []
+
+        await client.close()
+
+    asyncio.run(main())